@@ -0,0 +1,236 @@
+#######################################################################################
+### Module: ArticleParsers
+### Date: 18 Oct 2026
+### Features:  - Extract CreatedDate, Headline, Detail, Category from TheStar and TheEdge pages
+###            - Pluggable backends: 'soup' (BeautifulSoup html.parser, reference)
+###                                  'lxml' (lxml tree + XPath, same output, much faster)
+###            - Module level ParseArticle() usable from worker processes
+#######################################################################################
+
+import re
+import datetime as dt
+from bs4 import BeautifulSoup, UnicodeDammit
+import lxml.html
+from lxml import etree
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+
+_BREAKCODE = '<br>'
+
+## Build Article Dict (Same Layout As NewsDatabase.NEWS_DF Row)
+###############################################################
+def _Article(link, source, createddate, category, headline, detail):
+    return {'Id':          hasher(link).hexdigest(),
+            'CreatedDate': createddate,
+            'Category':    category,
+            'Headline':    headline,
+            'Detail':      detail,
+            'Link':        link,
+            'Source':      source}
+
+#%%Class: SoupParser
+##########################################
+### SoupParser (Reference Implementation)
+##########################################
+class SoupParser:
+
+    ## TheStar: Always Returns Dict, Fields Are None On Error
+    #########################################################
+    def ParseTheStar(self, link, content, output=False):
+        try:
+            soup  = BeautifulSoup(content or b'', 'html.parser')
+            article_date  = re.search( r'(.*), (.*)', soup.find(class_='date').get_text(strip=True))
+            if (soup.find(class_='timestamp') is not None):
+                article_time  = re.search( r'(.*) .*', soup.find(class_='timestamp').get_text(strip=True))
+                article_createddate = dt.datetime.strptime(article_date[2]+' '+article_time[1], '%d %b %Y %I:%M %p')
+            else:
+                if (output): print('Empty time detected, substitue with 7am')
+                article_createddate = dt.datetime.strptime(article_date[2]+' '+'7:00 am', '%d %b %Y %I:%M %p')
+            article_category  = soup.find(class_='kicker').get_text(strip=True)
+            article_headline  = soup.find(class_='headline story-pg').get_text(strip=True)
+            article_detail    = soup.find(id='story-body').get_text(strip=True, separator=_BREAKCODE)
+            sorry = article_detail.find("We're")
+            if (sorry!=-1):  article_detail    = article_detail[ : sorry]  ## sorry detected, get rid of it
+        except Exception as err:
+            if (output): print('    !!! Article Error ... Returning None value.', err)
+            article_createddate = None
+            article_category    = None
+            article_detail      = None
+            article_headline    = None
+        finally:
+            return _Article(link, 'TheStar', article_createddate, article_category, article_headline, article_detail)
+
+    ## TheEdge: Returns Dict, None On Error Or Video Feed
+    #####################################################
+    def ParseTheEdge(self, link, content, output=False):
+        try:
+            soup  = BeautifulSoup(content, 'html.parser')
+            ## get date
+            dt_string = soup.find("meta", property='article:published_time')['content']
+            article_date = dt.datetime.strptime(dt_string, '%Y-%m-%dT%H:%M:%S+08:00')
+            article_headline = soup.find('meta',property='og:title')['content']
+
+            if ('/content/' in link):  ## content type of article
+                article_detail   = soup.find(class_='post-content').get_text(strip=True, separator='<br>')
+                article_category = ""
+
+            elif ('/video-feeds/' in link):   ## Video Feed, Skip
+                return None
+
+            else:
+                article_detail = soup.find(property ='content:encoded').get_text(strip=True, separator='<br>')
+                if (article_detail) :
+                    article_detail = article_detail.get_text(strip=True, separator='<br>')
+                else:
+                    article_detail = soup.find(id='post-content').find(class_='field-items').get_text(strip=True, separator='<br>')
+                article_category = soup.find(class_='post-tags').find_all('a')
+                article_category = ','.join([ cat.get_text(strip=True) for cat in article_category ])
+
+        ## Error, return None
+        except:
+            if 'Article not found' in soup.find('title').get_text():
+                if (output):  print('         ! Article Not Found')
+            else:
+                if (output):  print('         ! Article Has No Content')
+            return None
+
+        ## No Error, return Dict
+        else:
+            return _Article(link, 'TheEdge', article_date, article_category, article_headline, article_detail)
+
+#%%Class: LxmlParser
+##########################################
+### LxmlParser
+##########################################
+## Mirrors SoupParser step by step. Element lookup follows BeautifulSoup find() rules:
+##   class_='x'   : any class token equals x (single token)
+##   class_='x y' : the whole class string equals 'x y', extra classes do not match
+##   text         : strings in document order, excluding comments, script, style, template
+class LxmlParser:
+
+    _SKIP_TAGS = ('script', 'style', 'template')
+    _XPATHS    = {}    ## compiled XPath cache
+
+    ## Decode Like BeautifulSoup (Declared Encoding, Then Detection), Parse Once
+    ###########################################################################
+    def _Document(self, content):
+        markup = UnicodeDammit(content or b'', is_html=True).unicode_markup
+        try:
+            return lxml.html.document_fromstring(markup)
+        except ValueError:
+            ## unicode with xml encoding declaration, let lxml decode the bytes
+            return lxml.html.document_fromstring(content)
+
+    ## First Element Matching BeautifulSoup Style Criteria
+    #####################################################
+    ##   searching from the document includes the <html> element itself, as soup.find() does
+    def _Find(self, element, tag='*', class_=None, id=None, property=None):
+        axis = 'descendant-or-self::' if element.getparent() is None else 'descendant::'
+        key  = (axis, tag, class_, id, property)
+        if key not in self._XPATHS:
+            conditions = []
+            if class_   is not None and ' ' in class_.strip():
+                conditions = conditions + ['normalize-space(@class)="{}"'.format(' '.join(class_.split()))]
+            elif class_ is not None:
+                conditions = conditions + ['contains(concat(" ", normalize-space(@class), " "), " {} ")'.format(class_.strip())]
+            if id       is not None: conditions = conditions + ['@id="{}"'.format(id)]
+            if property is not None: conditions = conditions + ['@property="{}"'.format(property)]
+            self._XPATHS[key] = etree.XPath(axis + tag + ''.join([ '[{}]'.format(x) for x in conditions ]) + '[1]')
+        result = self._XPATHS[key](element)
+        return result[0] if len(result) > 0 else None
+
+    ## Text Strings Of An Element, Document Order
+    #############################################
+    def _Strings(self, element):
+        if element.text: yield element.text
+        for child in element:
+            if isinstance(child.tag, str) and child.tag not in self._SKIP_TAGS:
+                yield from self._Strings(child)
+            if child.tail: yield child.tail
+
+    ## Same As BeautifulSoup get_text(strip=True, separator=...)
+    ############################################################
+    def _GetText(self, element, separator=''):
+        return separator.join([ x for x in [ y.strip() for y in self._Strings(element) ] if x ])
+
+    ## TheStar: Always Returns Dict, Fields Are None On Error
+    #########################################################
+    def ParseTheStar(self, link, content, output=False):
+        try:
+            doc = self._Document(content)
+            article_date = re.search( r'(.*), (.*)', self._GetText(self._Find(doc, class_='date')))
+            timestamp    = self._Find(doc, class_='timestamp')
+            if (timestamp is not None):
+                article_time  = re.search( r'(.*) .*', self._GetText(timestamp))
+                article_createddate = dt.datetime.strptime(article_date[2]+' '+article_time[1], '%d %b %Y %I:%M %p')
+            else:
+                if (output): print('Empty time detected, substitue with 7am')
+                article_createddate = dt.datetime.strptime(article_date[2]+' '+'7:00 am', '%d %b %Y %I:%M %p')
+            article_category  = self._GetText(self._Find(doc, class_='kicker'))
+            article_headline  = self._GetText(self._Find(doc, class_='headline story-pg'))
+            article_detail    = self._GetText(self._Find(doc, id='story-body'), separator=_BREAKCODE)
+            sorry = article_detail.find("We're")
+            if (sorry!=-1):  article_detail    = article_detail[ : sorry]  ## sorry detected, get rid of it
+        except Exception as err:
+            if (output): print('    !!! Article Error ... Returning None value.', err)
+            article_createddate = None
+            article_category    = None
+            article_detail      = None
+            article_headline    = None
+        finally:
+            return _Article(link, 'TheStar', article_createddate, article_category, article_headline, article_detail)
+
+    ## TheEdge: Returns Dict, None On Error Or Video Feed
+    #####################################################
+    def ParseTheEdge(self, link, content, output=False):
+        doc = None
+        try:
+            doc = self._Document(content)
+            ## get date
+            dt_string = self._Find(doc, tag='meta', property='article:published_time').attrib['content']
+            article_date = dt.datetime.strptime(dt_string, '%Y-%m-%dT%H:%M:%S+08:00')
+            article_headline = self._Find(doc, tag='meta', property='og:title').attrib['content']
+
+            if ('/content/' in link):  ## content type of article
+                article_detail   = self._GetText(self._Find(doc, class_='post-content'), separator='<br>')
+                article_category = ""
+
+            elif ('/video-feeds/' in link):   ## Video Feed, Skip
+                return None
+
+            else:
+                ## Same steps as SoupParser, including the second get_text on the extracted string
+                article_detail = self._GetText(self._Find(doc, property='content:encoded'), separator='<br>')
+                if (article_detail) :
+                    article_detail = article_detail.get_text(strip=True, separator='<br>')
+                else:
+                    article_detail = self._GetText(self._Find(self._Find(doc, id='post-content'), class_='field-items'), separator='<br>')
+                article_category = self._Find(doc, class_='post-tags').xpath('.//a')
+                article_category = ','.join([ self._GetText(cat) for cat in article_category ])
+
+        ## Error, return None
+        except:
+            title = self._Find(doc, tag='title') if doc is not None else None
+            if title is not None and 'Article not found' in title.text_content():
+                if (output):  print('         ! Article Not Found')
+            else:
+                if (output):  print('         ! Article Has No Content')
+            return None
+
+        ## No Error, return Dict
+        else:
+            return _Article(link, 'TheEdge', article_date, article_category, article_headline, article_detail)
+
+#%% Parser Registry
+PARSERS = {'soup': SoupParser(), 'lxml': LxmlParser()}
+
+## Parse One Article Page With The Chosen Backend
+#################################################
+##   source: 'TheStar' or 'TheEdge'. Returns article dict, or None
+def ParseArticle(source, link, content, parser='soup', output=False):
+    if source == 'TheStar':
+        return PARSERS[parser].ParseTheStar(link, content, output=output)
+    elif source == 'TheEdge':
+        return PARSERS[parser].ParseTheEdge(link, content, output=output)
+    else:
+        if (output): print('{}: !!! Source Not Recognized'.format(source))
+        return None
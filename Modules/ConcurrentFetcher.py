@@ -0,0 +1,104 @@
+#######################################################################################
+### Module: ConcurrentFetcher
+### Date: 18 Oct 2026
+### Features:  - Run blocking fetch functions (HTTP GET then parse) on a thread pool
+###            - Global concurrency limit (workers) and per host concurrency limit, items of
+###              a host at its limit queued per host, never blocking a pool worker
+###            - Results returned as they complete, with throughput (items/sec) statistics
+###            - Shared pool for callers scheduling their own jobs (Pool, Submit)
+#######################################################################################
+
+import time
+import threading
+from collections import deque
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+
+#%%Class: ConcurrentFetcher
+##########################################
+### ConcurrentFetcher
+##########################################
+class ConcurrentFetcher:
+
+    ## Initialize
+    ##########################################
+    ##   workers    : maximum requests in flight overall
+    ##   host_limit : maximum requests in flight per host (netloc of the url)
+    def __init__(self, workers=8, host_limit=4):
+        self.WORKERS     = workers
+        self.HOST_LIMIT  = host_limit
+        self.COUNT       = 0       ## items completed in last Map
+        self.ELAPSED     = 0.0     ## seconds taken by last Map
+        self._QUEUES     = {}      ## host -> items waiting for the host limit
+        self._RUNNING    = {}      ## host -> items in the pool
+        self._HOSTS_LOCK = threading.Lock()
+
+    ## Thread Pool Sized To The Global Limit, For Callers Scheduling Their Own Jobs
+    ###############################################################################
+    def Pool(self):
+        return ThreadPoolExecutor(max_workers=self.WORKERS)
+
+    ## Submit One Item To A Pool From Pool(), Within Its Host Limit
+    ###############################################################
+    ##   Items of a host at its limit wait in the host queue, not in a pool worker: a busy
+    ##   host never holds workers other hosts could use
+    ##   returns Future of func(item)
+    def Submit(self, pool, func, item, url):
+        host   = urlparse(url).netloc
+        future = Future()
+        with self._HOSTS_LOCK:
+            self._QUEUES.setdefault(host, deque()).append((pool, func, item, future))
+            self._RUNNING.setdefault(host, 0)
+        self._Dispatch(host)
+        return future
+
+    ## Hand Queued Items Of A Host To Their Pool, Up To The Host Limit
+    ###################################################################
+    def _Dispatch(self, host):
+        jobs = []
+        with self._HOSTS_LOCK:
+            while len(self._QUEUES[host]) > 0 and self._RUNNING[host] < self.HOST_LIMIT:
+                job = self._QUEUES[host].popleft()
+                if job[3].set_running_or_notify_cancel():      ## skip items cancelled while queued
+                    self._RUNNING[host] = self._RUNNING[host] + 1
+                    jobs.append(job)
+        for pool, func, item, future in jobs:
+            pool.submit(func, item).add_done_callback(lambda x, host=host, future=future: self._Done(host, x, future))
+
+    ## Item Finished: Next Item Of The Host Dispatched, Then Result Passed On
+    #########################################################################
+    ##   dispatched before the result is set, so a caller leaving the pool after the
+    ##   last result never has items left to submit
+    def _Done(self, host, inner, future):
+        with self._HOSTS_LOCK:
+            self._RUNNING[host] = self._RUNNING[host] - 1
+        self._Dispatch(host)
+        if inner.exception() is not None:
+            future.set_exception(inner.exception())
+        else:
+            future.set_result(inner.result())
+
+    ## Apply func To Every Item Concurrently
+    ########################################
+    ##   url  : function returning the url of an item, used for the per host limit
+    ##   yields (item, result) in completion order
+    ##   items still queued when the caller stops early (or an item raises) are cancelled
+    def Map(self, func, items, url=lambda x: x):
+        self.COUNT   = 0
+        self.ELAPSED = 0.0
+        start_time   = time.time()
+        with self.Pool() as pool:
+            futures = { self.Submit(pool, func, item, url(item)): item for item in items }
+            try:
+                for future in as_completed(futures):
+                    self.COUNT   = self.COUNT + 1
+                    self.ELAPSED = time.time() - start_time
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    ## Throughput Of Last Map (Items Per Second)
+    ############################################
+    def Rate(self):
+        return self.COUNT / self.ELAPSED if self.ELAPSED > 0 else 0.0
@@ -0,0 +1,271 @@
+#######################################################################################
+### Module: DuplicateIndex
+### Date: 18 Oct 2026
+### Features:  - Content fingerprints of news Detail: exact hash of the normalized text
+###              and MinHash signature of its word shingles
+###            - Near-duplicates found with LSH (signature bands), every candidate sharing a band
+###              verified by signature similarity
+###            - Every article assigned a duplicate-cluster id: Id of the first article of the story
+###            - Incremental: every Add() writes a new segment with its band-key table, added
+###              articles probe the stored tables with their own keys only, segments merged occasionally
+###            - Articles added again with a changed Detail are fingerprinted and clustered again
+#######################################################################################
+
+import os
+import time
+import shutil
+import numpy as np
+import configparser as cp
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+from Modules.SeenIndex import ToUint64
+from Modules.TextIndex import Tokenize
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+duplicate_index = config['data']['duplicate_index']
+
+#%%Class: DuplicateIndex
+##########################################
+### DuplicateIndex
+##########################################
+## Signature: _PERMUTATIONS min-hashes of the _SHINGLE word shingles of an article.
+## LSH: signature split into _BANDS bands, articles sharing any band (or the exact hash)
+## are candidates, a candidate is a duplicate when _THRESHOLD of the min-hashes agree.
+## Articles without text are never duplicates. An added article joins the cluster of its
+## earliest verified candidate, clusters of stored articles never change.
+## Each segment keeps its key table: keys (articles x exact hash and band keys) and the
+## sorted order of every key column, searched with the keys of added articles only.
+class DuplicateIndex:
+
+    _ARRAYS         = ['ids', 'exact', 'signatures', 'clusters', 'keys', 'key_order']
+    _PERMUTATIONS   = 64
+    _BANDS          = 16     ## 4 rows per band: candidate threshold about 0.5 similarity
+    _SHINGLE        = 5      ## words per shingle
+    _THRESHOLD      = 0.75   ## share of equal min-hashes to be a near-duplicate
+    _PRIME          = (1 << 31) - 1
+    _MERGE_SEGMENTS = 10     ## segments accumulated before they are merged into one
+
+    ## Initialize
+    ##########################################
+    def __init__(self, path=duplicate_index):
+        self.PATH = path
+        ## Fixed Seed: Signatures Must Be Comparable Across Runs
+        rng = np.random.default_rng(20200430)
+        self._A     = rng.integers(1, self._PRIME, self._PERMUTATIONS, dtype=np.uint64)
+        self._B     = rng.integers(0, self._PRIME, self._PERMUTATIONS, dtype=np.uint64)
+        self._MIX   = rng.integers(1, np.iinfo(np.int64).max, max(self._SHINGLE, self._PERMUTATIONS // self._BANDS), dtype=np.uint64) | np.uint64(1)
+        self.Reload()
+
+    ## Index Has Been Built
+    #######################
+    def Exists(self):
+        return len(self._Segments()) > 0
+
+    ## Segment Folders, Oldest First
+    ################################
+    def _Segments(self):
+        if not os.path.isdir(self.PATH):
+            return []
+        return [ os.path.join(self.PATH, x) for x in sorted(os.listdir(self.PATH)) if x.startswith('seg-') and not x.endswith('.tmp') ]
+
+    ## Load All Segments
+    ####################
+    ##   rows of an Id added again in a later segment are no longer live
+    def Reload(self):
+        self._PARTS = []
+        for folder in self._Segments():
+            self._PARTS.append(self._Part({ x: np.load(os.path.join(folder, x + '.npy')) for x in self._ARRAYS if os.path.isfile(os.path.join(folder, x + '.npy')) }))
+        for i, part in enumerate(self._PARTS[:-1]):
+            later = np.concatenate([ x['ids'] for x in self._PARTS[i+1:] ])
+            part['live'] = ~np.isin(part['ids'], later)
+
+    ## Segment Arrays With Key Table, Id Order And Live Rows
+    ########################################################
+    ##   key table computed when not stored (segments of an older layout)
+    def _Part(self, arrays):
+        if 'keys' not in arrays:
+            arrays['keys']      = np.column_stack([arrays['exact'], self._BandKeys(arrays['signatures'])])
+            arrays['key_order'] = np.argsort(arrays['keys'], axis=0, kind='stable').T.astype(np.int32)
+        arrays['order'] = np.argsort(arrays['ids'], kind='stable')
+        arrays['live']  = np.ones(len(arrays['ids']), dtype=bool)
+        return arrays
+
+    ## Number Of Articles Indexed
+    #############################
+    def __len__(self):
+        return sum([ int(x['live'].sum()) for x in self._PARTS ])
+
+    ## Rows Of Ids In One Segment
+    #############################
+    ##   returns (found mask, row of each found id)
+    def _Find(self, part, ids):
+        if len(part['ids']) == 0:
+            return np.zeros(len(ids), dtype=bool), np.empty(0, dtype=np.int64)
+        pos   = np.minimum(np.searchsorted(part['ids'], ids, sorter=part['order']), len(part['ids']) - 1)
+        found = part['ids'][part['order'][pos]] == ids
+        return found, part['order'][pos[found]]
+
+    ## Normalized Words Of One Text
+    ###############################
+    def _Tokens(self, text):
+        return Tokenize(text)       ## lower case words, punctuation and break code removed
+
+    ## Exact Hash Of Normalized Words, 0 When No Word
+    #################################################
+    def _Exact(self, tokens):
+        return hasher(' '.join(tokens)).intdigest() if len(tokens) > 0 else 0
+
+    ## MinHash Signature Of Normalized Words
+    ########################################
+    ##   no word: signature of all _PRIME (no shingle)
+    def _Signature(self, tokens):
+        if len(tokens) == 0:
+            return np.full(self._PERMUTATIONS, self._PRIME, dtype=np.uint32)
+        words  = np.array([ hasher(x).intdigest() for x in tokens ], dtype=np.uint64)
+        k      = min(self._SHINGLE, len(words))
+        shingles = np.zeros(len(words) - k + 1, dtype=np.uint64)
+        for j in range(k):
+            shingles = shingles + words[j : len(words) - k + 1 + j] * self._MIX[j]   ## wraps modulo 2^64
+        shingles = (shingles >> np.uint64(33)) % np.uint64(self._PRIME)
+        signature = ((shingles[:, None] * self._A[None, :] + self._B[None, :]) % np.uint64(self._PRIME)).min(axis=0)
+        return signature.astype(np.uint32)
+
+    ## Band Keys Of Signatures, One Column Per Band
+    ###############################################
+    def _BandKeys(self, signatures):
+        rows = self._PERMUTATIONS // self._BANDS
+        keys = np.zeros((len(signatures), self._BANDS), dtype=np.uint64)
+        for j in range(rows):
+            keys = keys + signatures[:, j::rows].astype(np.uint64) * self._MIX[j]      ## wraps modulo 2^64
+        return keys
+
+    ## Verified Candidates Of Added Articles In One Segment
+    #######################################################
+    ##   added : part of the added articles, part: segment searched (may be added itself)
+    ##   every live article with text sharing a key column is a candidate, exact hash
+    ##   candidates are duplicates, band candidates when _THRESHOLD of the min-hashes agree
+    ##   returns (row in added, row in part) of every duplicate pair
+    def _Candidates(self, added, part):
+        pairs = []
+        for c in range(self._BANDS + 1):
+            column = part['keys'][:, c]
+            lo     = np.searchsorted(column, added['keys'][:, c], side='left',  sorter=part['key_order'][c])
+            hi     = np.searchsorted(column, added['keys'][:, c], side='right', sorter=part['key_order'][c])
+            counts = np.where(added['exact'] != 0, hi - lo, 0)
+            rows   = np.repeat(np.arange(len(counts)), counts)
+            within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            member = part['key_order'][c][np.repeat(lo, counts) + within].astype(np.int64)
+            keep   = part['live'][member] & (part['exact'][member] != 0)
+            rows, member = rows[keep], member[keep]
+            if c > 0:
+                similar = (added['signatures'][rows] == part['signatures'][member]).mean(axis=1) >= self._THRESHOLD
+                rows, member = rows[similar], member[similar]
+            pairs.append((rows, member))
+        return np.concatenate([ x[0] for x in pairs ]), np.concatenate([ x[1] for x in pairs ])
+
+    ## Cluster Ids Of Articles
+    ##########################
+    ##   ids not indexed are their own cluster
+    ##   returns uint64 array, same order as ids
+    def Clusters(self, ids):
+        ids      = ToUint64(ids)
+        clusters = ids.copy()
+        for part in self._PARTS:                ## later segments override
+            found, rows = self._Find(part, ids)
+            clusters[found] = part['clusters'][rows]
+        return clusters
+
+    ## Fingerprint And Cluster New Articles
+    #######################################
+    ##   ids, details: same order, earlier articles first (the first of a story names its cluster)
+    ##   articles already indexed keep their cluster, unless their Detail changed
+    ##   returns cluster ids of all given ids (uint64)
+    def Add(self, ids, details):
+        ids64   = ToUint64(ids)
+        details = list(details)
+        rows    = np.sort(np.unique(ids64, return_index=True)[1])
+        tokens  = [ self._Tokens(details[i]) for i in rows ]
+        exact   = np.array([ self._Exact(x) for x in tokens ], dtype=np.uint64)
+
+        ## New Ids, Or Stored Ids Whose Text Changed (Latest Stored Row)
+        stored_exact = np.zeros(len(rows), dtype=np.uint64)
+        stored       = np.zeros(len(rows), dtype=bool)
+        for part in self._PARTS:
+            found, part_rows = self._Find(part, ids64[rows])
+            stored_exact[found] = part['exact'][part_rows]
+            stored = stored | found
+        new = ~stored | (stored_exact != exact)
+        if not new.any():
+            return self.Clusters(ids64)
+        rows, exact = rows[new], exact[new]
+        tokens = [ x for x, y in zip(tokens, new) if y ]
+        added  = self._Part({'ids': ids64[rows], 'exact': exact, 'clusters': np.zeros(len(rows), dtype=np.uint64),
+                             'signatures': np.array([ self._Signature(x) for x in tokens ], dtype=np.uint32).reshape(-1, self._PERMUTATIONS)})
+        for part in self._PARTS:
+            found, part_rows = self._Find(part, added['ids'])
+            part['live'][part_rows] = False
+
+        ## Earliest Verified Candidate Of Each Added Article (Position Across All Segments)
+        offsets = np.cumsum([0] + [ len(x['ids']) for x in self._PARTS ])
+        n_old   = offsets[-1]
+        parent  = np.arange(len(rows)) + n_old
+        for part, offset in zip(self._PARTS + [added], offsets):
+            cand_rows, cand_member = self._Candidates(added, part)
+            earlier = offset + cand_member < n_old + cand_rows
+            np.minimum.at(parent, cand_rows[earlier], offset + cand_member[earlier])
+
+        ## Follow Candidates To A Stored Article Or The Earliest Added One, Name The Cluster
+        root = parent.copy()
+        while True:
+            inside    = root >= n_old
+            next_root = root.copy()
+            next_root[inside] = parent[root[inside] - n_old]
+            if (next_root == root).all(): break
+            root = next_root
+        clusters = added['ids'][np.maximum(root - n_old, 0)].copy()
+        for i, part in enumerate(self._PARTS):
+            in_part = (root >= offsets[i]) & (root < offsets[i+1])
+            clusters[in_part] = part['clusters'][root[in_part] - offsets[i]]
+        added['clusters'] = clusters
+
+        self._WriteSegment(added)
+        self._PARTS.append(added)
+        if len(self._Segments()) >= self._MERGE_SEGMENTS:
+            self.Merge()
+        print('DuplicateIndex:  Added Articles: {}, Changed: {}, Duplicates: {}'.format(len(rows), int(stored[new].sum()), int((clusters != added['ids']).sum())))
+        return self.Clusters(ids64)
+
+    ## Rebuild Whole Index
+    ######################
+    def Build(self, ids, details):
+        shutil.rmtree(self.PATH, ignore_errors=True)
+        self.Reload()
+        self.Add(ids, details)
+        clusters = [ x['clusters'][x['live']] for x in self._PARTS ]
+        print('DuplicateIndex:  Built Index - Articles: {}, Clusters: {}'.format(len(self), len(np.unique(np.concatenate(clusters))) if len(clusters) > 0 else 0))
+
+    ## Merge All Segments Into One, Live Rows Only
+    ##############################################
+    def Merge(self):
+        segments = self._Segments()
+        if len(segments) <= 1: return
+        self.Reload()
+        merged = { x: np.concatenate([ part[x][part['live']] for part in self._PARTS ]) for x in ['ids', 'exact', 'signatures', 'clusters'] }
+        self._WriteSegment(self._Part(merged))
+        for folder in segments:
+            shutil.rmtree(folder)
+        self.Reload()
+        print('DuplicateIndex:  Merged Segments: {}, Articles: {}'.format(len(segments), len(self)))
+
+    ## Write Segment Folder, Renamed Into Place Once Complete
+    #########################################################
+    def _WriteSegment(self, arrays):
+        folder = os.path.join(self.PATH, 'seg-{:020d}-{}'.format(time.time_ns(), os.getpid()))
+        os.makedirs(folder + '.tmp', exist_ok=True)
+        for name in self._ARRAYS:
+            np.save(os.path.join(folder + '.tmp', name + '.npy'), arrays[name])
+        os.replace(folder + '.tmp', folder)
+        return folder
@@ -8,12 +8,18 @@
 ###            - Price and Outstanding Stocks are Adjusted
 ###            - Support date range fetch and filter
 ###            - Save to Local Disk
+###            - Financial data as dense date x symbol x field array (PriceArray)
+###            - Cap-weighted / equal-weighted index of any symbol groups (eg. GICS sectors),
+###              cached on disk, keyed on the financial data version
 #######################################################################################
 
+import os
 import pandas as pd
 import datetime as dt
 import configparser as cp
 import eikon as ek
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+from Modules.PriceArray import PriceArray, GroupIndex
 
 #import warnings
 #warnings.simplefilter(action='ignore', category=FutureWarning)
@@ -31,6 +37,7 @@ eod_db_adjusted     = config['data']['eod_db_adjusted']
 eod_db_unadjusted   = config['data']['eod_db_unadjusted']
 corp_act_db         = config['data']['corp_act_db']
 financial_db        = config['data']['financial_db']
+index_cache         = config['data']['index_cache']
 eikon_api           = config['eikon']['api_key']
 
 #%%
@@ -42,6 +49,7 @@ class EikonDatabase():
     FINANCIAL_DF      = pd.DataFrame()
     CORPACT_DF        = pd.DataFrame()
     LISTING_DF        = pd.DataFrame()
+    VERSION           = None    ## financial data version: file size and time when loaded, content hash when refreshed
 
     TR_COLUMNS       = ['COMPANYSHARESOUTSTANDING','PE','PRICETOBVPERSHARE','VOLUME','OPENPRICE','HIGHPRICE','LOWPRICE','CLOSEPRICE']
     CALC_COLUMNS     = ['MARKETCAP']
@@ -61,6 +69,7 @@ class EikonDatabase():
             self.UNIVERSE    = self.FINANCIAL_DF.columns.get_level_values(0).unique().to_list()
             self.CORPACT_DF  = pd.read_csv(corp_act_db, index_col=0, parse_dates=['CACORPACTDATE'])
             self.LISTING_DF  = pd.read_csv(listing_db,  index_col=0)            
+            self.VERSION     = 'file-{}-{}'.format(os.stat(financial_db).st_size, os.stat(financial_db).st_mtime_ns)
             self.ReportDatabaseStatus()
         except:
             print('EikonDatabase:  Unable to Load EOD Data')
@@ -295,6 +304,7 @@ class EikonDatabase():
                 self.FINANCIAL_DF = self.FINANCIAL_DF.drop(columns=remove_symbols, level=0)
                 #df = pd.merge(temp_df, df, how='outer', left_index=True, right_index=True)
             self.FINANCIAL_DF = self.FINANCIAL_DF.merge(df, how='outer',left_index=True, right_index=True)
+        self.VERSION = self._ContentVersion()
             
         ## If Save, update the DataFrame and save to Local File
         ##   Else return as DataFrame
@@ -307,6 +317,16 @@ class EikonDatabase():
         self.ReportFinancialStatus()
         
              
+    ################################################################
+    ###   Version Of FINANCIAL_DF In Memory: Hash Of Its Contents
+    ###     same data gives the same version (and group index cache file)
+    ################################################################
+    def _ContentVersion(self):
+        digest = hasher(repr(self.FINANCIAL_DF.columns.to_list()))
+        digest.update(pd.util.hash_pandas_object(self.FINANCIAL_DF, index=True).values.tobytes())
+        return 'memory-{}'.format(digest.hexdigest())
+    
+    
     ################################################################
     ###   Return Financial By Symbol(s))
     ################################################################
@@ -358,6 +378,78 @@ class EikonDatabase():
                  .reindex(symbols, level=1, axis=1)
     
     
+    ################################################################
+    ###   Return Financial As Dense Array (Dates x Symbols x Columns)
+    ###     missing symbol / column: NaN
+    ################################################################
+    def GetFinancialArray(self,
+                symbols   = [],
+                date_from = '2000-01-01',
+                date_to   = dt.date.today().isoformat(),
+                columns   = []):
+
+        ## Default Symbols And Columns As GetFinancialBySymbols
+        if (not type(symbols)==list): symbols = [symbols]
+        if (not type(columns)==list): columns = [columns]
+        if len(symbols)==0: symbols = self.FINANCIAL_DF.columns.get_level_values(0).unique().to_list()
+        if len(columns)==0: columns = self.ALL_COLUMNS
+
+        ## Only Symbols In Database Are Selected, Others Left As NaN
+        universe = set(self.FINANCIAL_DF.columns.get_level_values(0))
+        known    = [ x for x in symbols if x in universe ]
+        if len(known)==0: return PriceArray([], symbols, columns)
+        df       = self.GetFinancialBySymbols(known, date_from, date_to, columns)
+        return PriceArray().FromFrame(df, symbols, columns)
+    
+    
+    ################################################################
+    ###   Return Symbol Groups From A Listing Column
+    ###     eg. GICSSECTOR: sector name -> RICs of the sector
+    ################################################################
+    def GetListingGroups(self, column='GICSSECTOR'):
+        listing = self.LISTING_DF[self.LISTING_DF[column].notna()]
+        return { str(k): v.index.to_list() for k, v in listing.groupby(column, sort=True) }
+    
+    
+    ################################################################
+    ###   Return Index Price Of Symbol Groups
+    ###     groups    : dict name -> symbols, or a LISTING_DF column (see GetListingGroups)
+    ###     weighting : 'cap' (MARKETCAP weighted) or 'equal'
+    ###     All groups computed in one pass (GroupIndex), cached on disk
+    ###     Cache key: financial data version and all arguments
+    ################################################################
+    def GetGroupIndex(self,
+                groups,
+                columns   = ['OPENPRICE','CLOSEPRICE'],
+                weighting = 'cap',
+                date_from = '2000-01-01',
+                date_to   = dt.date.today().isoformat()):
+        
+        ## Groups From Listing Column
+        if (type(groups)==str): groups = self.GetListingGroups(groups)
+        
+        ## Cached Result Of Same Data Version And Arguments
+        key        = repr((self.VERSION, list(groups.items()), list(columns), weighting, date_from, date_to))
+        cache_file = os.path.join(index_cache, 'index-{}.pkl'.format(hasher(key).hexdigest()))
+        if (self.VERSION is not None and os.path.isfile(cache_file)):
+            print('EikonDatabase:  Group Index Loaded From Cache - Groups: {}'.format(len(groups)))
+            return pd.read_pickle(cache_file)
+        
+        ## Every Member Of Every Group In One Array
+        symbols = list(dict.fromkeys([ x for v in groups.values() for x in v ]))
+        prices  = self.GetFinancialArray(symbols, date_from, date_to, list(dict.fromkeys(list(columns) + ['MARKETCAP'])))
+        df      = GroupIndex(prices, groups, columns, weighting).ToFrame().dropna(how='all')
+        df.columns.names = ['RIC','COLUMN']
+        
+        ## Save To Cache
+        if (self.VERSION is not None):
+            os.makedirs(index_cache, exist_ok=True)
+            df.to_pickle(cache_file + '.tmp')
+            os.replace(cache_file + '.tmp', cache_file)
+        print('EikonDatabase:  Group Index Built - Groups: {}  Weighting: {}'.format(len(groups), weighting))
+        return df
+    
+    
     ################################################################
     ###   Return All Financial Symbols
     ################################################################  
@@ -0,0 +1,144 @@
+#######################################################################################
+### Module: EntityIndex
+### Date: 18 Oct 2026
+### Features:  - Entity tags of the articles of the last phase2 run (EntityMatrix) and the
+###              keywords of every symbol they were tagged with
+###            - Incremental tagging: new articles tagged against the current matcher,
+###              symbols with changed keywords re-tagged for their own column only
+###            - Hash of the tagged text kept per row, articles whose text changed tagged again
+###            - Compiled EntityMatcher cached, keyed on the content hash of its source files
+#######################################################################################
+
+import os
+import json
+import pickle
+import numpy as np
+import configparser as cp
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+from Modules.SeenIndex import ToUint64
+from Modules.EntityMatcher import EntityMatcher
+from Modules.EntityMatrix import EntityMatrix
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+entity_index = config['data']['entity_index']
+
+#%%Class: EntityIndex
+##########################################
+### EntityIndex
+##########################################
+class EntityIndex:
+
+    ## Initialize
+    ##########################################
+    def __init__(self, path=entity_index):
+        self.PATH           = path
+        self._ENTITIES_FILE = os.path.join(path, 'entities.npz')
+        self._KEYWORDS_FILE = os.path.join(path, 'keywords.json')
+        self._HASHES_FILE   = os.path.join(path, 'hashes.npy')
+
+    ## Articles Have Been Tagged
+    ############################
+    def Exists(self):
+        return os.path.isfile(self._ENTITIES_FILE) and os.path.isfile(self._KEYWORDS_FILE)
+
+    ## Stored Tags, The Keywords And The Text Hash Of Every Row They Were Tagged With
+    ##################################################################################
+    ##   returns (EntityMatrix, dict symbol -> keywords, uint64 hash per row), empty when not tagged yet
+    ##   hashes missing (older index): 0, every row tagged again
+    def Load(self):
+        if not self.Exists():
+            return EntityMatrix(), {}, np.empty(0, dtype=np.uint64)
+        with open(self._KEYWORDS_FILE) as f:
+            keywords = json.load(f)
+        entities = EntityMatrix().Load(self._ENTITIES_FILE)
+        hashes   = np.load(self._HASHES_FILE) if os.path.isfile(self._HASHES_FILE) else np.empty(0, dtype=np.uint64)
+        if len(hashes) != len(entities):
+            hashes = np.zeros(len(entities), dtype=np.uint64)
+        return entities, keywords, hashes
+
+    ## Compiled Matcher, Cached By Content Hash Of Its Source Files
+    ###############################################################
+    ##   files : files the keywords are read from (eg. instruments.xlsx)
+    ##   build : function returning dict symbol -> keywords, only called when not cached
+    ##   key   : anything else the keywords depend on (eg. instrument filter)
+    def Matcher(self, files, build, key=''):
+        digest = hasher(key)
+        for file in files:
+            with open(file, 'rb') as f:
+                digest.update(f.read())
+        cache_file = os.path.join(self.PATH, 'matcher-{}.pkl'.format(digest.hexdigest()))
+        if os.path.isfile(cache_file):
+            with open(cache_file, 'rb') as f:
+                matcher = pickle.load(f)
+            print('EntityIndex:  Matcher Loaded From Cache - Symbols: {}'.format(len(matcher.SYMBOLS)))
+            return matcher
+        matcher = EntityMatcher(build())
+        os.makedirs(self.PATH, exist_ok=True)
+        with open(cache_file + '.tmp', 'wb') as f:
+            pickle.dump(matcher, f)
+        os.replace(cache_file + '.tmp', cache_file)
+        print('EntityIndex:  Matcher Compiled And Cached - Symbols: {}'.format(len(matcher.SYMBOLS)))
+        return matcher
+
+    ## Tag Articles, Reusing Stored Tags
+    ####################################
+    ##   texts   : Series of text indexed by Id (eg. news.Detail), missing text (NaN, None) as ''
+    ##   matcher : current EntityMatcher
+    ##   Articles already tagged with the same text keep the tags of symbols whose keywords are
+    ##   unchanged. Symbols with new or changed keywords are re-tagged on those articles, new
+    ##   articles and articles whose text changed are tagged for every symbol. Stored tags are
+    ##   replaced by the result.
+    ##   returns EntityMatrix, rows in the order of texts, columns matcher.SYMBOLS
+    def Update(self, texts, matcher, workers=os.cpu_count(), chunk_size=2000):
+        texts = texts.fillna('')
+        stored, stored_keywords, stored_hashes = self.Load()
+        changed = [ s for s in matcher.SYMBOLS if stored_keywords.get(s) != list(matcher.KEYWORDS[s]) ]
+        kept    = [ s for s in matcher.SYMBOLS if s not in changed ]
+
+        ## Stored Row Of Each Article, -1 When Not Tagged Yet Or Text Changed
+        ids    = ToUint64(texts.index)
+        hashes = np.array([ hasher(x).intdigest() for x in texts ], dtype=np.uint64)
+        order  = np.argsort(stored.IDS, kind='stable')
+        rows   = np.full(len(ids), -1, dtype=np.int64)
+        if len(stored) > 0:
+            pos   = np.minimum(np.searchsorted(stored.IDS, ids, sorter=order), len(stored) - 1)
+            found = stored.IDS[order[pos]] == ids
+            rows[found] = order[pos[found]]
+        changed_text = np.zeros(len(ids), dtype=bool)
+        changed_text[rows >= 0] = stored_hashes[rows[rows >= 0]] != hashes[rows >= 0]
+        rows[changed_text] = -1
+        known = rows >= 0
+
+        ## Known Articles: Kept Symbols From Store, Changed Symbols Re-Tagged
+        old = stored.Rows(rows[known]).Columns(kept)
+        if len(changed) > 0:
+            old = old.Join(EntityMatcher({ s: matcher.KEYWORDS[s] for s in changed }).TagMatrix(texts[known], workers=workers, chunk_size=chunk_size))
+
+        ## New Articles: Every Symbol
+        new = matcher.TagMatrix(texts[~known], workers=workers, chunk_size=chunk_size)
+
+        ## Back In The Order Of texts
+        positions = np.concatenate([np.flatnonzero(known), np.flatnonzero(~known)])
+        entities  = old.Columns(matcher.SYMBOLS).Append(new).Rows(np.argsort(positions, kind='stable'))
+        print('EntityIndex:  Tagged New Articles: {}  Changed Text: {}  Re-Tagged Symbols: {} On Articles: {}  Reused Symbols: {}'.format(
+              int((~known).sum()) - int(changed_text.sum()), int(changed_text.sum()), len(changed), int(known.sum()) if len(changed) > 0 else 0, len(kept)))
+        self._Save(entities, matcher.KEYWORDS, hashes)
+        return entities
+
+    ## Write Tags, Keywords And Text Hashes, Replaced Atomically
+    ############################################################
+    def _Save(self, entities, keywords, hashes):
+        os.makedirs(self.PATH, exist_ok=True)
+        with open(self._ENTITIES_FILE + '.tmp', 'wb') as f:
+            entities.Save(f)
+        with open(self._KEYWORDS_FILE + '.tmp', 'w') as f:
+            json.dump({ s: list(keywords[s]) for s in entities.SYMBOLS }, f)
+        with open(self._HASHES_FILE + '.tmp', 'wb') as f:
+            np.save(f, hashes)
+        os.replace(self._HASHES_FILE + '.tmp', self._HASHES_FILE)
+        os.replace(self._ENTITIES_FILE + '.tmp', self._ENTITIES_FILE)
+        os.replace(self._KEYWORDS_FILE + '.tmp', self._KEYWORDS_FILE)
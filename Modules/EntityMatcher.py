@@ -0,0 +1,205 @@
+#######################################################################################
+### Module: EntityMatcher
+### Date: 18 Oct 2026
+### Features:  - Tag articles with instrument symbols by keyword, all keywords in one automaton
+###            - One pass over every text (Aho-Corasick), instead of one scan per keyword
+###            - Same assignment as str.contains(keyword, regex=False): case sensitive substring
+###            - pyahocorasick when installed, pure Python automaton otherwise
+###            - Parallel tagging in chunks on a process pool
+###            - Sparse result with match counts (EntityMatrix) for a universe of symbols
+###            - Keywords from instruments.xlsx or from the exchange listing (LISTING_DF)
+#######################################################################################
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from Modules.EntityMatrix import EntityMatrix
+
+## Optional: C Implementation Of The Automaton
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+## Instrument Columns Used As Keywords, Besides The KEYWORDS List
+KEYWORD_COLUMNS = ['RIC', 'YAHOO', 'CODE', 'SYMBOL', 'NAME']
+
+## Keywords Of Every Instrument
+###############################
+##   instruments_df: rows of instruments.xlsx
+##   returns dict: RIC -> list of keywords (KEYWORDS comma separated, then KEYWORD_COLUMNS)
+##   empty cells (NaN) give no keyword
+def InstrumentKeywords(instruments_df):
+    keywords = {}
+    for idx, row in instruments_df.iterrows():
+        listed = [ x.strip() for x in row.KEYWORDS.split(',') ] if not pd.isna(row.KEYWORDS) else []
+        keywords[row.RIC] = listed + [ str(row[x]) for x in KEYWORD_COLUMNS if not pd.isna(row[x]) ]
+    return keywords
+
+## Listing Columns Used As Keywords, Besides The RIC
+LISTING_COLUMNS = ['COMMONNAME', 'EXCHANGETICKER']
+
+## Keywords Of Every Listed Symbol
+##################################
+##   listing_df: LISTING_DF of EikonDatabase (listing_db.csv), indexed by RIC
+##   returns dict: RIC -> list of keywords (RIC, then LISTING_COLUMNS that are present)
+def ListingKeywords(listing_df, columns=LISTING_COLUMNS):
+    keywords = {}
+    for ric, row in listing_df.iterrows():
+        keywords[ric] = [ric] + [ str(row[x]).strip() for x in columns if x in row.index and not pd.isna(row[x]) ]
+    return keywords
+
+#%%Class: _Automaton
+##########################################
+### Pure Python Aho-Corasick Automaton
+##########################################
+## Subset of the pyahocorasick.Automaton interface used by EntityMatcher
+class _Automaton:
+
+    ## Initialize
+    ##########################################
+    def __init__(self):
+        self._GOTO   = [{}]      ## node -> {char: node}
+        self._FAIL   = [0]
+        self._OUTPUT = [[]]      ## node -> values of words ending here (incl. via fail links)
+
+    ## Add A Word And Its Value
+    ###########################
+    def add_word(self, word, value):
+        node = 0
+        for char in word:
+            if char not in self._GOTO[node]:
+                self._GOTO.append({})
+                self._FAIL.append(0)
+                self._OUTPUT.append([])
+                self._GOTO[node][char] = len(self._GOTO) - 1
+            node = self._GOTO[node][char]
+        self._OUTPUT[node] = self._OUTPUT[node] + [value]
+        return True
+
+    ## Build Fail Links, Breadth First
+    ##################################
+    def make_automaton(self):
+        queue = deque(self._GOTO[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._GOTO[node].items():
+                queue.append(child)
+                fail = self._FAIL[node]
+                while fail and char not in self._GOTO[fail]:
+                    fail = self._FAIL[fail]
+                self._FAIL[child] = self._GOTO[fail].get(char, 0)
+                self._OUTPUT[child] = self._OUTPUT[child] + self._OUTPUT[self._FAIL[child]]
+
+    ## Every Match: (end index, value)
+    ##################################
+    def iter(self, text):
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in self._GOTO[node]:
+                node = self._FAIL[node]
+            node = self._GOTO[node].get(char, 0)
+            for value in self._OUTPUT[node]:
+                yield i, value
+
+## Matcher Of The Worker Process (See _InitWorker)
+MATCHER = None
+
+## Matcher Of The Worker, Compiled Automaton Passed By The Parent
+##################################################################
+def _InitWorker(matcher):
+    global MATCHER
+    MATCHER = matcher
+
+## Tag One Chunk Of Texts (Runs In Worker Process)
+##################################################
+##   args: (chunk_no, texts)
+def _TagChunk(args):
+    chunk_no, texts = args
+    return (chunk_no,) + MATCHER._Tag(texts)
+
+#%%Class: EntityMatcher
+##########################################
+### EntityMatcher
+##########################################
+## A keyword shared by many symbols is added once, its value lists every symbol.
+## An empty keyword is contained in every text, its symbols match every text.
+## Counts are keyword occurrences per symbol (overlapping occurrences included).
+class EntityMatcher:
+
+    ## Initialize, Compile All Keywords
+    ##########################################
+    ##   keywords: dict symbol -> list of keywords (see InstrumentKeywords)
+    def __init__(self, keywords):
+        self.KEYWORDS   = keywords
+        self.SYMBOLS    = list(keywords.keys())
+        self._MATCH_ALL = np.array([ i for i, s in enumerate(self.SYMBOLS) if '' in keywords[s] ], dtype=np.int64)
+        owners = {}
+        for i, symbol in enumerate(self.SYMBOLS):
+            for kw in dict.fromkeys(keywords[symbol]):
+                if kw != '': owners[kw] = owners.get(kw, []) + [i]
+        self._AUTOMATON = ahocorasick.Automaton() if ahocorasick is not None else _Automaton()
+        for kw, symbols in owners.items():
+            self._AUTOMATON.add_word(kw, tuple(symbols))
+        self._AUTOMATON.make_automaton()
+        self._EMPTY = len(owners) == 0
+
+    ## Symbol Matches Of Texts
+    ##########################
+    ##   returns (rows, symbol positions, counts), one entry per (text, symbol) matched
+    def _Tag(self, texts):
+        rows, cols, counts = [], [], []
+        for row, text in enumerate(texts):
+            if not isinstance(text, str): continue
+            found = {}
+            if not self._EMPTY:
+                for end, symbols in self._AUTOMATON.iter(text):
+                    for s in symbols:
+                        found[s] = found.get(s, 0) + 1
+            for s in self._MATCH_ALL:
+                found[int(s)] = found.get(int(s), 0) + 1
+            rows.extend([row] * len(found))
+            cols.extend(found.keys())
+            counts.extend(found.values())
+        return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), np.array(counts, dtype=np.int64)
+
+    ## Tag Texts With Symbols
+    #########################
+    ##   texts      : Series of text (eg. news.Detail)
+    ##   workers    : processes, 1 runs in this process
+    ##   chunk_size : texts per task
+    ##   returns boolean DataFrame indexed like texts, one column per symbol
+    def Tag(self, texts, workers=os.cpu_count(), chunk_size=2000):
+        rows, cols, counts = self._TagAll(texts, workers, chunk_size)
+        tags = np.zeros((len(texts), len(self.SYMBOLS)), dtype=bool)
+        tags[rows, cols] = True
+        return pd.DataFrame(tags, index=texts.index, columns=self.SYMBOLS)
+
+    ## Tag Texts With Symbols, Sparse Match Counts
+    ###############################################
+    ##   returns EntityMatrix, rows in the order of texts (ids from texts.index)
+    def TagMatrix(self, texts, workers=os.cpu_count(), chunk_size=2000):
+        rows, cols, counts = self._TagAll(texts, workers, chunk_size)
+        matrix = sp.csr_matrix((counts, (rows, cols)), shape=(len(texts), len(self.SYMBOLS)), dtype=np.int32)
+        return EntityMatrix(texts.index, self.SYMBOLS, matrix)
+
+    ## Matches Of All Texts, Chunks Merged In Input Order
+    #####################################################
+    def _TagAll(self, texts, workers, chunk_size):
+        texts  = list(texts)
+        chunks = [ (i, texts[s : s+chunk_size]) for i, s in enumerate(range(0, len(texts), chunk_size)) ]
+        if (workers <= 1 or len(chunks) <= 1):
+            results = [ (i,) + self._Tag(chunk) for i, chunk in chunks ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_InitWorker, initargs=(self,)) as pool:
+                results = list(pool.map(_TagChunk, chunks))
+        results = sorted(results, key=lambda x: x[0])
+        if len(results) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        rows   = np.concatenate([ r[1] + r[0] * chunk_size for r in results ])
+        cols   = np.concatenate([ r[2] for r in results ])
+        counts = np.concatenate([ r[3] for r in results ])
+        return rows, cols, counts
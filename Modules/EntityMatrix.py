@@ -0,0 +1,109 @@
+#######################################################################################
+### Module: EntityMatrix
+### Date: 18 Oct 2026
+### Features:  - Entity assignment of articles as a sparse article x symbol matrix
+###            - Cell holds keyword match count, empty cell: symbol not mentioned
+###            - Saved as one compressed .npz file (CSR arrays, article Ids, symbols)
+###            - Symbol groups (eg. sector index) as extra columns, summed counts
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from Modules.SeenIndex import ToUint64, FromUint64
+
+#%%Class: EntityMatrix
+##########################################
+### EntityMatrix
+##########################################
+class EntityMatrix:
+
+    ## Initialize
+    ##########################################
+    ##   ids     : article Id of every row (hex or uint64)
+    ##   symbols : symbol of every column
+    ##   matrix  : sparse counts (rows x columns), None for empty
+    def __init__(self, ids=[], symbols=[], matrix=None):
+        self.IDS     = ToUint64(ids)
+        self.SYMBOLS = list(symbols)
+        self.MATRIX  = sp.csr_matrix(matrix if matrix is not None else (len(self.IDS), len(self.SYMBOLS)), dtype=np.int32)
+        self._COLUMN = { s: i for i, s in enumerate(self.SYMBOLS) }
+
+    ## Number Of Articles
+    #####################
+    def __len__(self):
+        return len(self.IDS)
+
+    ## Article Ids (Hex)
+    ####################
+    def Ids(self):
+        return pd.Index(FromUint64(self.IDS), name='Id')
+
+    ## Save As One Compressed File
+    ##############################
+    ##   file: path (.npz) or open binary file
+    def Save(self, file):
+        np.savez_compressed(file, data=self.MATRIX.data, indices=self.MATRIX.indices, indptr=self.MATRIX.indptr,
+                            shape=np.array(self.MATRIX.shape), ids=self.IDS, symbols=np.array(self.SYMBOLS, dtype=str))
+        print('EntityMatrix:  Saved Articles: {}  Symbols: {}  Matches: {}'.format(len(self), len(self.SYMBOLS), self.MATRIX.nnz))
+
+    ## Load From File
+    #################
+    def Load(self, file):
+        with np.load(file) as f:
+            self.IDS     = f['ids']
+            self.SYMBOLS = f['symbols'].tolist()
+            self.MATRIX  = sp.csr_matrix((f['data'], f['indices'], f['indptr']), shape=tuple(f['shape']))
+        self._COLUMN = { s: i for i, s in enumerate(self.SYMBOLS) }
+        return self
+
+    ## Match Counts Of One Symbol, Articles Mentioning It Only
+    ##########################################################
+    ##   returns Series indexed by Id (hex)
+    def Column(self, symbol):
+        column = self.MATRIX[:, self._COLUMN[symbol]].tocoo()
+        return pd.Series(column.data, index=pd.Index(FromUint64(self.IDS[column.row]), name='Id'), name=symbol)
+
+    ## Articles Mentioning Any Of The Symbols
+    #########################################
+    ##   returns boolean array, one per row
+    def Any(self, symbols=None):
+        matrix = self.MATRIX if symbols is None else self.MATRIX[:, [ self._COLUMN[s] for s in symbols ]]
+        return np.asarray(matrix.getnnz(axis=1) > 0)
+
+    ## Add Group Column: Sum Of Member Symbol Counts
+    ################################################
+    def AddGroup(self, name, symbols):
+        column = self.MATRIX[:, [ self._COLUMN[s] for s in symbols ]].sum(axis=1)
+        self.MATRIX  = sp.hstack([self.MATRIX, sp.csr_matrix(column, dtype=np.int32)], format='csr')
+        self.SYMBOLS = self.SYMBOLS + [name]
+        self._COLUMN[name] = len(self.SYMBOLS) - 1
+
+    ## Matrix Of Selected Rows
+    ##########################
+    ##   rows : row positions (may repeat), ids: Id of each selected row
+    def Rows(self, rows, ids=None):
+        rows = np.asarray(rows)
+        return EntityMatrix(self.IDS[rows] if ids is None else ids, self.SYMBOLS, self.MATRIX[rows])
+
+    ## Matrix Of Selected Symbols, In The Given Order
+    ################################################
+    def Columns(self, symbols):
+        return EntityMatrix(self.IDS, symbols, self.MATRIX[:, [ self._COLUMN[s] for s in symbols ]])
+
+    ## Matrices With Same Symbols, Rows Stacked
+    ###########################################
+    def Append(self, other):
+        return EntityMatrix(np.concatenate([self.IDS, other.IDS]), self.SYMBOLS, sp.vstack([self.MATRIX, other.Columns(self.SYMBOLS).MATRIX], format='csr'))
+
+    ## Matrices Of Same Rows, Symbols Side By Side
+    ##############################################
+    def Join(self, other):
+        return EntityMatrix(self.IDS, self.SYMBOLS + other.SYMBOLS, sp.hstack([self.MATRIX, other.MATRIX], format='csr'))
+
+    ## Dense Boolean Frame (Few Symbols Only)
+    #########################################
+    def ToFrame(self, symbols=None):
+        symbols = self.SYMBOLS if symbols is None else symbols
+        dense   = self.MATRIX[:, [ self._COLUMN[s] for s in symbols ]].toarray() > 0
+        return pd.DataFrame(dense, index=self.Ids(), columns=symbols)
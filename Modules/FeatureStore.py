@@ -0,0 +1,148 @@
+#######################################################################################
+### Module: FeatureStore
+### Date: 18 Oct 2026
+### Features:  - Stored NLP features of news articles (phase1 output), Parquet
+###            - Each row keyed by article Id, with the feature version and a hash of the text
+###            - Stale(): articles without features of the current version or with changed text
+###            - Append-only segments, merged into one file by Compact()
+###            - Detail features shared by exact duplicates (same Detail text), see DetailSources()
+#######################################################################################
+
+import os
+import time
+import numpy as np
+import pandas as pd
+import configparser as cp
+import pyarrow as pa
+import pyarrow.parquet as pq
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+feature_store = config['data']['feature_store']
+
+## Hash Of Article Text (Headline And Detail), uint64
+#####################################################
+def TextHash(news):
+    return np.array([ hasher('{}\n{}'.format(h, d)).intdigest() for h, d in zip(news.Headline, news.Detail) ], dtype=np.uint64)
+
+## Source Of The Detail Features Of Stale Articles
+###################################################
+##   stale_ids   : Ids of articles to score
+##   detail_hash : hash of the Detail of every article (stale and current), Series indexed by Id
+##   An article with the Detail of a current article (donor) reuses its stored Detail features,
+##   else the first stale article with that Detail is scored (lead) and the others reuse it.
+##   returns (boolean reuse mask over stale_ids, source Id of every reusing article)
+def DetailSources(stale_ids, detail_hash):
+    stale_hash = detail_hash.loc[stale_ids]
+    fresh_hash = detail_hash.drop(index=stale_ids)
+    donors = fresh_hash[~fresh_hash.duplicated()]
+    donors = pd.Series(donors.index, index=donors.values)                      ## detail hash -> donor Id
+    leads  = stale_hash[~stale_hash.duplicated()]
+    leads  = pd.Series(leads.index, index=leads.values)                        ## detail hash -> scored Id
+    reuse  = (stale_hash.isin(donors.index) | stale_hash.duplicated()).values
+    reused = stale_hash[reuse].values
+    source = np.where(pd.Index(reused).isin(donors.index), donors.reindex(reused).values, leads.reindex(reused).values)
+    return reuse, source
+
+## Copy Detail Features To Reusing Articles
+###########################################
+##   df     : features of the stale articles, Detail features of reusing rows not scored
+##   stored : stored features of the current version (donor rows), Detail columns
+##   reuse, source : see DetailSources()
+##   stored rows of stale Ids are outdated and never a source, leads come from df
+def ShareDetailFeatures(df, stored, reuse, source):
+    if not reuse.any(): return df
+    columns = [ x for x in df.columns if x.startswith('Detail_') ]
+    detail  = pd.concat([ stored.loc[~stored.index.isin(df.index), columns], df.loc[~reuse, columns] ])
+    df.loc[reuse, columns] = detail.loc[source].values
+    return df
+
+#%%Class: FeatureStore
+##########################################
+### FeatureStore
+##########################################
+class FeatureStore:
+
+    _BASE_FILE        = 'features.parquet'
+    _SEGMENT_DIR      = '_segments'
+    _KEY_COLUMNS      = ['Id', 'Version', 'TextHash']
+    _COMPACT_SEGMENTS = 20    ## segments accumulated before they are merged into the base file
+
+    ## Initialize
+    ##########################################
+    def __init__(self, path=feature_store):
+        self.PATH = path
+
+    ## Stored Files: Base First, Then Segments Oldest First
+    #######################################################
+    def _Files(self):
+        files = [os.path.join(self.PATH, self._BASE_FILE)] if os.path.isfile(os.path.join(self.PATH, self._BASE_FILE)) else []
+        segment_path = os.path.join(self.PATH, self._SEGMENT_DIR)
+        if os.path.isdir(segment_path):
+            files = files + [ os.path.join(segment_path, x) for x in sorted(os.listdir(segment_path)) if x.endswith('.parquet') ]
+        return files
+
+    ## Read Stored Rows, Latest Row Per Id
+    ######################################
+    def _Read(self, columns=None):
+        files = self._Files()
+        if len(files) == 0:
+            return pd.DataFrame(columns=(columns or self._KEY_COLUMNS)).set_index('Id')
+        df = pa.concat_tables([ pq.read_table(x, columns=columns) for x in files ], promote_options='permissive').to_pandas().set_index('Id')
+        return df[~df.index.duplicated(keep='last')]
+
+    ## Load Features Indexed By Id
+    ##############################
+    ##   version : only rows of this feature version, None for the latest row of every Id
+    ##   columns : feature columns, None for all
+    def Load(self, version=None, columns=None):
+        read_columns = None if columns is None else list(dict.fromkeys(self._KEY_COLUMNS + columns))
+        df = self._Read(read_columns)
+        if version is not None:
+            df = df[df.Version == version]
+        return df.drop(columns=[ x for x in self._KEY_COLUMNS if x in df.columns ])
+
+    ## Articles Needing Features: Not Stored, Other Version, Or Text Changed
+    ########################################################################
+    ##   news: DataFrame indexed by Id with Headline and Detail
+    def Stale(self, news, version):
+        stored = self._Read(self._KEY_COLUMNS).reindex(news.index)
+        fresh  = (stored.Version == version).values & (stored.TextHash.values == TextHash(news))
+        return news[~fresh]
+
+    ## Append Features Of Newly Scored Articles
+    ###########################################
+    ##   df: features indexed by Id, text_hash: TextHash() of the same articles
+    def Append(self, df, text_hash, version):
+        if len(df) == 0: return None
+        df = df.copy()
+        df.insert(0, 'Version',  version)
+        df.insert(1, 'TextHash', np.asarray(text_hash, dtype=np.uint64))
+        table = pa.Table.from_pandas(df.rename_axis('Id').reset_index(), preserve_index=False)
+        segment_path = os.path.join(self.PATH, self._SEGMENT_DIR)
+        os.makedirs(segment_path, exist_ok=True)
+        file = os.path.join(segment_path, 'seg-{:020d}-{}.parquet'.format(time.time_ns(), os.getpid()))
+        pq.write_table(table, file + '.tmp')
+        os.replace(file + '.tmp', file)
+        print('FeatureStore:  Appended Features: {}  Version: {}'.format(len(df), version))
+        if len(self._Files()) > self._COMPACT_SEGMENTS:
+            self.Compact()
+        return file
+
+    ## Merge Segments Into Base File, Latest Row Per Id
+    ###################################################
+    def Compact(self):
+        files = self._Files()
+        if len(files) <= 1: return 0
+        df = self._Read().reset_index()
+        base_file = os.path.join(self.PATH, self._BASE_FILE)
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), base_file + '.tmp')
+        os.replace(base_file + '.tmp', base_file)
+        for file in files:
+            if file != base_file: os.remove(file)
+        print('FeatureStore:  Compacted Files: {}, Articles: {}'.format(len(files), len(df)))
+        return len(files)
@@ -0,0 +1,123 @@
+#######################################################################################
+### Module: GridSearch
+### Date: 18 Oct 2026
+### Features:  - Sentiment direction model (DOWN / STAY / UP) evaluated for every (center, threshold)
+###            - Labels as int8 codes, in the order of sklearn confusion_matrix (alphabetical)
+###            - Confusion matrices of all parameter pairs, symbols and horizons from bincount,
+###              predicted labels never materialized
+###            - Accuracy, precision, recall and F1 of every matrix computed in bulk
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+
+## Label Codes: Index In LABELS, Missing Value: -1
+LABELS  = ['DOWN', 'STAY', 'UP']
+MISSING = -1
+
+## Direction Code Of Every Value
+################################
+##   UP: value > center + th, DOWN: value < center - th, STAY otherwise, NaN: MISSING
+def DirectionCodes(values, th=0.5, center=0):
+    values = np.asarray(values, dtype=np.float64)
+    codes  = np.where(values > center + th, 2, np.where(values < center - th, 0, 1)).astype(np.int8)
+    codes[np.isnan(values)] = MISSING
+    return codes
+
+## Direction Labels Of A DataFrame (Strings, NaN When Missing)
+##############################################################
+def DirectionLabels(df, th=0.5, center=0):
+    labels = np.array(LABELS + [np.nan], dtype=object)[DirectionCodes(df.values, th, center)]
+    return pd.DataFrame(labels, index=df.index, columns=df.columns)
+
+## Confusion Matrices Of Every Parameter Pair
+#############################################
+##   scores : sentiment (dates x symbols), NaN when none
+##   actual : direction codes of returns (dates x symbols x horizons), see DirectionCodes
+##   lower, upper : boundaries of every parameter pair (center - th, center + th)
+##   Predicted DOWN: score < lower, UP: score > upper. For each boundary, the count of
+##   scores on each side is a cumulative bincount over the boundary rank of every score.
+##   returns int64 array (pairs x symbols x horizons x actual x predicted)
+def ConfusionCounts(scores, actual, lower, upper):
+    dates, symbols, horizons = actual.shape
+    lower, upper = np.asarray(lower, dtype=np.float64), np.asarray(upper, dtype=np.float64)
+
+    ## Every Valid (Date, Symbol, Horizon): Group = (Symbol, Horizon, Actual Label)
+    score = np.broadcast_to(np.asarray(scores, dtype=np.float64)[:, :, None], actual.shape)
+    valid = (actual != MISSING) & ~np.isnan(score)
+    sym, hor = np.nonzero(valid)[1:]
+    group = (sym * horizons + hor) * len(LABELS) + actual[valid]
+    score = score[valid]
+    groups = symbols * horizons * len(LABELS)
+
+    ## Scores Below Each Lower Boundary: Rank = Lower Boundaries <= Score
+    lows  = np.unique(lower)
+    rank  = np.searchsorted(lows, score, side='right')
+    below = np.bincount(group * (len(lows) + 1) + rank, minlength=groups * (len(lows) + 1))
+    below = below.reshape(groups, len(lows) + 1).cumsum(axis=1)[:, np.searchsorted(lows, lower)]
+
+    ## Scores Above Each Upper Boundary: Rank = Upper Boundaries < Score
+    highs = np.unique(upper)
+    rank  = np.searchsorted(highs, score, side='left')
+    upto  = np.bincount(group * (len(highs) + 1) + rank, minlength=groups * (len(highs) + 1))
+    upto  = upto.reshape(groups, len(highs) + 1).cumsum(axis=1)
+    total = upto[:, -1:]
+    above = total - upto[:, np.searchsorted(highs, upper)]
+
+    ## Predicted Columns: DOWN, STAY (The Rest), UP
+    counts = np.stack([below, total - below - above, above], axis=-1)            ## groups x pairs x predicted
+    counts = counts.reshape(symbols, horizons, len(LABELS), len(lower), len(LABELS))
+    return counts.transpose(3, 0, 1, 2, 4)
+
+## Metrics Of Confusion Matrices, Rounded To 3 Decimals
+#######################################################
+##   counts: (... x actual x predicted)
+##   returns dict metric -> array (...), NaN when undefined (eg. label never predicted)
+def ConfusionMetrics(counts):
+    r = lambda a, p: counts[..., a, p]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        metrics = {
+            'ACCURACY':       (r(0,0) + r(1,1) + r(2,2)) / counts.sum(axis=(-2, -1)),
+            'DOWN_PRECISION':  r(0,0) / (r(0,0) + r(1,0) + r(2,0)),
+            'DOWN_RECALL':     r(0,0) / (r(0,0) + r(0,1) + r(0,2)),
+            'STAY_PRECISION':  r(1,1) / (r(0,1) + r(1,1) + r(2,1)),
+            'STAY_RECALL':     r(1,1) / (r(1,0) + r(1,1) + r(1,2)),
+            'UP_PRECISION':    r(2,2) / (r(0,2) + r(1,2) + r(2,2)),
+            'UP_RECALL':       r(2,2) / (r(2,0) + r(2,1) + r(2,2)) }
+        for label in ['DOWN', 'STAY', 'UP']:
+            precision, recall = metrics[label + '_PRECISION'], metrics[label + '_RECALL']
+            metrics[label + '_F1'] = 2 * (precision * recall) / (precision + recall)
+    return { k: np.round(v, 3) for k, v in metrics.items() }
+
+## Grid Search Of Every (Center, Threshold), Symbol And Return Horizon
+#######################################################################
+##   sentiment_df : daily score per symbol (phase3)
+##   returns_df   : returns with (symbol, horizon) columns (phase4)
+##   sectors      : dict symbol -> sector, symbols evaluated in this order
+##   returns DataFrame: one row per (param, symbol, horizon) with all metrics defined
+def GridSearch(sentiment_df, returns_df, sectors, return_cols, centers, thresholds, th=0.5):
+    symbols = list(sectors.keys())
+    dates   = returns_df.index.intersection(sentiment_df.index)
+    scores  = sentiment_df.loc[dates, symbols].values
+    actual  = DirectionCodes(returns_df.loc[dates, pd.MultiIndex.from_product([symbols, return_cols])].values, th)
+    actual  = actual.reshape(len(dates), len(symbols), len(return_cols))
+
+    ## Every Parameter Pair, Centers Outer
+    center = np.repeat(centers, len(thresholds))
+    thresh = np.tile(thresholds, len(centers))
+    counts = ConfusionCounts(scores, actual, [ c - t for c, t in zip(center, thresh) ], [ c + t for c, t in zip(center, thresh) ])
+    print('GridSearch:  Parameter Pairs: {}  Symbols: {}  Horizons: {}'.format(len(center), len(symbols), len(return_cols)))
+
+    ## One Row Per (Pair, Symbol, Horizon)
+    rows   = (len(center), len(symbols), len(return_cols))
+    spread = lambda x, axis: np.broadcast_to(np.asarray(x, dtype=object).reshape([ -1 if i == axis else 1 for i in range(3) ]), rows).ravel()
+    result = pd.DataFrame({
+        'PARAM':     spread([ 'C%.2f'%c + '-T%.2f'%t for c, t in zip(center, thresh) ], 0),
+        'CENTER':    spread(center, 0).astype(np.float64),
+        'THRESHOLD': spread(thresh, 0).astype(np.float64),
+        'SYMBOL':    spread(symbols, 1),
+        'SECTOR':    spread([ sectors[s] for s in symbols ], 1),
+        'MODEL':     spread(return_cols, 2) })
+    for metric, values in ConfusionMetrics(counts).items():
+        result[metric] = values.ravel()
+    return result.dropna()
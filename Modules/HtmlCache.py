@@ -0,0 +1,93 @@
+#######################################################################################
+### Module: HtmlCache
+### Date: 18 Oct 2026
+### Features:  - Raw HTML of every fetched page, gzip compressed on local disk
+###            - Keyed by the xxh64 link Id (same Id as NEWS_DF / LINKS_DF)
+###            - File holds link and source in a header line, so pages re-parse without network
+###            - Parallel re-parse of cached pages across processes (ParseCached)
+#######################################################################################
+
+import os
+import gzip
+import configparser as cp
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+from Modules.ArticleParsers import ParseArticle
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+html_cache = config['data']['html_cache']
+
+#%%Class: HtmlCache
+##########################################
+### HtmlCache
+##########################################
+class HtmlCache:
+
+    _SUFFIX = '.html.gz'
+
+    ## Initialize
+    ##########################################
+    def __init__(self, path=html_cache):
+        self.PATH = path
+
+    ## Cache File Of An Id: <path>/<first 2 hex>/<Id>.html.gz
+    ##########################################################
+    def _File(self, idx):
+        return os.path.join(self.PATH, idx[:2], idx + self._SUFFIX)
+
+    ## Store Page Content Of A Link, Returns Id
+    ###########################################
+    def Put(self, link, source, content):
+        idx  = hasher(link).hexdigest()
+        file = self._File(idx)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        with gzip.open(file + '.tmp', 'wb', compresslevel=6) as f:
+            f.write('{}\t{}\n'.format(link, source).encode('utf-8'))
+            f.write(content or b'')
+        os.replace(file + '.tmp', file)
+        return idx
+
+    ## Page Of An Id: (link, source, content), None If Not Cached
+    ##############################################################
+    def Get(self, idx):
+        file = self._File(idx)
+        if not os.path.isfile(file):
+            return None
+        with gzip.open(file, 'rb') as f:
+            header, content = f.read().split(b'\n', 1)
+        link, source = header.decode('utf-8').split('\t')
+        return link, source, content
+
+    ## Page Is Cached
+    #################
+    def Has(self, idx):
+        return os.path.isfile(self._File(idx))
+
+    ## All Cached Ids
+    #################
+    def Ids(self):
+        if not os.path.isdir(self.PATH):
+            return []
+        ids = []
+        for folder in sorted(os.listdir(self.PATH)):
+            if not os.path.isdir(os.path.join(self.PATH, folder)): continue
+            ids = ids + [ x[:-len(self._SUFFIX)] for x in sorted(os.listdir(os.path.join(self.PATH, folder))) if x.endswith(self._SUFFIX) ]
+        return ids
+
+## Parse A Chunk Of Cached Pages (Runs In Worker Process)
+#########################################################
+##   args: (path, ids, parser). Returns list of article dicts (None removed)
+def ParseCached(args):
+    path, ids, parser = args
+    cache    = HtmlCache(path)
+    articles = []
+    for idx in ids:
+        page = cache.Get(idx)
+        if page is None: continue
+        link, source, content = page
+        article = ParseArticle(source, link, content, parser=parser)
+        if article: articles.append(article)
+    return articles
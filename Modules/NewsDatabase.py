@@ -5,18 +5,42 @@
 ###            - Support date range
 ###            - Save to Local Drive (links to scrape and articles scrapped)
 ###            - Auto Load news and links to memory on every initialization of instance
+###            - Columnar news store (NewsStore) when migrated, with projection and date pruning
+###            - Journaled save with NewsStore: append-only segments, background compaction
+###            - Concurrent article fetch with global and per host limits
+###            - Fetched articles committed in batches, resumable checkpoint
+###            - CSV mode batches journaled as news segments, news_db.csv rewritten once per fetch
+###            - Pluggable article parser backend (ArticleParsers: soup, lxml)
+###            - Concurrent search result pagination, stops at empty or already known pages
+###            - Batch link harvesting for many keywords on a shared pool, cross keyword dedup
+###            - Raw HTML cache of fetched articles, offline parallel re-parse (ReparseFromCache)
+###            - Persistent seen-Id indexes (SeenIndex) for link and article dedup
+###            - Full-text term and phrase search over Headline and Detail (TextIndex, SearchNews)
+###            - Date range / sources / columns query (Query), NEWS_DF loading optional
+###            - Near-duplicate detection at ingest (DuplicateIndex), duplicate-cluster id per article
 #######################################################################################
 
+import os
+import time
+import threading
+from concurrent.futures import wait, FIRST_COMPLETED, ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 import configparser as cp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import re
 import datetime as dt
 import random
 from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+from Modules.NewsStore import NewsStore
+from Modules.ConcurrentFetcher import ConcurrentFetcher
+from Modules.ArticleParsers import PARSERS
+from Modules.HtmlCache import HtmlCache, ParseCached
+from Modules.SeenIndex import SeenIndex, ToUint64, FromUint64
+from Modules.DuplicateIndex import DuplicateIndex
+from Modules.TextIndex import TextIndex
 
 ## Reading Directory Path From Config
 config = cp.ConfigParser()
@@ -28,6 +52,9 @@ news_path = config['data']['news_path']
 instruments_file = config['data']['instruments_file']
 links_db         = config['data']['links_db']
 news_db          = config['data']['news_db']
+links_segments   = config['data']['links_segments']
+news_segments    = config['data']['news_segments']
+fetch_checkpoint = config['data']['fetch_checkpoint']
 
 #%%Class: NewsDatabase
 ##########################################
@@ -75,81 +102,509 @@ class NewsDatabase:
     _BACKDAYS = 1
     _NEWS_COLUMNS =  ['Link','Source','CreatedDate','Headline', 'Detail', 'Category' ]
     _LINKS_COLUMNS = ['Link','Source']
+    _COMPACT_SEGMENTS = 20   ## journal segments accumulated before background compaction
+    _TEXT_FIELDS  = ['Headline', 'Detail']   ## columns in the full-text index
+    _SEARCH_HOSTS = {'TheStar': 'https://www.thestar.com.my', 'TheEdge': 'https://www.theedgemarkets.com'}
     
     ## Initialize, Load DataFrame From Storage
     ##########################################
-    def __init__(self):
+    ##   Columnar NewsStore is used once migrated (NewsStore().MigrateFromCsv()), else news_db.csv
+    ##   With NewsStore, saving is journaled: new news and links are appended as segments
+    ##   columns, date_from, date_to : load only part of the news (store prunes partitions)
+    ##   load : False leaves NEWS_DF empty, news are then read slice by slice with Query()
+    ##   parser : article parser backend, 'soup' or 'lxml' (see ArticleParsers)
+    ##   cache_html : keep raw HTML of every fetched article in HtmlCache
+    ##   SEEN_LINKS (every link Id harvested) and SEEN_NEWS (every article Id saved) are
+    ##   built from storage on first use, then updated incrementally on every save
+    def __init__(self, columns=None, date_from=None, date_to=None, parser='soup', cache_html=True, load=True):
         ## Initialize Instance Variable
+        self.STORE      = NewsStore()
+        self.CACHE      = HtmlCache() if cache_html else None
+        self.PARSER     = parser
+        self.SEEN_LINKS = SeenIndex('links')
+        self.SEEN_NEWS  = SeenIndex('news')
+        self.TEXT_INDEX = { x: TextIndex(x) for x in self._TEXT_FIELDS }
+        self.DUPLICATES = DuplicateIndex()
+        self._JOURNAL   = self.STORE.Exists()
+        self._PARTIAL   = (columns is not None) or (date_from is not None) or (date_to is not None) or (not load)
+        self._TIME_INDEX = None  ## (NEWS_DF, row order by CreatedDate, sorted CreatedDate) for Query
+        self._NEW_NEWS  = []    ## DataFrames fetched since last save
+        self._NEW_LINKS = []    ## DataFrames harvested since last save
         try:
-            self.LINKS_DF = pd.read_csv(links_db, index_col='Id')
-            self.NEWS_DF  = pd.read_csv(news_db, index_col='Id')
-            ## manually parse CreateDate column
-            self.NEWS_DF['CreatedDate']= pd.to_datetime(self.NEWS_DF.CreatedDate)
+            if self._JOURNAL:
+                if (load):
+                    self.NEWS_DF = self.STORE.Load(columns=columns, date_from=date_from, date_to=date_to)
+                else:
+                    self.NEWS_DF = pd.DataFrame(columns=self._NEWS_COLUMNS).rename_axis('Id')
+                if not self.SEEN_NEWS.Exists(): self.SEEN_NEWS.Build(self.STORE.Load(columns=[]).index)
+                self.LINKS_DF = self._LoadLinks()
+            elif not load:
+                self.LINKS_DF = pd.read_csv(links_db, index_col='Id')
+                self.NEWS_DF  = pd.DataFrame(columns=self._NEWS_COLUMNS).rename_axis('Id')
+                if not self.SEEN_NEWS.Exists(): self.SEEN_NEWS.Build(pd.concat([ pd.read_csv(x, usecols=['Id']).Id for x in self._NewsCsvFiles() ]))
+            else:
+                self.LINKS_DF = pd.read_csv(links_db, index_col='Id')
+                self.NEWS_DF  = pd.concat([ pd.read_csv(x, index_col='Id') for x in self._NewsCsvFiles() ])
+                ## articles of an interrupted fetch are in news segments, latest wins
+                self.NEWS_DF = self.NEWS_DF[~self.NEWS_DF.index.duplicated(keep='last')]
+                if not self.SEEN_NEWS.Exists(): self.SEEN_NEWS.Build(self.NEWS_DF.index)
+                ## manually parse CreateDate column
+                self.NEWS_DF['CreatedDate']= pd.to_datetime(self.NEWS_DF.CreatedDate)
+                if date_from is not None: self.NEWS_DF = self.NEWS_DF[self.NEWS_DF.CreatedDate >= pd.Timestamp(date_from)]
+                if date_to   is not None: self.NEWS_DF = self.NEWS_DF[self.NEWS_DF.CreatedDate <  pd.Timestamp(date_to) + pd.Timedelta(days=1)]
+                if columns   is not None: self.NEWS_DF = self.NEWS_DF.loc[:, columns]
+            if not self.SEEN_LINKS.Exists():
+                self.SEEN_LINKS.Build(np.concatenate([ToUint64(self.LINKS_DF.index), self.SEEN_NEWS.Values()]))
             print('NewsDatabase:  Initialized - Loaded News:{}, Links:{}'.format(len(self.NEWS_DF), len(self.LINKS_DF)))
         except:           
-            self.NEWS_DF  = pd.DataFrame(columns=self._NEWS_COLUMNS)
-            self.LINKS_DF = pd.DataFrame(columns=self._LINKS_COLUMNS)
+            self.NEWS_DF  = pd.DataFrame(columns=self._NEWS_COLUMNS).rename_axis('Id')
+            self.LINKS_DF = pd.DataFrame(columns=self._LINKS_COLUMNS).rename_axis('Id')
             print('NewsDatabase Initilized: CANNOT LOAD NEWS and LINKS.')
             print('news_db: ', news_db)
-        
+
+    ## Load Links: links_db.csv Plus Journal Segments, Converged With News
+    ######################################################################
+    ##   Files listed and read under the compaction lock, none removed meanwhile
+    def _LoadLinks(self):
+        with NewsStore._COMPACT_LOCK:
+            files = [links_db] if os.path.isfile(links_db) else []
+            files = files + self._LinksSegments()
+            if len(files) == 0:
+                return pd.DataFrame(columns=self._LINKS_COLUMNS).rename_axis('Id')
+            links_df = pd.concat([ pd.read_csv(x, index_col='Id') for x in files ])
+        links_df = links_df[~links_df.index.duplicated(keep='first')]
+        return links_df[~self.SEEN_NEWS.Contains(links_df.index)]
+
+    ## List Links Journal Segments, Oldest First
+    ############################################
+    def _LinksSegments(self):
+        if not os.path.isdir(links_segments):
+            return []
+        return [ os.path.join(links_segments, x) for x in sorted(os.listdir(links_segments)) if x.endswith('.csv') ]
+
+    ## List News Journal Segments Of CSV Mode, Oldest First
+    #######################################################
+    def _NewsSegments(self):
+        if not os.path.isdir(news_segments):
+            return []
+        return [ os.path.join(news_segments, x) for x in sorted(os.listdir(news_segments)) if x.endswith('.csv') ]
+
+    ## News CSV Files: news_db.csv Then Segments Not Merged Yet
+    ############################################################
+    def _NewsCsvFiles(self):
+        return [news_db] + self._NewsSegments()
+
     ## Dedup, Converge Then Save To Local Storage
     #############################################
+    ##   Journal mode: only news and links added since the last save are written
+    ##   returns True when news are saved
+    ##   Seen indexes are flushed only after the data they describe is saved
     def SaveToLocalStorage(self):
         try:
-            ### Dedup Links, Converge with News DataFrame
-            self.LINKS_DF.drop_duplicates(inplace=True)
-            links_selector = ~self.LINKS_DF.index.isin(self.NEWS_DF.index)
-            self.LINKS_DF = self.LINKS_DF[links_selector]
+            if self._JOURNAL:
+                self._SaveJournal()
+                return True
+
+            ### Partially Loaded News Must Not Overwrite The Full News Storage
+            ###   Nothing is written, links and pending news stay in memory
+            if self._PARTIAL:
+                print('NewsDatabase:  Partially Loaded News Is Not Saved')
+                return False
+
+            ### Dedup Links, Converge with News (SEEN_NEWS Holds Every Saved Or Committed Article)
+            self.LINKS_DF = self.LINKS_DF[~self.LINKS_DF.index.duplicated(keep='first')]
+            self.LINKS_DF = self.LINKS_DF[~self.SEEN_NEWS.Contains(self.LINKS_DF.index)]
             
-            ### Then Save To Local Storage
-            self.NEWS_DF.to_csv(news_db)
+            ### Then Save To Local Storage, NEWS_DF Holds Every News Segment
+            segments = self._NewsSegments()
+            self.NEWS_DF.to_csv(news_db + '.tmp')
+            os.replace(news_db + '.tmp', news_db)
+            for file in segments:
+                os.remove(file)
+            self.SEEN_NEWS.Flush()
+            if len(self._NEW_NEWS) > 0: self._IndexText(pd.concat(self._NEW_NEWS))
             self.LINKS_DF.to_csv(links_db)
+            self.SEEN_LINKS.Flush()
+            self._NEW_NEWS  = []
+            self._NEW_LINKS = []
             print('NewsDatabase:  Saved News: {}  and  Links: {}'.format(len(self.NEWS_DF), len(self.LINKS_DF)))
+            return True
 
         except Exception as err:
             print('SaveToLocalStorage Error encountered: ', err)
+            return False
+
+    ## Journal Save: Append New News and Links As Segments
+    ######################################################
+    def _SaveJournal(self):
+        new_news  = pd.concat(self._NEW_NEWS)  if len(self._NEW_NEWS)  > 0 else pd.DataFrame(columns=self._NEWS_COLUMNS)
+        new_links = pd.concat(self._NEW_LINKS) if len(self._NEW_LINKS) > 0 else pd.DataFrame(columns=self._LINKS_COLUMNS)
+        new_news  = new_news [~new_news.index.duplicated(keep='last')]
+        new_links = new_links[~new_links.index.duplicated(keep='first')]
+        new_links = new_links[~self.SEEN_NEWS.Contains(new_links.index)]
+
+        ### News Segment First: A Crash Afterwards Only Leaves Links That Are Already Fetched
+        self.STORE.AppendSegment(new_news)
+        if len(new_links) > 0:
+            os.makedirs(links_segments, exist_ok=True)
+            file = os.path.join(links_segments, 'seg-{:020d}-{}.csv'.format(time.time_ns(), os.getpid()))
+            new_links.rename_axis('Id').to_csv(file + '.tmp')
+            os.replace(file + '.tmp', file)
+        self.SEEN_NEWS.Flush()
+        self.SEEN_LINKS.Flush()
+        self._IndexText(new_news)
+
+        ### Converge In Memory Links With Fetched News
+        if len(new_news) > 0:
+            self.LINKS_DF = self.LINKS_DF.drop(index=new_news.index, errors='ignore')
+        self._NEW_NEWS  = []
+        self._NEW_LINKS = []
+        print('NewsDatabase:  Saved New News: {}  and  New Links: {}'.format(len(new_news), len(new_links)))
+
+        ### Merge Segments In The Background Once Enough Have Accumulated
+        if len(self.STORE.Segments()) + len(self._LinksSegments()) >= self._COMPACT_SEGMENTS:
+            self.CompactStorage(background=True)
+
+    ## Merge Journal Segments Into Main Storage
+    ###########################################
+    ##   News segments are merged into NewsStore partitions. Links segments are merged into
+    ##   links_db.csv, replaced atomically. Segments are removed only after the merge.
+    ##   Both run under the NewsStore compaction lock, skipped when already running
+    def CompactStorage(self, background=False):
+        if background:
+            thread = threading.Thread(target=self.CompactStorage, name='NewsDatabaseCompact')
+            thread.start()
+            return thread
+
+        if not NewsStore._COMPACT_LOCK.acquire(blocking=False):
+            print('NewsDatabase:  Storage Busy, Compaction Skipped')
+            return
+        try:
+            self.STORE.Compact()
+            segments = self._LinksSegments()
+            if len(segments) == 0: return
+            files    = ([links_db] if os.path.isfile(links_db) else []) + segments
+            links_df = pd.concat([ pd.read_csv(x, index_col='Id') for x in files ])
+            links_df = links_df[~links_df.index.duplicated(keep='first')]
+            links_df = links_df[~SeenIndex(self.SEEN_NEWS.NAME, self.SEEN_NEWS.PATH).Contains(links_df.index)]   ## own copy, may run in background
+            links_df.to_csv(links_db + '.tmp')
+            os.replace(links_db + '.tmp', links_db)
+            for file in segments:
+                os.remove(file)
+            print('NewsDatabase:  Compacted Links Segments: {}, Links: {}'.format(len(segments), len(links_df)))
+        finally:
+            NewsStore._COMPACT_LOCK.release()
             
     ## Fetch Articles From Stored Unique Links
     ##########################################
-    def FetchNewsFromLinks(self, limit=10000, output=True):
-        ## Dedup Links
-        self.LINKS_DF.drop_duplicates(inplace=True)
+    ##   workers    : >1 fetches concurrently on a thread pool (ConcurrentFetcher)
+    ##   host_limit : maximum concurrent requests per host when workers > 1
+    ##   batch_size : articles are committed (saved) every batch_size fetched links
+    ##   resume     : skip links committed by a previous interrupted run (fetch_checkpoint)
+    ##   Fetched articles join NEWS_DF when fully loaded, else they are read with Query()
+    def FetchNewsFromLinks(self, limit=10000, output=True, workers=1, host_limit=4, batch_size=500, resume=True):
+        self._CheckSavable('FetchNewsFromLinks')
+
+        ## Dedup Links, Drop Links Of Articles Already Saved
+        self.LINKS_DF = self.LINKS_DF[~self.LINKS_DF.index.duplicated(keep='first')]
+        self.LINKS_DF = self.LINKS_DF[~self.SEEN_NEWS.Contains(self.LINKS_DF.index)]
         print('NewsDatabase:  Total Unique Links To Fetch: {}'.format(len(self.LINKS_DF)))
         
         ## Exit if No New Links Are Found
         if (self.LINKS_DF.empty): 
             print('NewsDatabase: No Links To Fetch Article')
             return
+
+        ## Skip Links Already Committed By An Interrupted Run
+        links = self.LINKS_DF
+        if (resume):
+            committed = self._ReadCheckpoint()
+            if len(committed) > 0:
+                links = links[~links.index.isin(committed)]
+                print('NewsDatabase:  Resuming - Skipped Committed Links: {}'.format(len(self.LINKS_DF) - len(links)))
             
-        ## Loop Through LINKS_DF (Up to limit specified) to Fetch Articles
-        articles = []
-        i = 0
-        for idx, row in self.LINKS_DF.iloc[:limit, ].iterrows():
-            if (output): print('{}: Fetching Article:  {}/{}/{}  :- {}'.format(row.Source, i+1, limit, len(self.LINKS_DF), row.Link ))
-            if row.Source == 'TheStar':
-                articles = articles + [self.TheStarFetchArticleFromLink(row.Link, output=True)]
-            elif row.Source == 'TheEdge':
-                articles = articles + [self.TheEdgeFetchArticleFromLink(row.Link, output=True)]
-            else:
-                print('{}: !!! Source Not Recognized'.format(row.Source))
-            i = i + 1
-        
-        ## Remove None records from articles (these are Error Records), Exit if No articles found
+        ## Loop Through LINKS_DF (Up to limit specified) to Fetch Articles, Commit Every batch_size
+        links      = list(links.iloc[:limit, ].itertuples())
+        batch      = []
+        frames     = []    ## articles committed in this run, one frame per batch
+        fetched    = 0
+        start_time = time.time()
+        if (workers > 1):
+            fetcher = ConcurrentFetcher(workers=workers, host_limit=host_limit)
+            results = fetcher.Map(lambda row: self._FetchArticle(row, output), links, url=lambda row: row.Link)
+        else:
+            results = ( (row, self._FetchArticle(row, output)) for row in links )
+        for row, article in results:
+            fetched = fetched + 1
+            if (output): print('{}: Fetched Article:  {}/{}/{}  :- {}'.format(row.Source, fetched, limit, len(self.LINKS_DF), row.Link ))
+            batch.append(article)
+            if len(batch) >= batch_size:
+                frames.append(self._CommitArticles(batch))
+                batch = []
+        frames.append(self._CommitArticles(batch))
+        frames    = [ x for x in frames if x is not None ]
+        committed = sum([ len(x) for x in frames ])
+        elapsed = time.time() - start_time
+        print('NewsDatabase:  Fetched {} Links In {:.1f}s ({:.2f} articles/sec)'.format(fetched, elapsed, fetched/elapsed if elapsed > 0 else 0.0))
+
+        ## Committed Batches Added To NEWS_DF Once (Each Batch Already Saved When Committed)
+        if not self._PARTIAL and committed > 0:
+            self.NEWS_DF = pd.concat([self.NEWS_DF] + frames)
+
+        ## CSV Mode Journaled Each Batch As News Segment: Rewrite news_db.csv Once At The End
+        if not self._JOURNAL and committed > 0:
+            self.SaveToLocalStorage()
+
+        ## All Links Processed, Checkpoint No Longer Needed
+        if os.path.isfile(fetch_checkpoint):
+            os.remove(fetch_checkpoint)
+        if committed == 0:
+            print('NewsDatabase:  No Articles To Fetch')
+
+    ## Fetched Data Can Be Saved: CSV Storage Needs Fully Loaded News
+    ##################################################################
+    ##   news_db.csv and links_db.csv are rewritten whole, a partially loaded instance
+    ##   (columns, date range or load=False) would lose what it fetched
+    def _CheckSavable(self, action):
+        if not self._JOURNAL and self._PARTIAL:
+            raise RuntimeError('NewsDatabase:  {} Needs Fully Loaded News With CSV Storage (Or Migrate To NewsStore)'.format(action))
+
+    ## Commit One Batch Of Fetched Articles
+    #######################################
+    ##   Save the valid articles, then record their Ids in the checkpoint
+    ##   Journal mode: batch appended as NewsStore segment. CSV mode: batch appended as news
+    ##   segment, merged into news_db.csv by the next SaveToLocalStorage (end of fetch)
+    ##   returns DataFrame of the articles committed, None when none (caller adds them to NEWS_DF)
+    def _CommitArticles(self, articles):
+        ## Remove None records from articles (these are Error Records)
         articles = [i for i in articles if i] 
         if (len(articles)==0): 
-            print('NewsDatabase:  No Links To Fetch Article')
-            return
-        
-        ## Append To NEWS_DF DataFrame
+            return None
         temp_df  = pd.DataFrame(data=articles).set_index('Id').dropna(axis=0)
-        self.NEWS_DF = self.NEWS_DF.append(temp_df)
-        
-        ## Report Result, Then Save
-        if(len(temp_df)>0):
-            print(':  Valid/Invalid Articles Fetched: {} / {}, Date: {} - {}'.format( len(temp_df), len(articles) - len(temp_df), temp_df.CreatedDate.min().strftime('%Y-%m-%d'), temp_df.CreatedDate.max().strftime('%Y-%m-%d') ))
-            self.SaveToLocalStorage()
+        if (len(temp_df)==0):
+            return None
+        print(':  Valid/Invalid Articles Fetched: {} / {}, Date: {} - {}'.format( len(temp_df), len(articles) - len(temp_df), temp_df.CreatedDate.min().strftime('%Y-%m-%d'), temp_df.CreatedDate.max().strftime('%Y-%m-%d') ))
+
+        self.SEEN_NEWS.Add(temp_df.index)
+        self.SEEN_LINKS.Add(temp_df.index)
+        if self._JOURNAL:
+            self._NEW_NEWS.append(temp_df)
+            saved = self.SaveToLocalStorage()
         else:
-            print('NewsDatabase:  No Articles To Fetch')
+            saved = self._SaveNewsSegment(temp_df)
+        if saved:
+            with open(fetch_checkpoint, 'a') as f:
+                f.write(''.join([ x+'\n' for x in temp_df.index ]))
+        return temp_df
+
+    ## CSV Mode: Append One Batch As News Segment
+    ##############################################
+    ##   Cost depends on the batch only. Segment file appears atomically, loaded with
+    ##   news_db.csv until SaveToLocalStorage merges it.
+    ##   returns True when saved
+    def _SaveNewsSegment(self, news_df):
+        try:
+            os.makedirs(news_segments, exist_ok=True)
+            file = os.path.join(news_segments, 'seg-{:020d}-{}.csv'.format(time.time_ns(), os.getpid()))
+            news_df.reindex(columns=self._NEWS_COLUMNS).rename_axis('Id').to_csv(file + '.tmp')
+            os.replace(file + '.tmp', file)
+            self.SEEN_NEWS.Flush()
+            self._IndexText(news_df)
+            print('NewsDatabase:  Saved News Segment: {}'.format(len(news_df)))
+            return True
+        except Exception as err:
+            print('SaveNewsSegment Error encountered: ', err)
+            return False
+
+    ## Read Link Ids Committed By Previous Run
+    ##########################################
+    def _ReadCheckpoint(self):
+        if not os.path.isfile(fetch_checkpoint):
+            return set()
+        with open(fetch_checkpoint) as f:
+            return set([ x.strip() for x in f if x.strip() ])
+
+    ## Rebuild News From Raw HTML Cache, No Network
+    ###############################################
+    ##   Cached pages are parsed in `workers` processes, chunk_size pages per task.
+    ##   Re-parsed articles replace existing ones with the same Id, then all news are saved.
+    def ReparseFromCache(self, workers=os.cpu_count(), parser='lxml', chunk_size=500, save=True):
+        if self._PARTIAL:
+            print('NewsDatabase:  Reparse Needs Fully Loaded News')
+            return
+        ids = self.CACHE.Ids() if self.CACHE is not None else []
+        print('NewsDatabase:  Reparsing Cached Pages: {}  Workers: {}  Parser: {}'.format(len(ids), workers, parser))
+        start_time = time.time()
+        chunks     = [ (self.CACHE.PATH, ids[i : i+chunk_size], parser) for i in range(0, len(ids), chunk_size) ]
+        articles   = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for i, result in enumerate(pool.map(ParseCached, chunks)):
+                articles.extend(result)
+                print('\r>> chunks: {}/{} '.format(i+1, len(chunks)), end='', flush=True)
+        elapsed = time.time() - start_time
+        print('\nNewsDatabase:  Reparsed {} Pages In {:.1f}s ({:.2f} pages/sec)'.format(len(ids), elapsed, len(ids)/elapsed if elapsed > 0 else 0.0))
+        if len(articles) == 0: return
+
+        ## Replace Re-parsed Articles In NEWS_DF
+        temp_df = pd.DataFrame(data=articles).set_index('Id').dropna(axis=0)
+        self.NEWS_DF = pd.concat([self.NEWS_DF[~self.NEWS_DF.index.isin(temp_df.index)], temp_df])
+        self.SEEN_NEWS.Add(temp_df.index)
+        print('NewsDatabase:  Valid Articles Reparsed: {}, Total News: {}'.format(len(temp_df), len(self.NEWS_DF)))
+        if (save):
+            if self._JOURNAL:
+                self.STORE.Replace(self.NEWS_DF)
+                self.SEEN_NEWS.Flush()
+            else:
+                self.SaveToLocalStorage()
+            self._IndexText(temp_df)
+
+    ## Query News By Date Range, Sources And Columns
+    ################################################
+    ##   date_from : inclusive, date_to: inclusive (whole day when date only)
+    ##   sources   : eg. ['TheStar'], None for all.  columns: None for all
+    ##   NewsStore: only partitions of the range and sources are read, row groups outside
+    ##   the range skipped (partitions sorted by CreatedDate), only requested columns read
+    ##   CSV with NEWS_DF loaded: sliced from NEWS_DF via a sorted time index
+    ##   CSV otherwise: news_db.csv scanned in chunks, memory bounded by the slice
+    ##   returns DataFrame indexed by Id, sorted by CreatedDate
+    def Query(self, date_from=None, date_to=None, sources=None, columns=None):
+        if (sources is not None and not type(sources)==list): sources = [sources]
+        if (columns is not None and not type(columns)==list): columns = [columns]
+        if self._JOURNAL:
+            df = self.STORE.Load(columns=columns, date_from=date_from, date_to=date_to, sources=sources)
+            return df.sort_values('CreatedDate', kind='stable') if 'CreatedDate' in df.columns else df
+
+        ## Range Boundaries As Timestamps, date_to Inclusive
+        date_from = pd.Timestamp(date_from) if date_from is not None else None
+        if date_to is not None:
+            date_to = pd.Timestamp(date_to)
+            if date_to == date_to.normalize(): date_to = date_to + pd.Timedelta(days=1) - pd.Timedelta(1)
+
+        if self._PARTIAL:
+            read_columns = None if columns is None else list(dict.fromkeys(['Id','CreatedDate','Source'] + columns))
+            chunks = []
+            for chunk in [ x for f in self._NewsCsvFiles() for x in pd.read_csv(f, index_col='Id', usecols=read_columns, chunksize=NewsStore._CSV_CHUNKSIZE) ]:
+                chunk['CreatedDate'] = pd.to_datetime(chunk.CreatedDate)
+                mask = pd.Series(True, index=chunk.index)
+                if date_from is not None: mask = mask & (chunk.CreatedDate >= date_from)
+                if date_to   is not None: mask = mask & (chunk.CreatedDate <= date_to)
+                if sources   is not None: mask = mask & chunk.Source.isin(sources)
+                chunks = chunks + [chunk[mask]]
+            df = pd.concat(chunks) if len(chunks) > 0 else self.NEWS_DF
+            df = df[~df.index.duplicated(keep='last')].sort_values('CreatedDate', kind='stable')
+        else:
+            ## Sorted Time Index: Range Located By Binary Search
+            order, dates = self._TimeIndex()
+            start = np.searchsorted(dates, date_from.to_datetime64(), side='left')  if date_from is not None else 0
+            if date_to is not None:
+                end = np.searchsorted(dates, date_to.to_datetime64(), side='right')
+            elif date_from is not None:
+                end = np.searchsorted(dates, np.datetime64('NaT'), side='left')   ## undated excluded from a range
+            else:
+                end = len(dates)
+            df = self.NEWS_DF.iloc[order[start:end]]
+            if sources is not None: df = df[df.Source.isin(sources)]
+        return df if columns is None else df.loc[:, columns]
+
+    ## Memory Used By NEWS_DF Per Column (MB)
+    #########################################
+    def MemoryUsage(self, output=True):
+        usage = self.NEWS_DF.memory_usage(deep=True) / 1e6
+        if (output):
+            for col, mb in usage.items():
+                print('    {:<12} {:>10.1f} MB  {}'.format(col, mb, self.NEWS_DF.index.dtype if col=='Index' else self.NEWS_DF[col].dtype))
+            print('NewsDatabase:  NEWS_DF Memory: {:.1f} MB, News: {}'.format(usage.sum(), len(self.NEWS_DF)))
+        return usage
+
+    ## Row Order Of NEWS_DF By CreatedDate, Rebuilt When NEWS_DF Is Replaced
+    ########################################################################
+    ##   NaT sorted last
+    def _TimeIndex(self):
+        if self._TIME_INDEX is None or self._TIME_INDEX[0] is not self.NEWS_DF:
+            dates = pd.to_datetime(self.NEWS_DF.CreatedDate).values
+            order = np.argsort(dates, kind='stable')
+            self._TIME_INDEX = (self.NEWS_DF, order, dates[order])
+        return self._TIME_INDEX[1], self._TIME_INDEX[2]
+
+    ## Search Articles By Term Or Phrase (Full-Text Index)
+    ######################################################
+    ##   query  : words, more than one word matched as a phrase (case insensitive)
+    ##            list of queries returns articles matching any of them
+    ##   fields : text columns searched
+    ##   date_from, date_to : inclusive CreatedDate range
+    ##   returns Index of matching Ids, index built from storage on first search
+    def SearchNews(self, query, fields=_TEXT_FIELDS, date_from=None, date_to=None):
+        if (not type(query)==list):  query  = [query]
+        if (not type(fields)==list): fields = [fields]
+        if not all([ self.TEXT_INDEX[x].Exists() for x in fields ]):
+            self.BuildTextIndex()
+        ids = [ self.TEXT_INDEX[f].Search(q, date_from=date_from, date_to=date_to) for f in fields for q in query ]
+        return pd.Index(np.unique(np.concatenate(ids)) if len(ids) > 0 else [], name='Id')
+
+    ## Build Full-Text Index From All Saved News
+    ############################################
+    def BuildTextIndex(self):
+        columns = ['CreatedDate'] + self._TEXT_FIELDS
+        if self._PARTIAL:
+            if self._JOURNAL:
+                news_df = self.STORE.Load(columns=columns)
+            else:
+                news_df = pd.concat([ pd.read_csv(x, index_col='Id', usecols=['Id'] + columns) for x in self._NewsCsvFiles() ])
+                news_df = news_df[~news_df.index.duplicated(keep='last')]
+        else:
+            news_df = self.NEWS_DF.loc[:, columns]
+        for field in self._TEXT_FIELDS:
+            self.TEXT_INDEX[field].Build(news_df)
+
+    ## Add Saved Articles To Full-Text And Duplicate Indexes (Once Built)
+    #######################################################################
+    def _IndexText(self, news_df):
+        if len(news_df) == 0: return
+        for field in self._TEXT_FIELDS:
+            if self.TEXT_INDEX[field].Exists():
+                self.TEXT_INDEX[field].Add(news_df)
+        if self.DUPLICATES.Exists():
+            news_df = news_df.sort_values('CreatedDate', kind='stable')
+            self.DUPLICATES.Add(news_df.index, news_df.Detail)
+
+    ## Duplicate-Cluster Id Of Articles
+    ###################################
+    ##   ids : article Ids (hex or uint64), None for every article of NEWS_DF
+    ##   cluster id is the Id of the earliest article of the story (own Id when unique)
+    ##   returns Series named Cluster indexed by ids, index built from storage on first use
+    def DuplicateClusters(self, ids=None):
+        if ids is None: ids = self.NEWS_DF.index
+        if not self.DUPLICATES.Exists():
+            self.BuildDuplicateIndex()
+        clusters = self.DUPLICATES.Clusters(ids)
+        return pd.Series(FromUint64(clusters), index=ids, name='Cluster')
+
+    ## Build Duplicate Index From All Saved News, Earliest First
+    ############################################################
+    def BuildDuplicateIndex(self):
+        columns = ['CreatedDate', 'Detail']
+        if self._PARTIAL:
+            if self._JOURNAL:
+                news_df = self.STORE.Load(columns=columns)
+            else:
+                news_df = pd.concat([ pd.read_csv(x, index_col='Id', usecols=['Id'] + columns, parse_dates=['CreatedDate']) for x in self._NewsCsvFiles() ])
+                news_df = news_df[~news_df.index.duplicated(keep='last')]
+        else:
+            news_df = self.NEWS_DF.loc[:, columns]
+        news_df = news_df.sort_values('CreatedDate', kind='stable')
+        self.DUPLICATES.Build(news_df.index, news_df.Detail)
+
+    ## Fetch One Article, Dispatch To Source Parser
+    ###############################################
+    ##   row: LINKS_DF row (itertuples) with Link and Source
+    def _FetchArticle(self, row, output=True):
+        if row.Source == 'TheStar':
+            return self.TheStarFetchArticleFromLink(row.Link, output=output)
+        elif row.Source == 'TheEdge':
+            return self.TheEdgeFetchArticleFromLink(row.Link, output=output)
+        else:
+            print('{}: !!! Source Not Recognized'.format(row.Source))
+            return None
 
     ## TheStar Fetch Article Detail From Given Link
     ###############################################
@@ -157,78 +612,33 @@ class NewsDatabase:
         try:
             user_agent = {'User-Agent': random.choice(self._USER_AGENTS)}
             page  = self._REQUEST.get(link, headers=user_agent,  timeout=self._TIMEOUT)  ## connect, read timeout
-            soup  = BeautifulSoup(page.content, 'html.parser')
-            article_date  = re.search( r'(.*), (.*)', soup.find(class_='date').get_text(strip=True))
-            if (soup.find(class_='timestamp') is not None):
-                article_time  = re.search( r'(.*) .*', soup.find(class_='timestamp').get_text(strip=True))
-                article_createddate = dt.datetime.strptime(article_date[2]+' '+article_time[1], '%d %b %Y %I:%M %p')
-            else:           
-                if (output): print('Empty time detected, substitue with 7am')
-                article_createddate = dt.datetime.strptime(article_date[2]+' '+'7:00 am', '%d %b %Y %I:%M %p')
-            article_category  = soup.find(class_='kicker').get_text(strip=True)
-            article_headline  = soup.find(class_='headline story-pg').get_text(strip=True)
-            article_detail    = soup.find(id='story-body').get_text(strip=True, separator=self._BREAKCODE)
-            sorry = article_detail.find("We're")
-            if (sorry!=-1):  article_detail    = article_detail[ : sorry]  ## sorry detected, get rid of it
+            content = page.content
+            if self.CACHE is not None: self.CACHE.Put(link, 'TheStar', content)
         except Exception as err:
             if (output): print('    !!! Article Error ... Returning None value.', err)
-            article_createddate = None
-            article_category    = None
-            article_detail      = None
-            article_headline    = None
-        finally:
-            return {'Id':          hasher(link).hexdigest(),
-                    'CreatedDate': article_createddate,
-                    'Category':    article_category,
-                    'Headline':    article_headline,
-                    'Detail':      article_detail,
-                    'Link':        link,
-                    'Source':      'TheStar'}
+            content = None
+        return self.TheStarParseArticle(link, content, output=output and content is not None)
+
+    ## TheStar Parse Article Detail From Page Content
+    #################################################
+    def TheStarParseArticle(self, link, content, output=False):
+        return PARSERS[self.PARSER].ParseTheStar(link, content, output=output)
 
     ## TheEdge Fetch Article Detail From Given Link
     ###############################################
     def TheEdgeFetchArticleFromLink(self, link=None, output=False):
         try:
             page  = self._REQUEST.get(link, timeout=self._TIMEOUT)
-            soup  = BeautifulSoup(page.content, 'html.parser')
-            ## get date
-            dt_string = soup.find("meta", property='article:published_time')['content']
-            article_date = dt.datetime.strptime(dt_string, '%Y-%m-%dT%H:%M:%S+08:00')
-            article_headline = soup.find('meta',property='og:title')['content']
-            
-            if ('/content/' in link):  ## content type of article
-                article_detail   = soup.find(class_='post-content').get_text(strip=True, separator='<br>')
-                article_category = ""
-        
-            elif ('/video-feeds/' in link):   ## Video Feed, Skip
-                return None
-            
-            else:
-                article_detail = soup.find(property ='content:encoded').get_text(strip=True, separator='<br>')
-                if (article_detail) : 
-                    article_detail = article_detail.get_text(strip=True, separator='<br>')        
-                else: 
-                    article_detail = soup.find(id='post-content').find(class_='field-items').get_text(strip=True, separator='<br>')  
-                article_category = soup.find(class_='post-tags').find_all('a')
-                article_category = ','.join([ cat.get_text(strip=True) for cat in article_category ])                
-                
-        ## Error, return None
-        except:
-            if 'Article not found' in soup.find('title').get_text():
-                if (output):  print('         ! Article Not Found')
-            else:
-                if (output):  print('         ! Article Has No Content')
+            if self.CACHE is not None: self.CACHE.Put(link, 'TheEdge', page.content)
+        except Exception as err:
+            if (output):  print('         ! Article Error', err)
             return None
+        return self.TheEdgeParseArticle(link, page.content, output=output)
 
-        ## No Error, return Dict
-        else:
-            return {'Id':          hasher(link).hexdigest(),
-                    'CreatedDate': article_date,
-                    'Category':    article_category,
-                    'Headline':    article_headline,
-                    'Detail':      article_detail,
-                    'Link':        link,
-                    'Source':      'TheEdge'}
+    ## TheEdge Parse Article Detail From Page Content
+    #################################################
+    def TheEdgeParseArticle(self, link, content, output=False):
+        return PARSERS[self.PARSER].ParseTheEdge(link, content, output=output)
         
     ## General Fetch Links From Keyword (Search All News Providers)
     ###############################################################
@@ -237,90 +647,186 @@ class NewsDatabase:
                               date_from = dt.date(pd.Timestamp.now().year,pd.Timestamp.now().month,1).isoformat(),
                               date_to   = pd.Timestamp.now().date().isoformat(),
                               output=False,
-                              save=True):
-        self.TheStarFetchLinksFromKeywords(keyword=keyword, date_from=date_from, date_to=date_to, output=output, save=save)
-        self.TheEdgeFetchLinksFromKeywords(keyword=keyword, date_from=date_from, date_to=date_to, output=output, save=save)
+                              save=True,
+                              workers=4):
+        self.TheStarFetchLinksFromKeywords(keyword=keyword, date_from=date_from, date_to=date_to, output=output, save=save, workers=workers)
+        self.TheEdgeFetchLinksFromKeywords(keyword=keyword, date_from=date_from, date_to=date_to, output=output, save=save, workers=workers)
+
+    ## Batch Fetch Links From List Of Keywords (Search All News Providers)
+    ######################################################################
+    ##   Every (source, keyword, page) job runs on one shared pool of `workers` threads,
+    ##   each (source, keyword) keeps up to `window` pages in flight.
+    ##   Links are deduplicated across keywords in memory and saved once at the end.
+    def FetchLinksFromKeywordsBatch(self,
+                              keywords=[], 
+                              date_from = dt.date(pd.Timestamp.now().year,pd.Timestamp.now().month,1).isoformat(),
+                              date_to   = pd.Timestamp.now().date().isoformat(),
+                              output=False,
+                              save=True,
+                              workers=8,
+                              window=4,
+                              sources=['TheStar','TheEdge']):
+        if (save): self._CheckSavable('FetchLinksFromKeywordsBatch')
+        if (not type(keywords)==list): keywords = [keywords]
+        keywords = list(dict.fromkeys([ x.strip() for x in keywords if x.strip() ]))   ## dedup, keep order
+        print('{}:  Keywords: {}  Range: {} {} - Fetching Links'.format('NewsDatabase', len(keywords), date_from, date_to))
+        streams = []
+        for keyword in keywords:
+            if 'TheStar' in sources: streams = streams + [self._TheStarStream(keyword.replace(' ', '+'),   date_from, date_to)]
+            if 'TheEdge' in sources: streams = streams + [self._TheEdgeStream(keyword.replace(' ', '%20'), date_from, date_to)]
+        new_links = self._HarvestLinks(streams, workers=workers, window=window, output=output)
+        for st in streams:
+            print('{}:  Keyword: {:<20}  - Pages: {:>4}  New Links: {}'.format(st['source'], st['keyword'], st['processed'], st['new']))
+        print('{}:  Keywords: {}  - New Links: {}, Accumulated Unique Links: {}'.format('NewsDatabase', len(keywords), new_links, len(self.LINKS_DF)))
+        if (save): self.SaveToLocalStorage()
         
     ## TheStar Fetch Links From Given Keyword
     #########################################
     ## default range current month
+    ##   workers: search result pages fetched concurrently per window
     def TheStarFetchLinksFromKeywords(self,
                               keyword=None, 
                               date_from = dt.date(pd.Timestamp.now().year,pd.Timestamp.now().month,1).isoformat(),
                               date_to   = pd.Timestamp.now().date().isoformat(),
                               output=False,
-                              save=True):
+                              save=True,
+                              workers=4):
+        if (save): self._CheckSavable('TheStarFetchLinksFromKeywords')
         keyword= keyword.replace(' ', '+')
         print('{}:  Keyword: {:<20}  Range: {} {} - Fetching Links'.format('NewsDatabase', keyword, date_from, date_to))
-        ## Loop Through All Search Result Pages
-        ##   Append To Existing LINKS_DF
-        URL_TEMPLATE = 'https://www.thestar.com.my/search/?q={}&pgno={}&qguid=&qtag=33%2C76&QDR=QDR_specific&qsort=newest&qrec=30&adv=1&sdate={}&edate={}'
-        for page_no in range (1, 335):
-            ## HTTP get the url returning as request object
-            URL = URL_TEMPLATE.format(keyword, page_no, date_from, date_to)
-            user_agent = {'User-Agent': random.choice(self._USER_AGENTS)}
-            page  = self._REQUEST.get(URL, headers=user_agent, timeout = self._TIMEOUT)
-            ## Get All Listing In This Page
-            soup = BeautifulSoup(page.content, 'html.parser')
-            link_rows = soup.find_all(class_='tab-content clearfix')[1].find_all(class_='f18')
-            if len(link_rows)>0:
-                page_links  = [ row.a['href']  for row in link_rows ]
-                temp_df = pd.DataFrame({'Link':page_links, 'Source': 'TheStar'})
-                temp_df['Id'] = temp_df.Link.apply(lambda x: hasher(x).hexdigest())
-                temp_df.set_index('Id',inplace=True)
-                self.LINKS_DF = self.LINKS_DF.append(temp_df)
-            else:  
-                ## Break when no more pages
-                break
-        
-        ## Call To Save
-        self.LINKS_DF.drop_duplicates(inplace=True)
+        ## Harvest All Search Result Pages, Append New Links To LINKS_DF
+        self._HarvestLinks([self._TheStarStream(keyword, date_from, date_to)], workers=workers, window=workers, output=output)
         print('{}:  Keyword: {:<20}     - Accumulated Unique Links: {}'.format('TheStar', keyword, len(self.LINKS_DF)))
         if (save): self.SaveToLocalStorage()        
-                
+
+    ## TheStar Search Stream For _HarvestLinks, keyword already url encoded
+    ######################################################################
+    def _TheStarStream(self, keyword, date_from, date_to):
+        return {'source': 'TheStar', 'keyword': keyword, 'pages': range(1, 335),
+                'page_links': lambda page_no: self._TheStarSearchPage(keyword, page_no, date_from, date_to)}
+
+    ## TheStar Get Links From One Search Result Page
+    ################################################
+    def _TheStarSearchPage(self, keyword, page_no, date_from, date_to):
+        URL_TEMPLATE = 'https://www.thestar.com.my/search/?q={}&pgno={}&qguid=&qtag=33%2C76&QDR=QDR_specific&qsort=newest&qrec=30&adv=1&sdate={}&edate={}'
+        ## HTTP get the url returning as request object
+        URL = URL_TEMPLATE.format(keyword, page_no, date_from, date_to)
+        user_agent = {'User-Agent': random.choice(self._USER_AGENTS)}
+        page  = self._REQUEST.get(URL, headers=user_agent, timeout = self._TIMEOUT)
+        ## Get All Listing In This Page
+        soup = BeautifulSoup(page.content, 'html.parser')
+        link_rows = soup.find_all(class_='tab-content clearfix')[1].find_all(class_='f18')
+        return [ row.a['href']  for row in link_rows ]
 
     ## The Edge Fetch Links From Given Keyword
     ##########################################
     ## default range current month
+    ##   workers: search result pages fetched concurrently per window
     def TheEdgeFetchLinksFromKeywords(self,
                               keyword=None, 
                               date_from = dt.date(pd.Timestamp.now().year,pd.Timestamp.now().month,1).isoformat(),
                               date_to   = pd.Timestamp.now().date().isoformat(),
                               output=False,
-                              save=True):
+                              save=True,
+                              workers=4):
+        if (save): self._CheckSavable('TheEdgeFetchLinksFromKeywords')
         keyword= keyword.replace(' ', '%20')
         print('{}:  Keyword: {:<20}  Range: {} {} - Fetching Links'.format('TheEdge', keyword, date_from, date_to))
-        ## Loop Through All Search Result Pages
-        ##   Append To Existing LINKS_DF
-        URL_TEMPLATE = 'https://www.theedgemarkets.com/search-results?keywords="{}"&page={}&fromDate={}&toDate={}'
-        ## Loop Thorugh Every Keyword
-        for i in range (0, 4762):
-            ## HTTP get the url returning as request object
-            URL = URL_TEMPLATE.format( keyword, i, date_from, date_to )
-            page  = self._REQUEST.get(URL, timeout = self._TIMEOUT)
-            soup = BeautifulSoup(page.content, 'html.parser')
-            ## Get All Listing In This Page, Use CSS Selector, convert ResultSet to List
-            result_set = soup.select('div.content-main div.view-content')
-            if len(result_set) == 0:
-                link_rows = []
-            else:
-                link_rows = result_set[0].find_all('a')
-            ## Remove all Video Feeds Links
-            link_rows = [ i for i in link_rows if not 'video-feeds/' in i['href']]  
-            if len(link_rows)>0:
-                page_links = [ 'https://theedgemarkets.com'+row['href']  for row in link_rows ]
-                temp_df = pd.DataFrame({'Link':page_links, 'Source': 'TheEdge'})
-                temp_df['Id'] = temp_df.Link.apply(lambda x: hasher(x).hexdigest())
-                temp_df.set_index('Id',inplace=True)
-                self.LINKS_DF = self.LINKS_DF.append(temp_df)
-            else:  
-                ## Break when reaching end of page
-                break
-        
-        ## Call To Save
-        self.LINKS_DF.drop_duplicates(inplace=True)
+        ## Harvest All Search Result Pages, Append New Links To LINKS_DF
+        self._HarvestLinks([self._TheEdgeStream(keyword, date_from, date_to)], workers=workers, window=workers, output=output)
         print('{}:  Keyword: {:<20}  - Accumulated Unique Links: {}'.format('TheEdge', keyword, len(self.LINKS_DF)))
         if (save): self.SaveToLocalStorage()
+
+    ## TheEdge Search Stream For _HarvestLinks, keyword already url encoded
+    ######################################################################
+    def _TheEdgeStream(self, keyword, date_from, date_to):
+        return {'source': 'TheEdge', 'keyword': keyword, 'pages': range(0, 4762),
+                'page_links': lambda page_no: self._TheEdgeSearchPage(keyword, page_no, date_from, date_to)}
+
+    ## TheEdge Get Links From One Search Result Page
+    ################################################
+    def _TheEdgeSearchPage(self, keyword, page_no, date_from, date_to):
+        URL_TEMPLATE = 'https://www.theedgemarkets.com/search-results?keywords="{}"&page={}&fromDate={}&toDate={}'
+        ## HTTP get the url returning as request object
+        URL = URL_TEMPLATE.format( keyword, page_no, date_from, date_to )
+        page  = self._REQUEST.get(URL, timeout = self._TIMEOUT)
+        soup = BeautifulSoup(page.content, 'html.parser')
+        ## Get All Listing In This Page, Use CSS Selector, convert ResultSet to List
+        result_set = soup.select('div.content-main div.view-content')
+        if len(result_set) == 0:
+            link_rows = []
+        else:
+            link_rows = result_set[0].find_all('a')
+        ## Remove all Video Feeds Links
+        link_rows = [ i for i in link_rows if not 'video-feeds/' in i['href']]  
+        return [ 'https://theedgemarkets.com'+row['href']  for row in link_rows ]
+
+    ## Harvest Links From Search Result Pages Of Several (Source, Keyword) Streams
+    ##############################################################################
+    ##   All pages of all streams share one pool of `workers` threads (per host limit: workers).
+    ##   Each stream keeps up to `window` pages in flight and processes them in page order.
+    ##   A stream stops at the first empty (or failed) page, or at a page whose links were all
+    ##   known before the harvest (SEEN_LINKS) or seen earlier in the same stream.
+    ##   Links are deduplicated across streams in a dict, added to LINKS_DF once at the end.
+    ##   streams: list of dict(source, keyword, page_links: function page_no -> links, pages)
+    def _HarvestLinks(self, streams, workers=4, window=4, output=False):
+        links   = {}    ## Id -> (Link, Source), all streams
+        fetcher = ConcurrentFetcher(workers=workers, host_limit=workers)
+        for st in streams:
+            st.update({'pages': list(st['pages']), 'next': 0, 'processed': 0, 'results': {}, 'seen': set(), 'done': False, 'new': 0})
+
+        with fetcher.Pool() as pool:
+            pending = {}    ## future -> (stream, page_no)
+
+            ## Keep Up To window Pages In Flight For A Stream
+            def fill(st):
+                while (not st['done']) and st['next'] < len(st['pages']) and st['next'] - st['processed'] < window:
+                    page_no = st['pages'][st['next']]
+                    future  = fetcher.Submit(pool, lambda x, st=st: self._SearchPage(st['page_links'], x, st['source']), page_no, self._SEARCH_HOSTS[st['source']])
+                    pending[future] = (st, page_no)
+                    st['next'] = st['next'] + 1
+
+            for st in streams: fill(st)
+            while len(pending) > 0:
+                finished, not_done = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    st, page_no = pending.pop(future)
+                    if st['done']: continue
+                    st['results'][page_no] = future.result()
+                    ## Process Completed Pages Of This Stream In Page Order
+                    while (not st['done']) and st['processed'] < len(st['pages']) and st['pages'][st['processed']] in st['results']:
+                        page_no = st['pages'][st['processed']]
+                        ids     = [ (hasher(x).hexdigest(), x) for x in st['results'].pop(page_no) ]
+                        known   = self.SEEN_LINKS.Contains([ idx for idx, x in ids ])
+                        st['processed'] = st['processed'] + 1
+                        new_ids = [ (idx, x) for (idx, x), k in zip(ids, known) if not k and idx not in st['seen'] ]
+                        if (output): print('{}:  Keyword: {:<20}  Page: {:>4}  Links: {:>3}  New: {:>3}'.format(st['source'], st['keyword'], page_no, len(ids), len(new_ids)))
+                        if len(new_ids) == 0:
+                            st['done'] = True
+                            break
+                        st['seen'].update([ idx for idx, x in new_ids ])
+                        new_ids = [ (idx, x) for idx, x in new_ids if idx not in links ]   ## found by another stream
+                        st['new'] = st['new'] + len(new_ids)
+                        links.update([ (idx, (x, st['source'])) for idx, x in new_ids ])
+                    if st['processed'] >= len(st['pages']): st['done'] = True
+                    fill(st)
+
+        ## Materialize New Links Once
+        if len(links) > 0:
+            temp_df = pd.DataFrame([ v for v in links.values() ], columns=self._LINKS_COLUMNS, index=pd.Index(list(links.keys()), name='Id'))
+            self.LINKS_DF = pd.concat([self.LINKS_DF, temp_df])
+            self._NEW_LINKS.append(temp_df)
+            self.SEEN_LINKS.Add(temp_df.index)
+        return len(links)
+
+    ## Fetch One Search Result Page, Failure Treated As Last Page
+    #############################################################
+    def _SearchPage(self, page_links, page_no, source):
+        try:
+            return page_links(page_no)
+        except Exception as err:
+            print('{}:  Page: {:>4}  !!! Search Page Error, Treated As Last Page.'.format(source, page_no), err)
+            return []
        
    
 #%% TheStar: FetchArticle Debugging
@@ -0,0 +1,200 @@
+#######################################################################################
+### Module: NewsFeatures
+### Date: 18 Oct 2026
+### Features:  - NLP features of news Headline and Detail (SentiWordNet and TextBlob scores)
+###            - Sharded execution on a process pool, NLTK resources loaded once per worker
+###            - Shards merged back in input order, same result as a single process run
+###            - Progress reporting (articles done, rate, time remaining)
+###            - SentiWordNet scores from precompiled SentiLexicon, vectorized per document
+###            - Each text tokenized and POS tagged once for SentiWordNet (sentences tagged in
+###              batches per shard), TextBlob scores from TextBlob(text).sentiment as before
+###            - FeatureVersion(): hash of the feature code and NLP library versions (see FeatureStore)
+#######################################################################################
+
+import os
+import time
+import inspect
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+## NLTK Library
+import nltk
+from   nltk.tokenize import sent_tokenize
+from   nltk.corpus   import sentiwordnet   as swn
+from   nltk.corpus   import wordnet        as wn
+from   importlib.metadata import version as package_version
+from   textblob      import TextBlob
+from   Modules.SentiLexicon import SentiLexicon
+from   xxhash import xxh64 as hasher
+
+## Loaded Once Per Process (See _Lexicon)
+LEXICON = None
+
+## Output Columns, In Order
+FEATURE_COLUMNS = ['Headline_SentenceCount', 'Headline_WordCount', 'Headline_WN_WordCount', 'Headline_WN_PosScore','Headline_WN_NegScore', 'Headline_WN_ObjScore', 'Headline_WN_PosWordCount', 'Headline_WN_NegWordCount', 'Headline_WN_NeuWordCount',
+                   'Detail_SentenceCount',   'Detail_WordCount',   'Detail_WN_WordCount',   'Detail_WN_PosScore',  'Detail_WN_NegScore',   'Detail_WN_ObjScore',   'Detail_WN_PosWordCount',   'Detail_WN_NegWordCount',   'Detail_WN_NeuWordCount',
+                   'Headline_TB_Polarity',   'Headline_TB_Subjectivity', 'Detail_TB_Polarity','Detail_TB_Subjectivity']
+
+### Convert between the PennTreebank tags to simple Wordnet tag
+def penn_to_wn(tag):
+    if tag.startswith('J'):
+        return wn.ADJ
+    elif tag.startswith('N'):
+        return wn.NOUN
+    elif tag.startswith('R'):
+        return wn.ADV
+    elif tag.startswith('V'):
+        return wn.VERB
+    return None
+
+## SentiLexicon Of This Process
+################################
+def _Lexicon():
+    global LEXICON
+    if LEXICON is None:
+        LEXICON = SentiLexicon()
+    return LEXICON
+
+## Tokenize And POS Tag Many Texts In One Pass
+################################################
+##   every text is split into sentences and words once, all sentences tagged in one batch
+##   word_tokenize as in the original loop (it re-splits each sentence), same token stream
+##   returns per text: (sentence count, list of (word, penn tag))
+def tag_documents (texts):
+    sentences = [ sent_tokenize(text) for text in texts ]
+    tokens    = [ nltk.word_tokenize(sentence) for doc in sentences for sentence in doc ]
+    tagged    = iter(nltk.pos_tag_sents(tokens))
+    return [ (len(doc), [ pair for sentence in doc for pair in next(tagged) ]) for doc in sentences ]
+
+### Return SentiWordNet Features From Tagged Text
+##   SentiWordNet scores of the first synset of every token come from SentiLexicon in one
+##   vectorized lookup. Scores are summed in token order (cumsum), as the original loop did.
+def features_from_tagged (sentence_count, penn_tagged):
+    words = [ x for (x,y) in penn_tagged ]
+    tags  = [ penn_to_wn(y) for (x,y) in penn_tagged ]
+    word_count = len(words)
+    ## Words With A Synset
+    scores = _Lexicon().Lookup(words, tags)
+    scores = scores[~np.isnan(scores[:, 0])]
+    wn_tokens = len(scores)
+    if wn_tokens == 0:
+        return sentence_count, word_count, 0, 0.00, 0.00, 0.00, 0, 0, 0
+    pos_score = float(np.cumsum(scores[:, 0])[-1])
+    neg_score = float(np.cumsum(scores[:, 1])[-1])
+    obj_score = float(np.cumsum(scores[:, 2])[-1])
+    pos_words = int((scores[:, 0] >  scores[:, 1]).sum())
+    neg_words = int((scores[:, 0] <  scores[:, 1]).sum())
+    neu_words = int((scores[:, 0] == scores[:, 1]).sum())
+    ## return the data
+    return sentence_count, word_count, wn_tokens, pos_score, neg_score, obj_score, pos_words, neg_words, neu_words
+
+### TextBlob Polarity And Subjectivity From Text
+##   TextBlob's own (Pattern) tokenization, not the NLTK tokens of the SentiWordNet features
+def textblob_from_text (text):
+    sentiment = TextBlob(text).sentiment
+    return sentiment.polarity, sentiment.subjectivity
+
+### Return NLP Features From Text
+def features_from_text (text):
+    return features_from_tagged(*tag_documents([text])[0])
+
+### Features Of Many Articles, Texts Of All Articles Tagged In One Pass
+def news_generate_features_batch (headlines, details):
+    ## Reencode News Text
+    details = [ detail.replace('<br>', '') for detail in details ]
+    docs    = tag_documents(list(headlines) + details)
+    features = []
+    for headline, detail, (head_sc, head_tagged), (det_sc, det_tagged) in zip(headlines, details, docs[:len(details)], docs[len(details):]):
+        ## SentiWordNet And TextBlob Sentiment Scores
+        features.append(features_from_tagged(head_sc, head_tagged) + features_from_tagged(det_sc, det_tagged) + \
+                        textblob_from_text(headline) + textblob_from_text(detail))
+    return features
+
+### Features Of One Article
+def news_generate_features (headline, detail):
+    return news_generate_features_batch([headline], [detail])[0]
+
+## Version Of The Features: Hash Of The Feature Code And Library Versions
+###########################################################################
+##   any change to the functions below or to nltk/textblob gives a new version,
+##   stored features of an older version are then recomputed by phase1
+def FeatureVersion():
+    code = [ inspect.getsource(x) for x in [penn_to_wn, tag_documents, features_from_tagged, textblob_from_text, news_generate_features_batch, _DeriveSentiment, SentiLexicon._Compute] ]
+    return hasher('\n'.join(code + FEATURE_COLUMNS + [package_version('nltk'), package_version('textblob')])).hexdigest()
+
+## Load NLTK Resources Once (Worker Initializer)
+################################################
+##   corpora and models load lazily on first use, force it before any shard is timed
+def _InitWorker():
+    swn.ensure_loaded()
+    wn.ensure_loaded()
+    _Lexicon()
+    tag_documents(['Warm up the tagger.'])
+    textblob_from_text('Warm up the lexicon.')
+
+## Features Of One Shard (Runs In Worker Process)
+#################################################
+##   args: (shard_no, ids, headlines, details)
+##   returns (shard_no, ids, list of feature tuples, lexicon entries computed by this shard)
+def _GenerateShard(args):
+    shard_no, ids, headlines, details = args
+    features = news_generate_features_batch(headlines, details)
+    return shard_no, ids, features, _Lexicon().Pending()
+
+## Generate Features For All News, Sharded Across Processes
+###########################################################
+##   news       : DataFrame indexed by Id with Headline and Detail (no NA)
+##   workers    : processes, 1 runs in this process
+##   shard_size : articles per shard
+##   returns DataFrame of FEATURE_COLUMNS plus WN_Sentiment columns, in the row order of news
+##   SentiLexicon is built before the first run, words it lacks are added after each run
+def GenerateFeatures(news, workers=os.cpu_count(), shard_size=500, output=True):
+    if not _Lexicon().Exists():
+        _Lexicon().Build()
+    shards = [ (i, list(news.index[s : s+shard_size]), list(news.Headline.iloc[s : s+shard_size]), list(news.Detail.iloc[s : s+shard_size]))
+               for i, s in enumerate(range(0, len(news), shard_size)) ]
+    results    = {}
+    done       = 0
+    start_time = time.time()
+
+    ## Report Progress After Each Shard
+    def progress():
+        elapsed = time.time() - start_time
+        rate    = done / elapsed if elapsed > 0 else 0.0
+        if (output): print('\r>> shards: {}/{}  articles: {}/{}  {:.1f} articles/sec  remaining: {:.1f} min '
+                           .format(len(results), len(shards), done, len(news), rate, (len(news) - done) / rate / 60 if rate > 0 else 0.0), end='', flush=True)
+
+    if (workers <= 1):
+        _InitWorker()
+        for shard in shards:
+            shard_no, ids, features, entries = _GenerateShard(shard)
+            results[shard_no] = (ids, features)
+            _Lexicon().Update(entries)
+            done = done + len(ids)
+            progress()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_InitWorker) as pool:
+            futures = [ pool.submit(_GenerateShard, shard) for shard in shards ]
+            for future in as_completed(futures):
+                shard_no, ids, features, entries = future.result()
+                results[shard_no] = (ids, features)
+                _Lexicon().Update(entries)
+                done = done + len(ids)
+                progress()
+    if (output): print()
+    _Lexicon().Save()
+
+    ## Merge Shards In Input Order
+    ids      = [ idx for i in range(len(shards)) for idx in results[i][0] ]
+    features = [ row for i in range(len(shards)) for row in results[i][1] ]
+    df = pd.DataFrame(features, index=pd.Index(ids, name=news.index.name), columns=FEATURE_COLUMNS)
+
+    return _DeriveSentiment(df)
+
+## Derive Wordnet Sentiments, calcualted as Total Positive / (Total Positive + Total Negative), range: 0-1
+##########################################################################################################
+def _DeriveSentiment(df):
+    df['Headline_WN_Sentiment'] = (df.Headline_WN_PosWordCount / (df.Headline_WN_PosWordCount + df.Headline_WN_NegWordCount)).fillna(0.5)
+    df['Detail_WN_Sentiment']   = (df.Detail_WN_PosWordCount / (df.Detail_WN_PosWordCount + df.Detail_WN_NegWordCount)).fillna(0.5)
+    return df
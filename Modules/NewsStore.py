@@ -0,0 +1,295 @@
+#######################################################################################
+### Module: NewsStore
+### Date: 18 Oct 2026
+### Features:  - Columnar (Parquet) storage for news articles
+###            - Partitioned by Month and Source, one file per partition
+###            - Typed columns (timestamp CreatedDate, dictionary encoded Source)
+###            - Column projection and date range partition pruning on load
+###            - Partition file replaced atomically on write (no half written partition)
+###            - Append-only segments for new batches, merged into partitions by Compact()
+###            - Store swap by Replace() recovered on open after an interruption (.old / .new)
+###            - One-shot migration from news_db.csv, swapped in only once complete
+#######################################################################################
+
+import os
+import time
+import shutil
+import threading
+import pandas as pd
+import configparser as cp
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+news_db    = config['data']['news_db']
+news_store = config['data']['news_store']
+
+#%%Class: NewsStore
+##########################################
+### NewsStore
+##########################################
+class NewsStore:
+
+    ## Typed Schema, Stored Column Order
+    _SCHEMA = pa.schema([
+        ('Id',          pa.string()),
+        ('Link',        pa.string()),
+        ('Source',      pa.dictionary(pa.int8(), pa.string())),
+        ('CreatedDate', pa.timestamp('ns')),
+        ('Headline',    pa.string()),
+        ('Detail',      pa.string()),
+        ('Category',    pa.string())])
+    _COLUMNS        = ['Link','Source','CreatedDate','Headline', 'Detail', 'Category']
+    _PARTITION_FILE = 'data.parquet'
+    _SEGMENT_DIR    = '_segments'
+    _COMPACT_LOCK   = threading.RLock()  ## one compaction (or swap) at a time per process, excludes Load
+    _COMPLETE_FILE  = '_complete'        ## marks a fully written .new store
+    _UNKNOWN_MONTH  = 'unknown'      ## partition for articles without CreatedDate
+    _ROW_GROUP_SIZE = 10000
+    _CSV_CHUNKSIZE  = 100000
+
+    ## Initialize
+    ##########################################
+    def __init__(self, path=news_store):
+        self.PATH = path
+        self._Recover()
+
+    ## Store Has Been Created (Migrated or Written)
+    ##############################################
+    def Exists(self):
+        with self._COMPACT_LOCK:
+            self._Recover()
+            return len(self.Partitions()) > 0 or len(self.Segments()) > 0
+
+    ## Finish Or Roll Back A Swap Interrupted In Replace()
+    ######################################################
+    ##   Store missing: a complete (marked) .new is swapped in, else .old is put back.
+    ##   Leftover .old and .new are then removed.
+    def _Recover(self):
+        path     = self.PATH.rstrip('/\\')
+        new_path = path + '.new'
+        old_path = path + '.old'
+        if not (os.path.isdir(new_path) or os.path.isdir(old_path)):
+            return
+        with self._COMPACT_LOCK:
+            if not os.path.isdir(path) and os.path.isfile(os.path.join(new_path, self._COMPLETE_FILE)):
+                os.replace(new_path, path)
+                os.remove(os.path.join(path, self._COMPLETE_FILE))
+                print('NewsStore:  Interrupted Replace Completed')
+            elif not os.path.isdir(path) and os.path.isdir(old_path):
+                os.replace(old_path, path)
+                print('NewsStore:  Interrupted Replace Rolled Back')
+            shutil.rmtree(old_path, ignore_errors=True)
+            shutil.rmtree(new_path, ignore_errors=True)
+
+    ## List Segment Files, Oldest First
+    ###################################
+    def Segments(self):
+        segment_path = os.path.join(self.PATH, self._SEGMENT_DIR)
+        if not os.path.isdir(segment_path):
+            return []
+        return [ os.path.join(segment_path, x) for x in sorted(os.listdir(segment_path)) if x.endswith('.parquet') ]
+
+    ## List Partitions, Pruned By Date Range and Sources
+    ###################################################
+    ## returns list of (month, source, file), month in 'YYYY-MM'
+    def Partitions(self, date_from=None, date_to=None, sources=None):
+        if not os.path.isdir(self.PATH):
+            return []
+
+        ## Convert Date Range To Month Boundaries
+        month_from = pd.Timestamp(date_from).strftime('%Y-%m') if date_from is not None else None
+        month_to   = pd.Timestamp(date_to).strftime('%Y-%m')   if date_to   is not None else None
+        if (sources is not None and not type(sources)==list): sources = [sources]
+
+        partitions = []
+        for month_dir in sorted(os.listdir(self.PATH)):
+            if not month_dir.startswith('Month='): continue
+            month = month_dir[len('Month='):]
+            ## Date range given, undated articles and months out of range are pruned
+            if (month_from or month_to) and month == self._UNKNOWN_MONTH: continue
+            if month_from and month < month_from: continue
+            if month_to   and month > month_to:   continue
+            for source_dir in sorted(os.listdir(os.path.join(self.PATH, month_dir))):
+                if not source_dir.startswith('Source='): continue
+                source = source_dir[len('Source='):]
+                if sources is not None and source not in sources: continue
+                file = os.path.join(self.PATH, month_dir, source_dir, self._PARTITION_FILE)
+                if os.path.isfile(file):
+                    partitions = partitions + [(month, source, file)]
+        return partitions
+
+    ## Load News Into DataFrame (Indexed By Id)
+    ##########################################
+    ##   columns   : projection, eg. all metadata without Detail. None for all columns
+    ##   date_from : inclusive, date_to: inclusive (whole day when date only)
+    def Load(self, columns=None, date_from=None, date_to=None, sources=None):
+        if columns is None: columns = self._COLUMNS
+        if (not type(columns)==list): columns = [columns]
+        read_columns = ['Id'] + [ x for x in columns if x != 'Id' ]
+
+        ## Row Filter On CreatedDate Within The Surviving Partitions
+        filters = []
+        if date_from is not None:
+            filters = filters + [('CreatedDate', '>=', pd.Timestamp(date_from))]
+        if date_to is not None:
+            date_to = pd.Timestamp(date_to)
+            if date_to == date_to.normalize(): date_to = date_to + pd.Timedelta(days=1) - pd.Timedelta(1)
+            filters = filters + [('CreatedDate', '<=', date_to)]
+
+        ## Files Listed And Read Under The Compaction Lock: None Removed Or Swapped Meanwhile
+        tables = []
+        with self._COMPACT_LOCK:
+            for month, source, file in self.Partitions(date_from, date_to, sources):
+                tables = tables + [pq.read_table(file, columns=read_columns, filters=filters or None)]
+
+            ## Segments Are Not Partitioned, Filter Sources By Column. Read After Partitions (Newer)
+            if (sources is not None and not type(sources)==list): sources = [sources]
+            segment_filters = filters + ([('Source', 'in', sources)] if sources is not None else [])
+            for file in self.Segments():
+                tables = tables + [pq.read_table(file, columns=read_columns, filters=segment_filters or None)]
+
+        ## Nothing Stored (Or Everything Pruned): Empty Typed Frame
+        if len(tables) == 0:
+            table = self._SCHEMA.empty_table().select(read_columns)
+        else:
+            table = pa.concat_tables(tables, promote_options='permissive')
+        df = table.to_pandas()
+        if 'Source' in df.columns:
+            df['Source'] = df.Source.astype(str)
+        df = df.set_index('Id')
+        ## Article in both partition and segment (compaction in progress), latest wins
+        return df[~df.index.duplicated(keep='last')]
+
+    ## Append New Articles As A Segment
+    ###################################
+    ##   Cost depends on the batch only. Segment file appears atomically.
+    def AppendSegment(self, df):
+        if len(df) == 0: return None
+        df = df.reindex(columns=self._COLUMNS)
+        df.index.name = 'Id'
+        df['CreatedDate'] = pd.to_datetime(df.CreatedDate)
+        df['Source']      = df.Source.astype(str)
+        segment_path = os.path.join(self.PATH, self._SEGMENT_DIR)
+        file = os.path.join(segment_path, 'seg-{:020d}-{}-{}.parquet'.format(time.time_ns(), os.getpid(), threading.get_ident()))
+        self._WritePartition(df, file)
+        return file
+
+    ## Merge Segments Into Partitions
+    #################################
+    ##   Segments are deleted only after every partition is replaced, a crash in between
+    ##   leaves the segments in place and the merge is simply repeated next time
+    def Compact(self, background=False):
+        if background:
+            thread = threading.Thread(target=self.Compact, name='NewsStoreCompact')
+            thread.start()
+            return thread
+
+        if not self._COMPACT_LOCK.acquire(blocking=False):
+            print('NewsStore:  Store Busy (Compaction, Load Or Replace Running), Compaction Skipped')
+            return 0
+        try:
+            segments = self.Segments()
+            if len(segments) == 0: return 0
+            df = pa.concat_tables([ pq.read_table(x) for x in segments ], promote_options='permissive').to_pandas().set_index('Id')
+            df['Source'] = df.Source.astype(str)
+            df = df[~df.index.duplicated(keep='last')]
+            self.Write(df)
+            for file in segments:
+                os.remove(file)
+            print('NewsStore:  Compacted Segments: {}, News: {}'.format(len(segments), len(df)))
+            return len(segments)
+        finally:
+            self._COMPACT_LOCK.release()
+
+    ## Write (Upsert) News DataFrame Into The Store
+    ###############################################
+    ##   Only partitions present in df are touched. Rows with existing Id are replaced.
+    ##   overwrite: discard existing partition content instead of merging
+    def Write(self, df, overwrite=False):
+        if len(df) == 0: return 0
+        df = df.reindex(columns=self._COLUMNS)
+        df.index.name = 'Id'
+        df['CreatedDate'] = pd.to_datetime(df.CreatedDate)
+        months = df.CreatedDate.dt.strftime('%Y-%m').fillna(self._UNKNOWN_MONTH)
+
+        for (month, source), part_df in df.groupby([months, df.Source.astype(str)], sort=False):
+            file = os.path.join(self.PATH, 'Month='+month, 'Source='+source, self._PARTITION_FILE)
+            if (not overwrite) and os.path.isfile(file):
+                existing_df = pq.read_table(file).to_pandas().set_index('Id')
+                existing_df['Source'] = existing_df.Source.astype(str)
+                part_df = pd.concat([existing_df, part_df])
+                part_df = part_df[~part_df.index.duplicated(keep='last')]
+            self._WritePartition(part_df, file)
+        return len(df)
+
+    ## Replace Whole Store Content With df (Eg. Rebuilt News)
+    ##########################################################
+    ##   Written beside the current store, marked complete, then swapped in. The lock is
+    ##   held throughout: Exists, Load and Compact wait for it. Pending segments are dropped,
+    ##   df is expected to hold every article. An interrupted swap is recovered on open.
+    def Replace(self, df):
+        with self._COMPACT_LOCK:
+            self._Recover()
+            staging = self._Staging()
+            NewsStore(staging).Write(df, overwrite=True)
+            self._SwapIn(staging)
+        print('NewsStore:  Replaced Store Content - News: {}, Partitions: {}'.format(len(df), len(self.Partitions())))
+        return len(df)
+
+    ## Empty Folder Beside The Store To Write A New Store Into
+    ##########################################################
+    ##   not touched by _Recover(): an unfinished write is never swapped in, and is removed
+    ##   by the next Replace or migration
+    def _Staging(self):
+        staging = self.PATH.rstrip('/\\') + '.staging'
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        return staging
+
+    ## Swap A Fully Written Store In Place Of The Current One
+    #########################################################
+    ##   marked complete and moved to .new, then swapped (see _Recover for interruptions)
+    def _SwapIn(self, staging):
+        path     = self.PATH.rstrip('/\\')
+        new_path = path + '.new'
+        old_path = path + '.old'
+        open(os.path.join(staging, self._COMPLETE_FILE), 'w').close()
+        os.replace(staging, new_path)
+        if os.path.isdir(path): os.replace(path, old_path)
+        os.replace(new_path, path)
+        os.remove(os.path.join(path, self._COMPLETE_FILE))
+        shutil.rmtree(old_path, ignore_errors=True)
+
+    ## Write One Partition: Sorted By CreatedDate, Atomic Replace
+    #############################################################
+    def _WritePartition(self, df, file):
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        df = df.sort_values('CreatedDate', kind='stable').reset_index()
+        table = pa.Table.from_pandas(df.loc[:, self._SCHEMA.names], schema=self._SCHEMA, preserve_index=False)
+        temp_file = file + '.tmp'
+        pq.write_table(table, temp_file, row_group_size=self._ROW_GROUP_SIZE)
+        os.replace(temp_file, file)
+
+    ## One-Shot Migration From news_db.csv
+    ######################################
+    ##   CSV is read in chunks, memory is bounded by chunksize rather than CSV size
+    ##   Written beside the store and swapped in once complete (as Replace): an interrupted
+    ##   migration leaves no store behind, NewsDatabase keeps using news_db.csv
+    def MigrateFromCsv(self, csv_file=news_db, chunksize=_CSV_CHUNKSIZE):
+        print('NewsStore:  Migrating {} To {}'.format(csv_file, self.PATH))
+        total = 0
+        with self._COMPACT_LOCK:
+            self._Recover()
+            staging = self._Staging()
+            for chunk in pd.read_csv(csv_file, index_col='Id', chunksize=chunksize):
+                chunk['CreatedDate'] = pd.to_datetime(chunk.CreatedDate)
+                total = total + NewsStore(staging).Write(chunk)
+                print('NewsStore:  Migrated News: {}'.format(total))
+            self._SwapIn(staging)
+        print('NewsStore:  Migration Completed - News: {}, Partitions: {}'.format(total, len(self.Partitions())))
+        return total
@@ -0,0 +1,123 @@
+#######################################################################################
+### Module: PriceArray
+### Date: 18 Oct 2026
+### Features:  - Dense date x symbol x field NumPy array of financial data (eg. FINANCIAL_DF)
+###            - Converted from / to the (symbol, field) column DataFrame in one step
+###            - Forward returns RDnn of any set of horizons, whole universe at once
+###            - Simple or log returns, result as a typed PriceArray (no column inserts)
+###            - Cap-weighted or equal-weighted index price of any symbol groups, all groups at once
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+
+## Return Field Name Of A Horizon
+def ReturnField(horizon):
+    return 'RD{:02d}'.format(horizon)
+
+#%%Class: PriceArray
+##########################################
+### PriceArray
+##########################################
+class PriceArray:
+
+    ## Initialize
+    ##########################################
+    ##   dates   : row of every date
+    ##   symbols : second axis
+    ##   fields  : third axis (eg. OPENPRICE, CLOSEPRICE)
+    ##   values  : array (dates x symbols x fields), None for all NaN
+    def __init__(self, dates=[], symbols=[], fields=[], values=None, dtype=np.float64):
+        self.DATES   = pd.DatetimeIndex(dates, name='Date')
+        self.SYMBOLS = list(symbols)
+        self.FIELDS  = list(fields)
+        shape        = (len(self.DATES), len(self.SYMBOLS), len(self.FIELDS))
+        self.VALUES  = np.full(shape, np.nan, dtype=dtype) if values is None else np.asarray(values, dtype=dtype).reshape(shape)
+
+    ## From DataFrame With (Symbol, Field) Columns
+    ##############################################
+    ##   symbols, fields: axes in this order (NaN when missing), None for those of df
+    def FromFrame(self, df, symbols=None, fields=None, dtype=np.float64):
+        symbols = df.columns.get_level_values(0).unique().to_list() if symbols is None else list(symbols)
+        fields  = df.columns.get_level_values(1).unique().to_list() if fields  is None else list(fields)
+        values  = df.reindex(columns=pd.MultiIndex.from_product([symbols, fields])).to_numpy(dtype=dtype)
+        self.__init__(df.index, symbols, fields, values, dtype)
+        return self
+
+    ## To DataFrame With (Symbol, Field) Columns, Built In One Step
+    ###############################################################
+    ##   columns: (symbol, field) pairs kept, None for all
+    def ToFrame(self, columns=None):
+        df = pd.DataFrame(self.VALUES.reshape(len(self.DATES), -1), index=self.DATES,
+                          columns=pd.MultiIndex.from_product([self.SYMBOLS, self.FIELDS]))
+        return df if columns is None else df.loc[:, list(columns)]
+
+    ## One Field Of Every Symbol (Dates x Symbols)
+    ##############################################
+    def Field(self, field):
+        return self.VALUES[:, :, self.FIELDS.index(field)]
+
+    ## Same Dates And Symbols, Fields Side By Side
+    ##############################################
+    def Join(self, other):
+        return PriceArray(self.DATES, self.SYMBOLS, self.FIELDS + other.FIELDS,
+                          np.concatenate([self.VALUES, other.VALUES.astype(self.VALUES.dtype)], axis=2), self.VALUES.dtype)
+
+## Forward Returns Of Every Symbol And Horizon
+##############################################
+##   RDnn at date t: from open of t to close of t+nn (rows of prices.DATES, NaN past the end)
+##   horizons : days ahead (eg. range(6) for RD00 - RD05)
+##   method   : 'simple' (close/open - 1) or 'log' (ln(close/open))
+##   percent  : returns x 100
+##   returns PriceArray, fields RDnn in the order of horizons
+def ForwardReturns(prices, horizons=range(6), method='simple', percent=True,
+                   open_field='OPENPRICE', close_field='CLOSEPRICE', dtype=np.float32):
+    horizons = np.asarray(list(horizons), dtype=np.int64)
+    open_    = prices.Field(open_field).astype(np.float64)
+    close    = prices.Field(close_field).astype(np.float64)
+    padded   = np.concatenate([close, np.full((max(horizons.max(initial=0), 0), close.shape[1]), np.nan)])
+    ahead    = padded[np.arange(len(close))[:, None] + horizons[None, :]]        ## dates x horizons x symbols
+    ahead    = ahead.transpose(0, 2, 1)                                          ## dates x symbols x horizons
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if method == 'log': values = np.log(ahead / open_[:, :, None])
+        else:               values = (ahead - open_[:, :, None]) / open_[:, :, None]
+    if percent:
+        values = values * 100
+    return PriceArray(prices.DATES, prices.SYMBOLS, [ ReturnField(h) for h in horizons ], values, dtype)
+
+## Index Price Of Every Group Of Symbols, All Groups At Once
+#############################################################
+##   groups       : dict name -> member symbols (of prices.SYMBOLS)
+##   fields       : price fields indexed (eg. OPENPRICE, CLOSEPRICE)
+##   weighting    : 'cap' (member weight_field / sum of members' weight_field) or 'equal'
+##   Each day, members with no price count as 0 (no weight for 'equal'), as pandas sum(skipna)
+##   A day with no priced member is NaN
+##   returns PriceArray, symbols: group names, fields: fields
+def GroupIndex(prices, groups, fields=['OPENPRICE', 'CLOSEPRICE'], weighting='cap', weight_field='MARKETCAP'):
+    names   = list(groups.keys())
+    column  = { s: i for i, s in enumerate(prices.SYMBOLS) }
+    members = [ [ column[s] for s in groups[g] if s in column ] for g in names ]
+
+    ## Member Table (Groups x Members), Padded With An All NaN Column
+    padding = len(prices.SYMBOLS)
+    table   = np.full((len(names), max([ len(x) for x in members ] + [1])), padding, dtype=np.int64)
+    for g, cols in enumerate(members):
+        table[g, :len(cols)] = cols
+
+    ## Member Values As (Members x Dates x Groups): Sums Over Axis 0 Add Members In Order
+    def gather(values):
+        values = np.concatenate([values.astype(np.float64), np.full((len(values), 1), np.nan)], axis=1)
+        return np.ascontiguousarray(values[:, table].transpose(2, 0, 1))
+
+    result = np.full((len(prices.DATES), len(names), len(fields)), np.nan)
+    weight = gather(prices.Field(weight_field)) if weighting == 'cap' else None
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if weight is not None:
+            weight = weight / np.where(np.isnan(weight), 0, weight).sum(axis=0)
+        for f, field in enumerate(fields):
+            price    = gather(prices.Field(field))
+            member_w = np.where(np.isnan(price), np.nan, 1 / (~np.isnan(price)).sum(axis=0)) if weight is None else weight
+            value    = price * member_w
+            priced   = (~np.isnan(value)).any(axis=0)
+            result[:, :, f] = np.where(priced, np.where(np.isnan(value), 0, value).sum(axis=0), np.nan)
+    return PriceArray(prices.DATES, names, fields, result)
@@ -0,0 +1,160 @@
+#######################################################################################
+### Module: SeenIndex
+### Date: 18 Oct 2026
+### Features:  - Persistent set of known link Ids (xxh64), stored as sorted uint64
+###            - Vectorized membership check (binary search), base file memory-mapped
+###            - Incremental update: new Ids appended to a delta file, merged occasionally
+###            - Ids added in memory first, persisted by Flush() once their data is saved
+#######################################################################################
+
+import os
+import numpy as np
+import configparser as cp
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+seen_index = config['data']['seen_index']
+
+## Convert Hex Id Strings To uint64 Array (uint64 Array Passed Through)
+#########################################################################
+def ToUint64(ids):
+    if getattr(ids, 'dtype', None) == np.uint64:
+        return np.asarray(ids)
+    ids = [ str(x) for x in ids ]   ## all digit Ids may have been read as int
+    if len(ids) == 0:
+        return np.empty(0, dtype=np.uint64)
+    joined = ''.join(ids)
+    if len(joined) == 16 * len(ids):
+        try:
+            return np.frombuffer(bytes.fromhex(joined), dtype='>u8').astype(np.uint64)
+        except ValueError:
+            pass
+    return np.array([ int(x, 16) for x in ids ], dtype=np.uint64)
+
+## Convert uint64 Array Back To Hex Id Strings
+###############################################
+def FromUint64(values):
+    hexed = np.asarray(values, dtype=np.uint64).astype('>u8').tobytes().hex()
+    return np.array([ hexed[i : i+16] for i in range(0, len(hexed), 16) ], dtype=object)
+
+#%%Class: SeenIndex
+##########################################
+### SeenIndex
+##########################################
+class SeenIndex:
+
+    _MERGE_MIN   = 100000   ## delta Ids before merging into base ...
+    _MERGE_RATIO = 0.05     ## ... or this fraction of base, whichever is larger
+
+    ## Initialize
+    ##########################################
+    ##   name: index name, files <path>/<name>.npy (base) and <path>/<name>.delta
+    def __init__(self, name, path=seen_index):
+        self.PATH        = path
+        self.NAME        = name
+        self._BASE_FILE  = os.path.join(path, name + '.npy')
+        self._DELTA_FILE = os.path.join(path, name + '.delta')
+        self._PENDING    = set()     ## added, not yet persisted
+        self.Reload()
+
+    ## Index Files Exist
+    ####################
+    def Exists(self):
+        return os.path.isfile(self._BASE_FILE)
+
+    ## Read Base (Memory-Mapped) And Delta From Disk
+    ################################################
+    def Reload(self):
+        if os.path.isfile(self._BASE_FILE):
+            self._BASE = np.load(self._BASE_FILE, mmap_mode='r')
+        else:
+            self._BASE = np.empty(0, dtype=np.uint64)
+        if os.path.isfile(self._DELTA_FILE):
+            self._DELTA = set(np.fromfile(self._DELTA_FILE, dtype='<u8').tolist())
+        else:
+            self._DELTA = set()
+
+    ## Number Of Ids Known
+    ######################
+    def __len__(self):
+        return len(self._BASE) + len(self._DELTA) + len(self._PENDING)
+
+    ## Membership Of A Single Id
+    ############################
+    def __contains__(self, idx):
+        return bool(self.Contains([idx])[0])
+
+    ## Membership Of Many Ids, Returns Boolean Array
+    ################################################
+    def Contains(self, ids):
+        values = ToUint64(ids)
+        found  = self._InBase(values)
+        extra  = self._DELTA | self._PENDING
+        if len(extra) > 0:
+            found = found | np.array([ x in extra for x in values.tolist() ], dtype=bool)
+        return found
+
+    ## All Ids As uint64 Array
+    ###########################
+    def Values(self):
+        extra = np.array(list(self._DELTA | self._PENDING), dtype=np.uint64)
+        return np.union1d(np.asarray(self._BASE), extra)
+
+    ## Add Ids (In Memory Until Flush)
+    ##################################
+    def Add(self, ids):
+        values = ToUint64(ids)
+        self._PENDING.update(values.tolist())
+
+    ## Persist Added Ids: Append To Delta, Merge Into Base When Delta Is Large
+    ##########################################################################
+    def Flush(self):
+        new_values = [ x for x in self._PENDING if x not in self._DELTA ]
+        self._PENDING = set()
+        if len(new_values) > 0:
+            new_values = np.array(new_values, dtype=np.uint64)
+            new_values = new_values[~self._InBase(new_values)]
+            os.makedirs(self.PATH, exist_ok=True)
+            with open(self._DELTA_FILE, 'ab') as f:
+                f.write(new_values.astype('<u8').tobytes())
+            self._DELTA.update(new_values.tolist())
+        if len(self._DELTA) > max(self._MERGE_MIN, self._MERGE_RATIO * len(self._BASE)):
+            self.Merge()
+
+    ## Merge Delta Into Sorted Base, Base Replaced Atomically Before Delta Is Removed
+    #################################################################################
+    def Merge(self):
+        if len(self._DELTA) == 0: return
+        base = np.union1d(np.asarray(self._BASE), np.array(list(self._DELTA), dtype=np.uint64))
+        self._WriteBase(base)
+        os.remove(self._DELTA_FILE)
+        self.Reload()
+
+    ## Rebuild Whole Index From Ids (Eg. From Existing Storage)
+    ###########################################################
+    def Build(self, ids):
+        self._WriteBase(np.unique(ToUint64(ids)))
+        if os.path.isfile(self._DELTA_FILE): os.remove(self._DELTA_FILE)
+        self._PENDING = set()
+        self.Reload()
+        print('SeenIndex:  Built Index {} - Ids: {}'.format(self.NAME, len(self._BASE)))
+
+    ## Membership In Base Only
+    ##########################
+    def _InBase(self, values):
+        if len(self._BASE) == 0:
+            return np.zeros(len(values), dtype=bool)
+        pos = np.searchsorted(self._BASE, values)
+        return self._BASE[np.minimum(pos, len(self._BASE) - 1)] == values
+
+    ## Write Base File Atomically
+    #############################
+    def _WriteBase(self, base):
+        os.makedirs(self.PATH, exist_ok=True)
+        self._BASE = np.empty(0, dtype=np.uint64)   ## release memory map before replacing
+        with open(self._BASE_FILE + '.tmp', 'wb') as f:
+            np.save(f, base.astype(np.uint64))
+        os.replace(self._BASE_FILE + '.tmp', self._BASE_FILE)
@@ -0,0 +1,145 @@
+#######################################################################################
+### Module: SentiLexicon
+### Date: 18 Oct 2026
+### Features:  - Precompiled SentiWordNet lexicon: (word, WordNet POS) -> first synset scores
+###            - Same result as list(swn.senti_synsets(word, pos=pos))[0], computed once per key
+###            - Stored as sorted uint64 key hashes plus score array, memory-mapped on load
+###            - Vectorized lookup of a whole document (array of words and POS tags)
+###            - Words missing from the lexicon computed on demand, saved with Update()/Save()
+#######################################################################################
+
+import os
+import numpy as np
+import configparser as cp
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+from nltk.corpus import sentiwordnet as swn
+from nltk.corpus import wordnet      as wn
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+senti_lexicon = config['data']['senti_lexicon']
+
+#%%Class: SentiLexicon
+##########################################
+### SentiLexicon
+##########################################
+## WordNet lower cases the word before lookup, so the key is (lower case word, pos).
+## pos is one of wn.ADJ, wn.NOUN, wn.ADV, wn.VERB or None (all parts of speech).
+## A key without synset is stored with NaN scores. Keys are stored as 64-bit xxh64 hashes.
+class SentiLexicon:
+
+    _POS_LIST = [None, 'a', 'n', 'r', 'v']   ## None, wn.ADJ, wn.NOUN, wn.ADV, wn.VERB
+
+    ## Initialize
+    ##########################################
+    def __init__(self, path=senti_lexicon):
+        self.PATH         = path
+        self._KEYS_FILE   = os.path.join(path, 'keys.npy')
+        self._SCORES_FILE = os.path.join(path, 'scores.npy')
+        self._CACHE       = {}    ## key hash -> scores, computed in this process
+        self._NEW         = {}    ## computed since last Pending()
+        self.Reload()
+
+    ## Lexicon Has Been Built
+    #########################
+    def Exists(self):
+        return os.path.isfile(self._KEYS_FILE)
+
+    ## Load Arrays (Memory-Mapped)
+    ##############################
+    def Reload(self):
+        if self.Exists():
+            self._KEYS   = np.load(self._KEYS_FILE,   mmap_mode='r')
+            self._SCORES = np.load(self._SCORES_FILE, mmap_mode='r')
+        else:
+            self._KEYS   = np.empty(0, dtype=np.uint64)
+            self._SCORES = np.empty((0, 3))
+
+    ## Number Of Keys Stored
+    ########################
+    def __len__(self):
+        return len(self._KEYS)
+
+    ## Key Hash Of (Word, POS)
+    ##########################
+    def _Key(self, word, pos):
+        return hasher(word.lower() + '\t' + (pos or '')).intdigest()
+
+    ## Scores (pos, neg, obj) Of First Senti Synset, NaN When None
+    ##############################################################
+    def _Compute(self, word, pos):
+        synsets = list(swn.senti_synsets(word, pos=pos))
+        if synsets:
+            synset = synsets[0]
+            return (synset.pos_score(), synset.neg_score(), synset.obj_score())
+        return (np.nan, np.nan, np.nan)
+
+    ## Scores Of A Document: One Row (pos, neg, obj) Per Word
+    ##########################################################
+    ##   words, tags: same length, tags as returned by penn_to_wn
+    def Lookup(self, words, tags):
+        keys   = np.array([ self._Key(w, t) for w, t in zip(words, tags) ], dtype=np.uint64)
+        scores = np.full((len(keys), 3), np.nan)
+        if len(keys) == 0:
+            return scores
+        found = np.zeros(len(keys), dtype=bool)
+        if len(self._KEYS) > 0:
+            pos   = np.minimum(np.searchsorted(self._KEYS, keys), len(self._KEYS) - 1)
+            found = self._KEYS[pos] == keys
+            scores[found] = self._SCORES[pos[found]]
+        ## Not Precompiled: Compute Once Per Process
+        for i in np.flatnonzero(~found):
+            key = int(keys[i])
+            if key not in self._CACHE:
+                self._CACHE[key] = self._NEW[key] = self._Compute(words[i], tags[i])
+            scores[i] = self._CACHE[key]
+        return scores
+
+    ## Entries Computed Since Last Call (To Merge From Worker Processes)
+    ####################################################################
+    def Pending(self):
+        new, self._NEW = self._NEW, {}
+        return new
+
+    ## Add Computed Entries (Saved By Save())
+    #########################################
+    def Update(self, entries):
+        self._CACHE.update(entries)
+        self._NEW.update(entries)
+
+    ## Write Stored And Computed Entries, Sorted By Key Hash
+    ########################################################
+    def Save(self):
+        if len(self._CACHE) == 0: return
+        keys   = np.concatenate([np.asarray(self._KEYS), np.array(list(self._CACHE.keys()), dtype=np.uint64)])
+        scores = np.concatenate([np.asarray(self._SCORES).reshape(-1, 3), np.array(list(self._CACHE.values()), dtype=np.float64).reshape(-1, 3)])
+        keys, first = np.unique(keys, return_index=True)
+        scores = scores[first]
+        os.makedirs(self.PATH, exist_ok=True)
+        self._KEYS = self._SCORES = None   ## release memory maps before replacing
+        for file, array in [(self._KEYS_FILE, keys), (self._SCORES_FILE, scores)]:
+            with open(file + '.tmp', 'wb') as f:
+                np.save(f, array)
+            os.replace(file + '.tmp', file)
+        self._CACHE = {}
+        self._NEW   = {}
+        self.Reload()
+        print('SentiLexicon:  Saved Keys: {}'.format(len(self._KEYS)))
+
+    ## Build From Every WordNet Lemma, Under Every POS (And None)
+    #############################################################
+    ##   inflected and unseen words are added later as they are met
+    def Build(self):
+        lemmas = sorted(set(wn.all_lemma_names()))
+        print('SentiLexicon:  Building From {} Lemmas...'.format(len(lemmas)))
+        for i, lemma in enumerate(lemmas):
+            for pos in self._POS_LIST:
+                key = self._Key(lemma, pos)
+                if key not in self._CACHE:
+                    self._CACHE[key] = self._Compute(lemma, pos)
+            if (i % 10000 == 0): print('\r>> lemmas: {}/{} '.format(i, len(lemmas)), end='', flush=True)
+        print()
+        self.Save()
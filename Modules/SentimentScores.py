@@ -0,0 +1,102 @@
+#######################################################################################
+### Module: SentimentScores
+### Date: 18 Oct 2026
+### Features:  - Daily sentiment score per symbol from a long (article, symbol) table
+###            - All symbols aggregated in one grouped pass: sum and count per (symbol, day)
+###            - Aggregators: mean, count, sum, ewm (exponentially weighted mean of articles)
+###            - Several sentiment sources at once (eg. WN, TB)
+###            - Combined article scores (SOURCES columns) from Headline and Detail features
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+
+## Sentiment Sources: Name -> Article Score Column
+SOURCES     = {'WN': 'Combined_WN_Sentiment', 'TB': 'Combined_TB_Polarity'}
+AGGREGATORS = ['mean', 'count', 'sum', 'ewm']
+
+## Combined Headline And Detail Scores Of Articles (SOURCES Columns)
+#####################################################################
+##   articles: phase1 features (Headline_ / Detail_ WN_Sentiment and TB_Polarity), columns added in place
+def CombinedScores(articles):
+    articles['Combined_WN_Sentiment'] = round( (articles.Headline_WN_Sentiment + articles.Detail_WN_Sentiment)/2, 2)
+    articles['Combined_TB_Polarity']  = round( (articles.Headline_TB_Polarity  + articles.Detail_TB_Polarity) /2, 2)
+    return articles
+
+## Long Table: One Row Per (Article, Symbol) Mentioned
+######################################################
+##   entities : EntityMatrix, rows in the order of articles
+##   articles : DataFrame with CreatedDate and score columns
+##   columns  : score columns carried over (eg. SOURCES values)
+##   returns DataFrame: Symbol (categorical, entities.SYMBOLS order), CreatedDate, Count, columns
+##   rows ordered by article, then symbol
+def LongEntities(entities, articles, columns=list(SOURCES.values())):
+    coo   = entities.MATRIX.tocoo()
+    order = np.lexsort((coo.col, coo.row))
+    rows, cols = coo.row[order], coo.col[order]
+    long_df = pd.DataFrame({'Symbol':      pd.Categorical.from_codes(cols, categories=entities.SYMBOLS),
+                            'CreatedDate': pd.to_datetime(articles.CreatedDate.values[rows]),
+                            'Count':       coo.data[order]})
+    for col in columns:
+        long_df[col] = articles[col].values[rows]
+    return long_df
+
+## Daily Sum And Count Of Every (Symbol, Day), One Grouped Pass
+###############################################################
+##   returns DataFrame indexed by (Symbol, CreatedDate), columns (source, 'sum' / 'count')
+##   count: articles with a score (NaN scores are not counted, as in mean())
+def DailySums(long_df, sources=SOURCES):
+    columns = list(sources.values())
+    daily   = long_df.groupby(['Symbol', 'CreatedDate'], observed=True, sort=True)[columns].agg(['sum', 'count'])
+    return daily.rename(columns={ v: k for k, v in sources.items() }, level=0)
+
+## Daily Scores Of Every Symbol
+###############################
+##   daily       : DailySums() (or a stored state with the same layout)
+##   aggregators : any of AGGREGATORS
+##   halflife    : ewm half-life in days
+##   returns DataFrame indexed by (Symbol, CreatedDate), columns (source, aggregator)
+def DailyScores(daily, aggregators=AGGREGATORS, halflife=5):
+    sources = list(dict.fromkeys(daily.columns.get_level_values(0)))
+    scores  = {}
+    for source in sources:
+        sums, counts = daily[(source, 'sum')], daily[(source, 'count')]
+        for agg in aggregators:
+            if   agg == 'mean':  scores[(source, agg)] = sums / counts.where(counts > 0)
+            elif agg == 'count': scores[(source, agg)] = counts
+            elif agg == 'sum':   scores[(source, agg)] = sums
+            elif agg == 'ewm':   scores[(source, agg)] = _Ewm(sums, counts, halflife)
+    return pd.DataFrame(scores, index=daily.index)
+
+## Exponentially Weighted Mean Of Article Scores
+################################################
+##   At day t: sum of w*score / sum of w over the symbol's articles up to t, w = 0.5**(age/halflife)
+##   Symbols side by side on a daily calendar, one vector step per day
+def _Ewm(sums, counts, halflife):
+    if len(sums) == 0:
+        return sums.astype(float)
+    sum_wide   = sums.unstack('Symbol')
+    count_wide = counts.unstack('Symbol')
+    calendar   = pd.date_range(sum_wide.index.min(), sum_wide.index.max(), freq='D')
+    sum_wide   = sum_wide.reindex(calendar).fillna(0).values
+    count_wide = count_wide.reindex(calendar).fillna(0).values
+    decay      = 0.5 ** (1 / halflife)
+    ewm_sum    = np.zeros(sum_wide.shape[1])
+    ewm_count  = np.zeros(sum_wide.shape[1])
+    ewm_wide   = np.empty(sum_wide.shape)
+    for t in range(len(calendar)):
+        ewm_sum   = ewm_sum   * decay + sum_wide[t]
+        ewm_count = ewm_count * decay + count_wide[t]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ewm_wide[t] = ewm_sum / ewm_count
+    ewm_wide = pd.DataFrame(ewm_wide, index=calendar.rename('CreatedDate'), columns=sums.unstack('Symbol').columns)
+    return ewm_wide.stack(future_stack=True).swaplevel().reindex(sums.index)
+
+## Wide Table: Day x Symbol, For One Source And Aggregator
+##########################################################
+##   symbols: columns in this order (all NaN when a symbol has no news), None for all
+def WideScores(scores, source='WN', aggregator='mean', symbols=None):
+    wide = scores[(source, aggregator)].unstack('Symbol').sort_index()
+    wide.columns = wide.columns.astype(str)
+    wide.columns.name = None
+    return wide if symbols is None else wide.reindex(columns=symbols)
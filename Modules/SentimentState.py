@@ -0,0 +1,186 @@
+#######################################################################################
+### Module: SentimentState
+### Date: 18 Oct 2026
+### Features:  - Persistent daily sentiment state: sum and count per (symbol, day) of every source
+###            - Incremental: only new or changed articles are passed (see Changes(), run by phase2)
+###            - Fingerprint of every counted article (date, scores, entity tags) and its
+###              (symbol, day, score) pairs: a changed or removed article is taken out again and
+###              only the (symbol, day) rows it touches are summed again
+###            - Same layout as DailySums(), phase3 scores derived with DailyScores()
+###            - One compressed .npz file, replaced atomically
+#######################################################################################
+
+import os
+import numpy as np
+import pandas as pd
+import configparser as cp
+from xxhash import xxh64 as hasher   ## no cryptographic hashing function, fast
+from Modules.SeenIndex import ToUint64, FromUint64
+from Modules.SentimentScores import SOURCES, LongEntities, DailySums
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+sentiment_state = config['data']['sentiment_state']
+
+## SplitMix64 Finalizer, Vectorized (uint64 Wraps Around)
+##########################################################
+def _Mix(x):
+    x = np.asarray(x, dtype=np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+## Fingerprint Of What Each Article Adds To The State
+#####################################################
+##   date, score columns and entity tags (symbol names and counts) of every row
+##   returns uint64 array, one per article
+def _Fingerprint(entities, articles, columns):
+    matrix  = entities.MATRIX
+    symbols = np.array([ hasher(s).intdigest() for s in entities.SYMBOLS ], dtype=np.uint64)
+    tags    = _Mix(symbols[matrix.indices] ^ matrix.data.astype(np.uint64))
+    tags    = np.concatenate([np.zeros(1, dtype=np.uint64), np.cumsum(tags, dtype=np.uint64)])
+    marks   = tags[matrix.indptr[1:]] - tags[matrix.indptr[:-1]]    ## order free sum of each row
+    dates   = pd.to_datetime(articles.CreatedDate).values.astype('datetime64[ns]').view(np.int64).astype(np.uint64)
+    marks   = _Mix(marks ^ _Mix(dates))
+    for col in columns:
+        marks = _Mix(marks ^ articles[col].values.astype(np.float64).view(np.uint64))
+    return marks
+
+#%%Class: SentimentState
+##########################################
+### SentimentState
+##########################################
+class SentimentState:
+
+    ## Initialize
+    ##########################################
+    ##   sources: name -> article score column (see SOURCES)
+    def __init__(self, path=sentiment_state, sources=SOURCES):
+        self.PATH    = path
+        self.SOURCES = dict(sources)
+        self._FILE   = os.path.join(path, 'state.npz')
+        self.Reset()
+
+    ## Empty State
+    ##############
+    def Reset(self):
+        self.IDS   = np.empty(0, dtype=np.uint64)    ## counted articles, sorted
+        self.MARKS = np.empty(0, dtype=np.uint64)    ## fingerprint of each counted article
+        self.PAIRS = pd.DataFrame({ 'Id': np.empty(0, dtype=np.uint64), 'Symbol': pd.Series([], dtype=object), 'CreatedDate': pd.DatetimeIndex([]),
+                                    **{ c: np.empty(0, dtype=float) for c in self.SOURCES.values() } })
+        index      = pd.MultiIndex.from_arrays([pd.Index([], dtype=str), pd.DatetimeIndex([])], names=['Symbol', 'CreatedDate'])
+        self.DAILY = pd.DataFrame({ (s, x): pd.Series([], dtype=(float if x == 'sum' else np.int64)) for s in self.SOURCES for x in ['sum', 'count'] }, index=index)
+
+    ## State File Exists
+    ####################
+    def Exists(self):
+        return os.path.isfile(self._FILE)
+
+    ## Read State, Empty When Missing Or Made From Other Sources
+    ############################################################
+    def Load(self):
+        self.Reset()
+        if not self.Exists():
+            return self
+        with np.load(self._FILE) as f:
+            if dict(zip(f['sources'].tolist(), f['columns'].tolist())) != self.SOURCES:
+                print('SentimentState:  Sources Changed, State Ignored')
+                return self
+            if 'pair_ids' not in f:
+                print('SentimentState:  Older Layout, State Ignored')
+                return self
+            self.IDS, self.MARKS = f['ids'], f['marks']
+            self.PAIRS = pd.DataFrame({ 'Id': f['pair_ids'], 'Symbol': f['pair_symbols'].astype(object), 'CreatedDate': pd.DatetimeIndex(f['pair_dates']),
+                                        **{ c: f['pair_{}'.format(s)] for s, c in self.SOURCES.items() } })
+            index      = pd.MultiIndex.from_arrays([f['symbols'].astype(object), pd.DatetimeIndex(f['dates'])], names=['Symbol', 'CreatedDate'])
+            self.DAILY = pd.DataFrame({ (s, x): f['{}_{}'.format(x, s)] for s in self.SOURCES for x in ['sum', 'count'] }, index=index)
+        return self
+
+    ## Counted Position And Fingerprint Of Articles
+    ###############################################
+    ##   returns (ids, fingerprints, counted with the same fingerprint)
+    def _Match(self, articles, entities):
+        ids   = ToUint64(articles.index)
+        marks = _Fingerprint(entities, articles, list(self.SOURCES.values()))
+        pos   = np.minimum(np.searchsorted(self.IDS, ids), max(len(self.IDS) - 1, 0))
+        same  = (self.IDS[pos] == ids) & (self.MARKS[pos] == marks) if len(self.IDS) > 0 else np.zeros(len(ids), dtype=bool)
+        return ids, marks, same
+
+    ## Articles To Pass To Update()
+    ###############################
+    ##   articles, entities : every article in scope (see Update)
+    ##   returns (boolean mask of articles new or changed since counted, Ids counted but no longer in scope)
+    def Changes(self, articles, entities):
+        self.Load()
+        ids, marks, same = self._Match(articles, entities)
+        removed = self.IDS[~np.isin(self.IDS, ids)]
+        print('SentimentState:  New Or Changed Articles: {}  Removed Articles: {}'.format(int((~same).sum()), len(removed)))
+        return ~same, FromUint64(removed)
+
+    ## Count New And Changed Articles, Take Out Removed Ones
+    ########################################################
+    ##   articles : DataFrame indexed by Id, CreatedDate and the score columns of SOURCES
+    ##   entities : EntityMatrix, rows in the order of articles
+    ##   removed  : Ids no longer counted
+    ##   Articles counted with the same fingerprint are skipped. Pairs of changed and removed
+    ##   articles are taken out, pairs of new and changed articles added, then every
+    ##   (symbol, day) they touch is summed again from the stored pairs.
+    ##   returns daily sums, same layout as DailySums()
+    def Update(self, articles, entities, removed=[]):
+        self.Load()
+        columns = list(self.SOURCES.values())
+        ids, marks, same = self._Match(articles, entities)
+        rows    = np.flatnonzero(~same)
+        retract = np.union1d(ToUint64(removed), ids[rows])
+        retract = retract[np.isin(retract, self.IDS)]
+        if len(rows) == 0 and len(retract) == 0:
+            print('SentimentState:  No Changes  Counted Articles: {}  Symbol Days: {}'.format(len(self.IDS), len(self.DAILY)))
+            return self.DAILY
+
+        ## Take Out Changed And Removed Articles
+        taken      = np.isin(self.PAIRS.Id.values, retract)
+        touched    = [self.PAIRS[taken]]
+        self.PAIRS = self.PAIRS[~taken]
+        kept       = ~np.isin(self.IDS, retract)
+        self.IDS, self.MARKS = self.IDS[kept], self.MARKS[kept]
+
+        ## Add New And Changed Articles
+        if len(rows) > 0:
+            added = LongEntities(entities.Rows(rows), articles.iloc[rows], columns).drop(columns=['Count'])
+            added.insert(0, 'Id', np.repeat(ids[rows], np.diff(entities.Rows(rows).MATRIX.indptr)))
+            added['Symbol'] = added.Symbol.astype(str).astype(object)
+            touched.append(added)
+            self.PAIRS = pd.concat([self.PAIRS, added], ignore_index=True)
+            order      = np.argsort(np.concatenate([self.IDS, ids[rows]]), kind='stable')
+            self.IDS   = np.concatenate([self.IDS,   ids[rows]])[order]
+            self.MARKS = np.concatenate([self.MARKS, marks[rows]])[order]
+
+        ## Sum Again Every (Symbol, Day) Touched
+        touched = pd.concat(touched)
+        touched = pd.MultiIndex.from_arrays([touched.Symbol, touched.CreatedDate]).unique()
+        pairs   = self.PAIRS[pd.MultiIndex.from_arrays([self.PAIRS.Symbol, self.PAIRS.CreatedDate]).isin(touched)]
+        delta   = DailySums(pairs, self.SOURCES)
+        delta.index = delta.index.set_levels(delta.index.levels[0].astype(str).astype(object), level='Symbol')
+        self.DAILY  = pd.concat([self.DAILY[~self.DAILY.index.isin(touched)], delta]).sort_index()
+        self._Save()
+        print('SentimentState:  New Or Changed Articles: {}  Removed Articles: {}  Counted Articles: {}  Symbol Days: {}'.format(
+              len(rows), len(retract) - int(np.isin(retract, ids[rows]).sum()), len(self.IDS), len(self.DAILY)))
+        return self.DAILY
+
+    ## Write State, Replaced Atomically
+    ###################################
+    def _Save(self):
+        os.makedirs(self.PATH, exist_ok=True)
+        arrays = { '{}_{}'.format(x, s): self.DAILY[(s, x)].values for s in self.SOURCES for x in ['sum', 'count'] }
+        pairs  = { 'pair_{}'.format(s): self.PAIRS[c].values.astype(float) for s, c in self.SOURCES.items() }
+        with open(self._FILE + '.tmp', 'wb') as f:
+            np.savez_compressed(f, ids=self.IDS, marks=self.MARKS,
+                                sources=np.array(list(self.SOURCES.keys()), dtype=str), columns=np.array(list(self.SOURCES.values()), dtype=str),
+                                symbols=self.DAILY.index.get_level_values('Symbol').values.astype(str),
+                                dates=self.DAILY.index.get_level_values('CreatedDate').values.astype('datetime64[ns]'),
+                                pair_ids=self.PAIRS.Id.values.astype(np.uint64), pair_symbols=self.PAIRS.Symbol.values.astype(str),
+                                pair_dates=self.PAIRS.CreatedDate.values.astype('datetime64[ns]'), **pairs, **arrays)
+        os.replace(self._FILE + '.tmp', self._FILE)
@@ -0,0 +1,324 @@
+#######################################################################################
+### Module: TextIndex
+### Date: 18 Oct 2026
+### Features:  - Positional inverted index over one text column of the news (Headline, Detail)
+###            - Term and phrase lookup, optional CreatedDate range filter
+###            - Incremental: every Add() writes a new segment, segments merged occasionally
+###            - Segment arrays are .npy files, memory-mapped on load
+###            - Tokens held as integer term ids against a term dictionary (UTF-8 bytes + offsets)
+###            - Merge works on postings segment by segment, position slices copied in place
+###            - Re-added article Id (eg. re-parsed) supersedes the older copy
+#######################################################################################
+
+import os
+import re
+import time
+import shutil
+import numpy as np
+import pandas as pd
+import configparser as cp
+from Modules.SeenIndex import ToUint64, FromUint64
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('../settings.cfg')
+
+## Reading File Path From Config
+text_index = config['data']['text_index']
+
+_TOKEN     = re.compile(r'\w+')
+_BREAKCODE = '<br>'
+_NO_DATE   = np.iinfo(np.int64).min   ## stored date of articles without CreatedDate
+
+## Lower Case Word Tokens, Break Code Removed
+#############################################
+def Tokenize(text):
+    if not isinstance(text, str):
+        return []
+    return _TOKEN.findall(text.replace(_BREAKCODE, ' ').lower())
+
+## Concatenated Ranges [start, start+count) As One Index Array
+##############################################################
+def _Ranges(starts, counts):
+    counts = np.asarray(counts, dtype=np.int64)
+    return np.repeat(np.asarray(starts, dtype=np.int64) - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+
+## Term Dictionary Arrays Of Sorted Terms: UTF-8 Bytes, Offsets
+###############################################################
+def _TermArrays(words):
+    data   = [ x.encode('utf-8') for x in words ]
+    starts = np.zeros(len(data) + 1, dtype=np.int64)
+    starts[1:] = np.cumsum([ len(x) for x in data ])
+    return np.frombuffer(b''.join(data), dtype=np.uint8), starts
+
+## Sort Order Of Terms In The Dictionary (UTF-8 Byte Order)
+def _TermKey(word):
+    return word.encode('utf-8')
+
+#%%Class: TextIndex
+##########################################
+### TextIndex
+##########################################
+class TextIndex:
+
+    _ARRAYS         = ['term_data', 'term_starts', 'term_offsets', 'docs', 'pos_offsets', 'positions', 'ids', 'dates']
+    _MERGE_SEGMENTS = 10    ## segments accumulated before they are merged into one
+
+    ## Initialize
+    ##########################################
+    ##   field: text column indexed, segments in <path>/<field>/seg-*
+    def __init__(self, field, path=text_index):
+        self.FIELD = field
+        self.PATH  = os.path.join(path, field)
+        self.Reload()
+
+    ## Index Has Been Built
+    #######################
+    def Exists(self):
+        return len(self._Segments()) > 0
+
+    ## Segment Folders, Oldest First
+    ################################
+    ##   segments of an older layout (no term dictionary) are ignored, the index is rebuilt
+    def _Segments(self):
+        if not os.path.isdir(self.PATH):
+            return []
+        return [ os.path.join(self.PATH, x) for x in sorted(os.listdir(self.PATH))
+                 if x.startswith('seg-') and not x.endswith('.tmp') and os.path.isfile(os.path.join(self.PATH, x, 'term_data.npy')) ]
+
+    ## Load All Segments (Memory-Mapped), Mark Articles Superseded By Newer Segments
+    ################################################################################
+    def Reload(self):
+        self._SEGMENTS = []
+        for folder in self._Segments():
+            self._SEGMENTS = self._SEGMENTS + [{ x: np.load(os.path.join(folder, x + '.npy'), mmap_mode='r') for x in self._ARRAYS }]
+        newer = np.empty(0, dtype=np.uint64)
+        for seg in reversed(self._SEGMENTS):
+            seg['live'] = ~np.isin(seg['ids'], newer)
+            newer = np.union1d(newer, seg['ids'])
+
+    ## Number Of Articles Indexed
+    #############################
+    def __len__(self):
+        return int(sum([ seg['live'].sum() for seg in self._SEGMENTS ]))
+
+    ## Index New (Or Changed) Articles
+    ##################################
+    ##   df: indexed by Id, with the field column and CreatedDate
+    def Add(self, df):
+        if len(df) == 0: return
+        self._WriteSegment(self._Build(df.index, df[self.FIELD], df.CreatedDate))
+        if len(self._Segments()) >= self._MERGE_SEGMENTS:
+            self.Merge()
+        else:
+            self.Reload()
+
+    ## Rebuild Whole Index From df
+    ##############################
+    def Build(self, df):
+        shutil.rmtree(self.PATH, ignore_errors=True)
+        self._WriteSegment(self._Build(df.index, df[self.FIELD], df.CreatedDate))
+        self.Reload()
+        print('TextIndex:  Built Index {} - Articles: {}'.format(self.FIELD, len(self)))
+
+    ## Merge All Segments Into One, Superseded Articles Dropped
+    ###########################################################
+    ##   Works on postings (term, doc), never on token rows. Segment terms are mapped to one
+    ##   merged dictionary; within a term, postings of older segments come first (docs are
+    ##   renumbered in segment order). Position slices are copied one segment at a time.
+    def Merge(self):
+        self.Reload()
+        segments = self._Segments()
+        if len(segments) <= 1: return
+
+        ## Merged Term Dictionary, Sorted Like Segment Dictionaries
+        seg_terms = [ self._Terms(seg) for seg in self._SEGMENTS ]
+        words     = sorted(set().union(*seg_terms), key=_TermKey)
+        term_id   = { x: i for i, x in enumerate(words) }
+
+        ## Live Postings Of Each Segment: Merged Term, New Doc, Position Slice
+        p_terms, p_docs, p_starts, p_counts, ids, dates = [], [], [], [], [], []
+        n_docs = 0
+        for seg, terms in zip(self._SEGMENTS, seg_terms):
+            seg_docs  = np.asarray(seg['docs'])
+            live_docs = np.flatnonzero(seg['live'])
+            renumber  = np.full(len(seg['ids']), -1, dtype=np.int64)
+            renumber[live_docs] = np.arange(len(live_docs)) + n_docs
+            keep      = seg['live'][seg_docs]
+            p_terms   = p_terms  + [np.repeat(np.array([ term_id[x] for x in terms ], dtype=np.int64), np.diff(seg['term_offsets']))[keep]]
+            p_docs    = p_docs   + [renumber[seg_docs[keep]]]
+            p_starts  = p_starts + [np.asarray(seg['pos_offsets'][:-1])[keep]]
+            p_counts  = p_counts + [np.diff(seg['pos_offsets'])[keep]]
+            ids       = ids      + [np.asarray(seg['ids'])[live_docs]]
+            dates     = dates    + [np.asarray(seg['dates'])[live_docs]]
+            n_docs    = n_docs + len(live_docs)
+
+        ## Postings By Merged Term, Segment Order Kept Within A Term (Stable)
+        ##   terms with no live posting left are dropped from the dictionary
+        terms   = np.concatenate(p_terms)
+        present = np.zeros(len(words), dtype=bool)
+        present[terms] = True
+        terms   = (np.cumsum(present) - 1)[terms]
+        words   = [ x for x, k in zip(words, present) if k ]
+        order   = np.argsort(terms, kind='stable')
+        counts  = np.concatenate(p_counts)[order]
+        pos_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+        pos_offsets[1:] = np.cumsum(counts)
+        target  = np.empty(len(order), dtype=np.int64)    ## first output position of each posting
+        target[order] = pos_offsets[:-1]
+
+        ## Position Slices Copied Segment By Segment
+        positions = np.empty(pos_offsets[-1], dtype=np.uint32)
+        done = 0
+        for seg, starts, seg_counts in zip(self._SEGMENTS, p_starts, p_counts):
+            positions[_Ranges(target[done : done+len(starts)], seg_counts)] = np.asarray(seg['positions'])[_Ranges(starts, seg_counts)]
+            done = done + len(starts)
+
+        term_data, term_starts = _TermArrays(words)
+        arrays = {'term_data':    term_data,
+                  'term_starts':  term_starts,
+                  'term_offsets': np.searchsorted(terms[order], np.arange(len(words) + 1)).astype(np.int64),
+                  'docs':         np.concatenate(p_docs)[order].astype(np.uint32),
+                  'pos_offsets':  pos_offsets,
+                  'positions':    positions,
+                  'ids':          np.concatenate(ids).astype(np.uint64),
+                  'dates':        np.concatenate(dates).astype(np.int64)}
+        self._SEGMENTS = []    ## release memory maps before removing
+        self._WriteSegment(arrays)
+        for folder in segments:
+            shutil.rmtree(folder)
+        self.Reload()
+        print('TextIndex:  Merged Segments {}: {}, Articles: {}'.format(self.FIELD, len(segments), n_docs))
+
+    ## Articles Containing A Term Or Phrase
+    #######################################
+    ##   query     : one or more words, more than one word is matched as a phrase
+    ##   date_from : inclusive, date_to: inclusive (whole day when date only)
+    ##   returns array of Ids
+    def Search(self, query, date_from=None, date_to=None):
+        tokens = Tokenize(query)
+        if len(tokens) == 0:
+            return np.empty(0, dtype=object)
+        date_from = pd.Timestamp(date_from).value if date_from is not None else None
+        if date_to is not None:
+            date_to = pd.Timestamp(date_to)
+            if date_to == date_to.normalize(): date_to = date_to + pd.Timedelta(days=1) - pd.Timedelta(1)
+            date_to = date_to.value
+
+        found = []
+        for seg in self._SEGMENTS:
+            docs = self._Phrase(seg, tokens)
+            docs = docs[seg['live'][docs]]
+            if date_from is not None: docs = docs[(seg['dates'][docs] >= date_from) & (seg['dates'][docs] != _NO_DATE)]
+            if date_to   is not None: docs = docs[(seg['dates'][docs] <= date_to)   & (seg['dates'][docs] != _NO_DATE)]
+            found = found + [np.asarray(seg['ids'])[docs]]
+        if len(found) == 0:
+            return np.empty(0, dtype=object)
+        return FromUint64(np.unique(np.concatenate(found)))
+
+    ## Local Docs Of A Segment Containing The Token Sequence
+    ########################################################
+    def _Phrase(self, seg, tokens):
+        ## Posting Range Of Each Token, Rarest First To Intersect Quickly
+        ranges = []
+        for token in tokens:
+            i = self._TermId(seg, token)
+            if i < 0:
+                return np.empty(0, dtype=np.int64)
+            ranges = ranges + [(seg['term_offsets'][i], seg['term_offsets'][i+1])]
+        docs = None
+        for start, end in sorted(set(ranges), key=lambda x: x[1] - x[0]):
+            docs = np.asarray(seg['docs'][start:end]) if docs is None else np.intersect1d(docs, seg['docs'][start:end], assume_unique=True)
+        docs = docs.astype(np.int64)
+        if len(tokens) == 1 or len(docs) == 0:
+            return docs
+
+        ## Verify Token Positions: Some Start p Where Token k Is At p+k
+        ##   (doc, p) pairs of every candidate doc packed in one int64 key, intersected per token
+        starts = None
+        for k, (start, end) in enumerate(ranges):
+            j      = start + np.searchsorted(seg['docs'][start:end], docs)
+            first  = np.asarray(seg['pos_offsets'][j])
+            counts = np.asarray(seg['pos_offsets'][j+1]) - first
+            rows   = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            pos    = np.asarray(seg['positions'][rows]).astype(np.int64) - k
+            keys   = (np.repeat(docs, counts) << 32) + pos
+            keys   = keys[pos >= 0]
+            starts = keys if starts is None else np.intersect1d(starts, keys, assume_unique=True)
+            if len(starts) == 0: break
+        return np.unique(starts >> 32)
+
+    ## Term Id Of A Token In A Segment Dictionary, -1 When Absent
+    ##############################################################
+    ##   binary search over the UTF-8 term bytes
+    def _TermId(self, seg, token):
+        key, data, starts = _TermKey(token), seg['term_data'], seg['term_starts']
+        lo, hi = 0, len(starts) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if data[starts[mid]:starts[mid+1]].tobytes() < key: lo = mid + 1
+            else: hi = mid
+        if lo < len(starts) - 1 and data[starts[lo]:starts[lo+1]].tobytes() == key:
+            return lo
+        return -1
+
+    ## Terms Of A Segment Dictionary, In Order
+    ##########################################
+    def _Terms(self, seg):
+        data, starts = np.asarray(seg['term_data']).tobytes(), np.asarray(seg['term_starts'])
+        return [ data[starts[i]:starts[i+1]].decode('utf-8') for i in range(len(starts) - 1) ]
+
+    ## Build Segment Arrays From Texts
+    ##################################
+    ##   every token becomes an int32 term id of the segment dictionary (first seen order),
+    ##   renumbered in dictionary order once all texts are read
+    def _Build(self, ids, texts, dates):
+        vocab, terms = {}, []
+        for text in texts:
+            tokens = Tokenize(text)
+            terms.append(np.fromiter([ vocab.setdefault(x, len(vocab)) for x in tokens ], dtype=np.int32, count=len(tokens)))
+        lengths = np.array([ len(x) for x in terms ], dtype=np.int64)
+        terms   = np.concatenate(terms) if len(terms) > 0 else np.empty(0, dtype=np.int32)
+        docs    = np.repeat(np.arange(len(lengths)), lengths)
+        positions = np.arange(len(terms)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+        ## Dictionary Order: Sorted Terms, Token Term Ids Renumbered
+        words   = list(vocab)
+        order   = sorted(range(len(words)), key=lambda i: _TermKey(words[i]))
+        rank    = np.empty(len(words), dtype=np.int32)
+        rank[order] = np.arange(len(words), dtype=np.int32)
+        dates = pd.to_datetime(pd.Series(list(dates)))
+        dates = np.where(dates.isna(), _NO_DATE, dates.values.astype('datetime64[ns]').astype(np.int64))
+        return self._Arrays([ words[i] for i in order ], rank[terms], docs, positions, ToUint64(ids), dates.astype(np.int64))
+
+    ## Sort Token Rows Into Postings: Term -> Docs -> Positions
+    ###########################################################
+    ##   words: sorted dictionary, term_ids: per token, tokens in (doc, position) order
+    def _Arrays(self, words, term_ids, docs, positions, ids, dates):
+        order      = np.argsort(term_ids, kind='stable')    ## docs, positions stay ascending within a term
+        term_ids   = term_ids[order]
+        docs       = docs[order]
+        positions  = positions[order]
+        ## one posting per (term, doc)
+        first      = np.ones(len(order), dtype=bool)
+        first[1:]  = (term_ids[1:] != term_ids[:-1]) | (docs[1:] != docs[:-1])
+        posting_at = np.flatnonzero(first)
+        term_data, term_starts = _TermArrays(words)
+        return {'term_data':    term_data,
+                'term_starts':  term_starts,
+                'term_offsets': np.searchsorted(term_ids[posting_at], np.arange(len(words) + 1)).astype(np.int64),
+                'docs':         docs[posting_at].astype(np.uint32),
+                'pos_offsets':  np.append(posting_at, len(order)).astype(np.int64),
+                'positions':    positions.astype(np.uint32),
+                'ids':          ids.astype(np.uint64),
+                'dates':        dates.astype(np.int64)}
+
+    ## Write Segment Folder, Renamed Into Place Once Complete
+    #########################################################
+    def _WriteSegment(self, arrays):
+        folder = os.path.join(self.PATH, 'seg-{:020d}-{}'.format(time.time_ns(), os.getpid()))
+        os.makedirs(folder + '.tmp', exist_ok=True)
+        for name in self._ARRAYS:
+            np.save(os.path.join(folder + '.tmp', name + '.npy'), arrays[name])
+        os.replace(folder + '.tmp', folder)
+        return folder
@@ -0,0 +1,68 @@
+## Author: : Project Contributors
+## Date: 2026-10-18
+##
+## Benchmark Article Parser Backends (ArticleParsers) Over The Stored HTML Fixtures
+## Fixtures: html_fixtures folder (tests/fixtures/html), index.json (Name, Source, Link) plus <Name>.html
+## Same corpus as tests/test_article_parsers.py, every backend must give the same article as 'soup'
+## The fixtures are SYNTHETIC pages, not saved articles: TheStar/TheEdge markup the parsers look for,
+## generated filler text and ~30 KB of placeholder script per page. Timings show the relative cost
+## of the backends, re-measure on pages from HtmlCache before quoting throughput of real articles.
+##
+## Recorded Result (14 synthetic pages, ~35 KB each, 20 passes, 3 runs, Python 3.11, lxml 6.1, bs4 4.15):
+##   soup  : 0.39 - 0.44s per pass,  32 -  36 pages/sec
+##   lxml  : 0.027 - 0.033s per pass, 420 - 525 pages/sec  -> Speedup 13.2x - 14.9x, Mismatched Pages: 0 / 14
+
+## Load Common Libraries
+import sys
+import os
+import json
+import time
+import configparser as cp
+
+## Load Custom Modules
+sys.path.insert(0, 'Modules')
+from   Modules.ArticleParsers import PARSERS, ParseArticle
+
+## Change Directory to Project Root
+os.chdir('../')
+
+## Reading Directory Path From Config
+config = cp.ConfigParser()
+config.read('settings.cfg')
+html_fixtures = config['data']['html_fixtures']
+
+repeat = 20     ## timing repetitions per backend
+
+#%% Load Fixtures
+
+with open(os.path.join(html_fixtures, 'index.json')) as f:
+    fixtures = json.load(f)
+pages = {}
+for x in fixtures:
+    with open(os.path.join(html_fixtures, x['Name']+'.html'), 'rb') as f:
+        pages[x['Name']] = f.read()
+print('Loaded Fixtures: {}  ({:.1f} MB)'.format(len(pages), sum([ len(x) for x in pages.values() ])/1e6))
+
+## Parse All Fixtures With One Backend
+def parse_all(parser):
+    return { x['Name']: ParseArticle(x['Source'], x['Link'], pages[x['Name']], parser=parser) for x in fixtures }
+
+#%% Benchmark
+
+timings = {}
+results = {}
+for name in PARSERS:
+    start_time = time.time()
+    for i in range(repeat):
+        results[name] = parse_all(name)
+    timings[name] = (time.time() - start_time) / repeat
+    print('{:<6}: {:.3f}s per pass, {:.0f} pages/sec'.format(name, timings[name], len(pages)/timings[name]))
+
+#%% Compare Extracted Articles Against Reference ('soup')
+
+for name in PARSERS:
+    if name == 'soup': continue
+    mismatches = [ x for x in results['soup'] if results['soup'][x] != results[name][x] ]
+    print('{:<6}: Speedup {:.1f}x,  Mismatched Pages: {} / {}'.format(name, timings['soup']/timings[name], len(mismatches), len(pages)))
+    for x in mismatches[:10]:
+        print('    ', x)
@@ -5,81 +5,131 @@
 ## Clean the data (remove chinese, repalce NA)
 ## And generate variousNLP features
 ## Save Output To Local File
-## Entire process takes approx. 4 hours
+## Incremental: only new articles (and symbols with changed keywords) are tagged,
+## entities matched once per Detail text and copied to its exact duplicates
+## Articles new or changed since counted by phase3 (SentimentState) saved as a delta, phase3 reads only that
 
 ## Load Common Libraries
 import sys
+import numpy    as np
 import pandas   as pd
 import configparser as cp
+from   xxhash   import xxh64 as hasher
 
 ## Load Custom Modules
 sys.path.insert(0, 'Modules')
 from   Modules.NewsDatabase import NewsDatabase
+from   Modules.FeatureStore import FeatureStore
+from   Modules.EntityMatcher import InstrumentKeywords, ListingKeywords
+from   Modules.EntityIndex   import EntityIndex
+from   Modules.SentimentScores import CombinedScores
+from   Modules.SentimentState  import SentimentState
 
 ## Change Directory to Project Root
 import os
 os.chdir('../')
 
-#%% Loading News
-print('Loading News Database...')
-
-news           = NewsDatabase().NEWS_DF.loc[:, ['CreatedDate','Headline','Detail','Source']]    
-news_sentiment = pd.read_csv('data/phase1_news_sentiment.csv', index_col=0)
-
-## Filter out empty news and after 2010
-empty_mask = ((news.Detail=='') | (news.Headline==''))
-news = news.loc[ ~empty_mask, : ].query('CreatedDate>="2010-01-01"')
-news['CreatedDate'] = news.CreatedDate.dt.floor(freq='D')
-news = news.sort_values('CreatedDate')
-
-## Merge News and News Sentiment
-news           = news.merge(news_sentiment, left_index=True, right_index=True)
-
-## Define Symbols In Scope
-fsi_symbols   = ['MBBM.KL', 'PUBM.KL', 'CIMB.KL', 'HLBB.KL', 'RHBC.KL', 'HLCB.KL', 'AMMB.KL', 'BIMB.KL', 'LOND.KL', 'MBSS.KL']
-telco_symbols = ['MXSC.KL', 'DSOM.KL', 'AXIA.KL', 'TLMM.KL', 'ASTR.KL', 'TCOM.KL', 'GRNP.KL', 'OCKG.KL', 'MDCH.KL', 'STAR.KL']
-all_symbols   = fsi_symbols + telco_symbols + ['FSI_INDEX','TELCO_INDEX']
-
-#%% Loading Instruments
-
-print('Loading Instruments Database...')
-
-## Reading Directory Path From Config
-config = cp.ConfigParser()
-config.read('settings.cfg')
-instruments_file = config['data']['instruments_file']
-instruments_df   = pd.read_excel(instruments_file, index_col=None)\
-                   .query('SECTOR_TOPN<=10')
-
-#%% Construct News Entity Assignment
-print('Matching Articles To Symbols...')
-
-## Loop for Each Symbol, Assign to Related Symbol
-for idx, row in instruments_df.iterrows():
-    ## Initialize Mask with All False, assume no match are found
-    mask = pd.Series (data = [False] * len(news), index=news.index)
-    ## Construct All Possible Keywords For This Instrument
-    keywords = [ x.strip() for x in row.KEYWORDS.split(',')]
-    keywords = keywords + [row.RIC, row.YAHOO, row.CODE, row.SYMBOL, row.NAME]
-    ## Let's Go Find Each Keyword
-    print ('... Keywords: ', keywords)
-    for kw in keywords:    
-        mask = mask | news.Detail.str.contains(kw, regex=False)
-    ## Creat The Symbol Column
-    news[row.RIC] = mask
-
-## Create Sector Index Column
-news['FSI_INDEX']   = news.loc[:, fsi_symbols]  .sum(axis=1)>0
-news['TELCO_INDEX'] = news.loc[:, telco_symbols].sum(axis=1)>0
-entity_mask    = news.FSI_INDEX | news.TELCO_INDEX
-overlap_mask   = news.FSI_INDEX & news.TELCO_INDEX
-
-## Filter To Scope, Merge With Sentiment
-news_entity_sentiment = news.loc[entity_mask, :]
-
-## Save
-print('Saving Result To Local File...')
-news_entity_sentiment.to_csv('data/phase2_news_entity_sentiment.csv')
+## Entity tagging runs on a process pool, one chunk of articles per task
+workers = os.cpu_count()
+
+## Symbols Tagged: 'instruments' (instruments.xlsx) or 'listing' (whole LISTING_DF, instruments.xlsx keywords kept)
+universe = 'instruments'
+
+## Count Each Story Once In phase3 Scores: Only The Earliest Article Of A Duplicate Cluster
+count_once = False
+
+## Worker processes re-import this script, only the main process loads and runs
+if __name__ == '__main__':
+
+    #%% Loading News
+    print('Loading News Database...')
+
+    ## Only news from 2010 are read from storage
+    ndb            = NewsDatabase(load=False)
+    news           = ndb.Query(date_from='2010-01-01', columns=['CreatedDate','Headline','Detail','Source'])
+    news_sentiment = FeatureStore().Load()                                         ## phase1 features, latest per article
+
+    ## Filter out empty news (Missing Text Read As NaN From CSV, Null From NewsStore)
+    news['Detail']   = news.Detail.fillna('')
+    news['Headline'] = news.Headline.fillna('')
+    empty_mask = ((news.Detail=='') | (news.Headline==''))
+    news = news.loc[ ~empty_mask, : ]
+    news['CreatedDate'] = news.CreatedDate.dt.floor(freq='D')
+    news = news.sort_values('CreatedDate')
+
+    ## Merge News and News Sentiment
+    news           = news.merge(news_sentiment, left_index=True, right_index=True)
+
+    ## Duplicate Cluster Of Every Article (phase3 Counts Each Story Once)
+    news['Cluster'] = ndb.DuplicateClusters(news.index)
+
+    ## Exact Duplicates (Same Detail): Entities Matched Once, On The Earliest Article With The Detail
+    detail_hash = np.array([ hasher(x).intdigest() for x in news.Detail ], dtype=np.uint64)
+    lead_mask   = ~pd.Series(detail_hash).duplicated().values
+    lead_news   = news[lead_mask]
+
+    ## Define Symbols In Scope
+    fsi_symbols   = ['MBBM.KL', 'PUBM.KL', 'CIMB.KL', 'HLBB.KL', 'RHBC.KL', 'HLCB.KL', 'AMMB.KL', 'BIMB.KL', 'LOND.KL', 'MBSS.KL']
+    telco_symbols = ['MXSC.KL', 'DSOM.KL', 'AXIA.KL', 'TLMM.KL', 'ASTR.KL', 'TCOM.KL', 'GRNP.KL', 'OCKG.KL', 'MDCH.KL', 'STAR.KL']
+    all_symbols   = fsi_symbols + telco_symbols + ['FSI_INDEX','TELCO_INDEX']
+
+    #%% Loading Instruments
+
+    print('Loading Instruments Database...')
+
+    ## Reading Directory Path From Config
+    config = cp.ConfigParser()
+    config.read('settings.cfg')
+    instruments_file = config['data']['instruments_file']
+    listing_file     = config['data']['listing_db']
+
+    ## Keywords Of Every Symbol, Only Read When The Files Changed (Matcher Cached By EntityIndex)
+    def symbol_keywords():
+        instruments_df = pd.read_excel(instruments_file, index_col=None)\
+                         .query('SECTOR_TOPN<=10')
+        keywords       = InstrumentKeywords(instruments_df)
+        if universe == 'listing':
+            listing_df = pd.read_csv(listing_file, index_col=0)
+            keywords   = { **ListingKeywords(listing_df), **keywords }
+        return keywords
+
+    #%% Construct News Entity Assignment
+    print('Matching Articles To Symbols...')
+
+    ## All Keywords Of All Instruments In One Automaton, Every Article Scanned Once (EntityMatcher)
+    entity_index = EntityIndex()
+    matcher      = entity_index.Matcher([instruments_file] + ([listing_file] if universe == 'listing' else []), symbol_keywords, key='SECTOR_TOPN<=10 ' + universe)
+    print('... Symbols: {}  Keywords: {}'.format(len(matcher.SYMBOLS), sum([ len(x) for x in matcher.KEYWORDS.values() ])))
+
+    ## Incremental: Only New Articles And Symbols With Changed Keywords Are Scanned
+    lead_entities = entity_index.Update(lead_news.Detail, matcher, workers=workers)
+
+    ## Article x Symbol Match Counts, Same For Every Article With The Same Detail
+    lead_rows = pd.Series(np.arange(len(lead_news)), index=detail_hash[lead_mask]).loc[detail_hash].values
+    entities  = lead_entities.Rows(lead_rows, news.index)
+
+    ## Create Sector Index Column
+    entities.AddGroup('FSI_INDEX',   fsi_symbols)
+    entities.AddGroup('TELCO_INDEX', telco_symbols)
+    entity_mask    = entities.Any()
+    overlap_mask   = entities.Any(['FSI_INDEX']) & entities.Any(['TELCO_INDEX'])
+
+    ## Filter To Scope, Merge With Sentiment (Article Text Not Kept)
+    entities              = entities.Rows(np.flatnonzero(entity_mask))
+    news_entity_sentiment = CombinedScores(news.loc[entity_mask, :].drop(columns=['Headline','Detail']))
+
+    ## Save: Entity Matrix (Rows In The Order Of The CSV) And Article Sentiment
+    print('Saving Result To Local File...')
+    entities.Save('data/phase2_entity_matrix.npz')
+    news_entity_sentiment.to_csv('data/phase2_news_entity_sentiment.csv')
+
+    #%% Delta For phase3: Counted Articles New Or Changed Since Last Counted, And Those No Longer Counted
+    counted_mask = ~news_entity_sentiment.Cluster.duplicated().values if count_once else np.ones(len(news_entity_sentiment), dtype=bool)
+    counted      = np.flatnonzero(counted_mask)
+    changed_mask, removed = SentimentState().Changes(news_entity_sentiment.iloc[counted], entities.Rows(counted))
+    entities.Rows(counted[changed_mask]).Save('data/phase2_delta_entity_matrix.npz')
+    news_entity_sentiment.iloc[counted[changed_mask]].to_csv('data/phase2_delta_news_entity_sentiment.csv')
+    pd.Series(removed, name='Id').to_csv('data/phase2_delta_removed.csv', index=False)
 
 #%% Reporting
 
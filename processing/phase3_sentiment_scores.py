@@ -3,36 +3,45 @@
 ##
 ## Merge Sentiment (Phase1) and Entity (Phase2) DataFrame Together 
 ## Then Construct Sentiment Scores per Symbol
+## Daily mean, count, sum and exponentially weighted scores of WN and TB, all symbols in one pass
+## Daily sums kept in SentimentState, only the phase2 delta (articles new or changed since counted,
+## and those no longer counted) is read and applied
 
+import sys
 import pandas   as pd
 import os
+
+## Load Custom Modules
+sys.path.insert(0, 'Modules')
+from   Modules.EntityMatrix import EntityMatrix
+from   Modules.SentimentScores import DailyScores, WideScores, AGGREGATORS
+from   Modules.SentimentState  import SentimentState
+
 os.chdir('../')
 
-## Load Previously Processed Data
-news_entity_sentiment = pd.read_csv('data/phase2_news_entity_sentiment.csv', index_col=0)  ## From Phase 1
+## Half-Life (Days) Of The Exponentially Weighted Score
+ewm_halflife = 5
+
+## Load Delta Of Phase 2 (Count Each Story Once: See count_once In Phase 2)
+delta_sentiment = pd.read_csv('data/phase2_delta_news_entity_sentiment.csv', index_col=0, dtype={'Id': str})  ## Phase 1 features and combined scores
+delta_entities  = EntityMatrix().Load('data/phase2_delta_entity_matrix.npz')                              ## rows in the order of the CSV
+removed_ids     = pd.read_csv('data/phase2_delta_removed.csv', dtype=str).Id
 
 ## Define Symbols In Scope
 fsi_symbols   = ['MBBM.KL', 'PUBM.KL', 'CIMB.KL', 'HLBB.KL', 'RHBC.KL', 'HLCB.KL', 'AMMB.KL', 'BIMB.KL', 'LOND.KL', 'MBSS.KL']
 telco_symbols = ['MXSC.KL', 'DSOM.KL', 'AXIA.KL', 'TLMM.KL', 'ASTR.KL', 'TCOM.KL', 'GRNP.KL', 'OCKG.KL', 'MDCH.KL', 'STAR.KL']
 all_symbols   = fsi_symbols + telco_symbols + ['FSI_INDEX','TELCO_INDEX']
 
-#%% Merge News Entity and Sentiment Together
-    
-## Create Combined Headline & Detail Sentiment Score
-news_entity_sentiment['Combined_WN_Sentiment'] = round( (news_entity_sentiment.Headline_WN_Sentiment + news_entity_sentiment.Detail_WN_Sentiment)/2, 2)
-news_entity_sentiment['Combined_TB_Polarity']  = round( (news_entity_sentiment.Headline_TB_Polarity  + news_entity_sentiment.Detail_TB_Polarity) /2, 2)
+#%% Update Daily Sums
 
-## Construct Per Symbol Final Sentiment Score
-sentiment_scores = pd.DataFrame()
-for sym in all_symbols:
-    temp_df = news_entity_sentiment.loc[news_entity_sentiment[sym], ['Combined_WN_Sentiment', 'CreatedDate']]
-    temp_df = temp_df.groupby('CreatedDate').mean()
-    temp_df.rename(columns={'Combined_WN_Sentiment':sym}, inplace=True)
-    sentiment_scores = pd.concat([sentiment_scores, temp_df], axis=1)
+## Daily Sums Per (Symbol, Day): Delta Applied To The Stored State
+daily_sums   = SentimentState().Update(delta_sentiment, delta_entities, removed_ids)
+daily_scores = DailyScores(daily_sums, aggregators=AGGREGATORS, halflife=ewm_halflife)
 
-## Sort By Date Index
-sentiment_scores = sentiment_scores.sort_index()  
+## Construct Per Symbol Final Sentiment Score (WN Daily Mean), Sorted By Date Index
+sentiment_scores = WideScores(daily_scores, source='WN', aggregator='mean', symbols=all_symbols)
 
-## Save To File
+## Save To File: Final Score, And Every Source / Aggregator In Long Format
 sentiment_scores.to_csv('data/phase3_sentiment_scores.csv')
+daily_scores.to_csv('data/phase3_sentiment_daily.csv')
 print('Sentiment Scores Generated')
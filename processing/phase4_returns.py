@@ -2,11 +2,13 @@
 ## Date: 2020-04-30
 ##
 ## Calculate Index Price For FS and TELCO
-## Build Returns for RD00 to RD05
+## Build Returns for RD00 to RD05, all symbols and horizons at once (PriceArray)
 
 import sys
 sys.path.insert(0, 'Modules')
 from Modules.EikonDatabase import EikonDatabase
+from Modules.PriceArray import PriceArray, ForwardReturns
+import numpy as np
 import pandas as pd
 
 ## Change Directory to Project Root
@@ -26,47 +28,29 @@ eik = EikonDatabase()
 date_from   = '2010-01-01'  # Last 10 years
 date_to     = '2020-01-08'  # Overshot 8 days into 2020
 
-### Construct FSI INDEX
-fsi = eik.GetFinancialByColumns (
-        symbols = fsi_symbols, 
-        columns=['OPENPRICE','CLOSEPRICE','MARKETCAP'],
+### Construct FSI And TELCO INDEX: Market Cap Weighted, Both Groups In One Pass (Cached)
+sector_index = eik.GetGroupIndex(
+        groups = {'FSI_INDEX': fsi_symbols, 'TELCO_INDEX': telco_symbols},
+        columns=['OPENPRICE','CLOSEPRICE'], weighting='cap',
         date_from=date_from, date_to=date_to)
 
-fsi_mcap_weight = fsi.MARKETCAP.div(fsi.MARKETCAP.sum(axis=1), axis=0)
-fsi_open  = (fsi.OPENPRICE * fsi_mcap_weight).sum(axis=1)
-fsi_close = (fsi.CLOSEPRICE * fsi_mcap_weight).sum(axis=1)
-fsi_index = pd.concat([fsi_open, fsi_close], axis=1)
-fsi_index.columns = [('FSI_INDEX','OPENPRICE'), ('FSI_INDEX','CLOSEPRICE')]
-
-### Construct TELCO INDEX
-telco = eik.GetFinancialByColumns (
-        symbols = telco_symbols, 
-        columns=['OPENPRICE','CLOSEPRICE','MARKETCAP'], 
-        date_from=date_from, date_to=date_to)
-
-telco_mcap_weight = telco.MARKETCAP.div(telco.MARKETCAP.sum(axis=1), axis=0)
-telco_open  = (telco.OPENPRICE * telco_mcap_weight).sum(axis=1)
-telco_close = (telco.CLOSEPRICE * telco_mcap_weight).sum(axis=1)
-telco_index = pd.concat([telco_open, telco_close], axis=1)
-telco_index.columns = [('TELCO_INDEX','OPENPRICE'), ('TELCO_INDEX','CLOSEPRICE')]
-
 ## Combine FSI and Telco Index Price into DataFrame
 returns = eik.GetFinancialBySymbols(
         symbols = all_symbols, 
         columns=['OPENPRICE','CLOSEPRICE','MARKETCAP'], 
         date_from=date_from, date_to=date_to)
 
-returns = pd.concat([returns, fsi_index, telco_index], axis=1)
+returns = pd.concat([returns, sector_index], axis=1)
 
 #%% Create Return Columns
 
-future_days = 5
+future_days   = 5
+return_method = 'simple'   # 'simple' or 'log'
 
-## Create Future Return Columns into Each Symbol (Percentage)
-for sym in all_symbols + ['FSI_INDEX', 'TELCO_INDEX']:
-    temp_df = returns.loc[ :, sym ]
-    for i in range (0,future_days+1):
-        returns[sym, 'RD{:02d}'.format(i)] = ((temp_df.CLOSEPRICE.shift(-1*i) - temp_df.OPENPRICE) / temp_df.OPENPRICE)*100
+## Create Future Return Columns For Every Symbol And Horizon In One Pass (Percentage)
+prices  = PriceArray().FromFrame(returns, symbols=all_symbols, fields=['OPENPRICE','CLOSEPRICE'])
+rd      = ForwardReturns(prices, horizons=range(0,future_days+1), method=return_method, dtype=np.float64)
+returns = pd.concat([returns, rd.ToFrame()], axis=1)
 
 ## Sort On Symbol Name (Level 0)
 returns = returns.sort_index(axis=1, level=0).round(2)\
@@ -7,7 +7,7 @@
 ## Calcualte Accuracy, Precision, Recall and F1 Means
 ## Average Metric
 ## Evaluate Model Performance 
-## Process will take about 20m
+## Grid search confusion matrices counted in bulk (GridSearch), takes seconds
 
 ### Import Remaining Library
 import pandas as pd
@@ -15,7 +15,9 @@ from numpy import arange
 import time 
 
 ## Evaluation
-from sklearn.metrics import confusion_matrix
+import sys
+sys.path.insert(0, 'Modules')
+from Modules.GridSearch import GridSearch, DirectionLabels
 
 # Change Directory to Project Root
 import os
@@ -54,88 +56,26 @@ return_cols = ['RD00','RD01','RD02','RD03','RD04','RD05']
 
 #%% Create Labels
 
-def ReturnDirection(num, th=0.5):
-    if pd.isna(num):   return num
-    elif num > th:     return 'UP'
-    elif num < -1*th:  return 'DOWN'
-    else:              return 'STAY'
-    
-returns_dir       = returns_df.loc[:,    (slice(None), ('RD00','RD01','RD02','RD03','RD04','RD05'))].applymap(ReturnDirection)
+## Return Direction: UP (> 0.5%), DOWN (< -0.5%), STAY Otherwise
+returns_dir       = DirectionLabels(returns_df.loc[:, (slice(None), ('RD00','RD01','RD02','RD03','RD04','RD05'))], th=0.5)
 fsi_returns_dir   = returns_dir[fsi_symbols_index]
 telco_returns_dir = returns_dir[telco_symbols_index]
 
 #%% Prediction Modeling Through Grid Search
 
+## Sentiment Direction: UP (> center + threshold), DOWN (< center - threshold), STAY Otherwise
 ## senti_score is within range of 0 to 1
-def SentiDirection(senti_score, th, center):
-    upper_boundary = center + th
-    lower_boundary = center - th
-    if pd.isna(senti_score): return senti_score
-    elif senti_score > upper_boundary: return 'UP'
-    elif senti_score < lower_boundary: return 'DOWN'
-    else:                              return 'STAY'
-
-def cm_eval(actual, predicted):
-    result = confusion_matrix(actual, predict)
-    ACCURACY       = (result[0,0] + result[1,1] + result[2,2])/ result.sum()
-    DOWN_PRECISION =  result[0,0] / (result[0,0] + result[1,0] + result[2,0])
-    DOWN_RECALL    =  result[0,0] / (result[0,0] + result[0,1] + result[0,2])
-    STAY_PRECISION =  result[1,1] / (result[0,1] + result[1,1] + result[2,1])
-    STAY_RECALL    =  result[1,1] / (result[1,0] + result[1,1] + result[1,2])
-    UP_PRECISION   =  result[2,2] / (result[0,2] + result[1,2] + result[2,2])
-    UP_RECALL      =  result[2,2] / (result[2,0] + result[2,1] + result[2,2])
-    DOWN_F1        =  2* (DOWN_PRECISION*DOWN_RECALL) / (DOWN_PRECISION+DOWN_RECALL)
-    STAY_F1        =  2* (STAY_PRECISION*STAY_RECALL) / (STAY_PRECISION+STAY_RECALL)
-    UP_F1          =  2* (UP_PRECISION*UP_RECALL) / (UP_PRECISION+UP_RECALL)
-    return ACCURACY.round(3), DOWN_PRECISION.round(3), DOWN_RECALL.round(3), \
-           STAY_PRECISION.round(3), STAY_RECALL.round(3), UP_PRECISION.round(3), UP_RECALL.round(3),\
-           DOWN_F1.round(3), STAY_F1.round(3), UP_F1.round(3)
-
-## Grid Search
 centers    = arange(0.1, 1.0, 0.1)  ## From 0.1 to 0.9
 thresholds = arange(0.01, 1.0, 0.01)  ## From 0.01 to 0.99
 
-result = []
+## Sector Of Every Symbol
+sectors = { sym: 'FS' if sym in fsi_symbols else 'TELCO' if sym in telco_symbols else 'FS_INDEX' if sym=='FSI_INDEX' else 'TELCO_INDEX' for sym in all_symbols }
+
+## Confusion Matrix Of Every Center, Threshold, Symbol And Return Column In One Pass
 start_time = time.time()
-## For Every Centers
-for c in centers.tolist():
-    ## For Every Threshold
-    for t in thresholds.tolist():
-        PARAM = 'C%.2f'%c + '-T%.2f'%t
-        CENTER = c
-        THRESHOLD = t
-        print('Processing Model: ', PARAM)
-        sentiment_dir = sentiment_df.applymap(lambda x: SentiDirection(senti_score=x, th=t, center=c))
-        ## For Every Symbols
-        for sym in all_symbols:
-            for col in return_cols:
-                actual    = returns_dir[sym][col]
-                predicted = sentiment_dir[sym]
-                if sym in fsi_symbols:
-                    SECTOR = 'FS'
-                if sym in telco_symbols:
-                    SECTOR = 'TELCO'
-                if sym in ['FSI_INDEX']:
-                    SECTOR = 'FS_INDEX'
-                if sym in ['TELCO_INDEX']:
-                    SECTOR = 'TELCO_INDEX'
-                model    = pd.concat([actual, predicted], axis=1).dropna()
-                actual   = model.iloc[:,0]
-                predict  = model.iloc[:,1]
-                ACCURACY, DOWN_PRECISION, DOWN_RECALL, STAY_PRECISION, STAY_RECALL, UP_PRECISION, UP_RECALL, DOWN_F1, STAY_F1, UP_F1 = cm_eval( actual, predict)
-                result_dict  = { 
-                    'PARAM'  : PARAM, 'CENTER': c, 'THRESHOLD':t,
-                    'SYMBOL' : sym, 'SECTOR': SECTOR,
-                    'MODEL': col,     'ACCURACY':    ACCURACY, 
-                    'DOWN_PRECISION': DOWN_PRECISION, 'DOWN_RECALL': DOWN_RECALL,
-                    'STAY_PRECISION': STAY_PRECISION, 'STAY_RECALL': STAY_RECALL, 
-                    'UP_PRECISION':   UP_PRECISION,   'UP_RECALL':   UP_RECALL,
-                    'DOWN_F1':        DOWN_F1,  'STAY_F1': STAY_F1, 'UP_F1': UP_F1}
-                result = result + [result_dict]
-                
+complete_result = GridSearch(sentiment_df, returns_df, sectors, return_cols, centers.tolist(), thresholds.tolist())
 print("--- Grid Search Parameters Took: %s minutes ---" % ((time.time() - start_time)/60))
 
-complete_result = pd.DataFrame(result).dropna()
 complete_result .to_csv('results/complete_result.csv')
 
 #%% Construct Baseline For Individual Stock
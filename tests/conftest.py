@@ -0,0 +1,14 @@
+#######################################################################################
+### Module: conftest
+### Date: 18 Oct 2026
+### Features:  - Project root on the import path
+###            - Tests run from processing/, as the scripts do: Modules read '../settings.cfg'
+###              on import. Tests pass their own (temporary) storage paths.
+#######################################################################################
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+os.chdir(os.path.join(ROOT, 'processing'))
@@ -0,0 +1,43 @@
+#######################################################################################
+### Module: test_article_parsers
+### Date: 18 Oct 2026
+### Features:  - Every ArticleParsers backend gives the same article as 'soup' on the
+###              committed HTML fixtures (tests/fixtures/html, listed in index.json)
+###            - Fixtures are synthetic pages with the TheStar/TheEdge markup the parsers
+###              read (edge cases: decoy headline, extra classes, missing date, Latin-1)
+#######################################################################################
+
+import os
+import sys
+import json
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from Modules.ArticleParsers import PARSERS, ParseArticle
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'html')
+
+## Fixture Pages: (Name, Source, Link, Content)
+def _Fixtures():
+    with open(os.path.join(FIXTURES, 'index.json')) as f:
+        index = json.load(f)
+    pages = []
+    for x in index:
+        with open(os.path.join(FIXTURES, x['Name'] + '.html'), 'rb') as f:
+            pages = pages + [(x['Name'], x['Source'], x['Link'], f.read())]
+    return pages
+
+PAGES = _Fixtures()
+
+@pytest.mark.parametrize('parser', [ x for x in PARSERS if x != 'soup' ])
+@pytest.mark.parametrize('name,source,link,content', PAGES, ids=[ x[0] for x in PAGES ])
+def test_same_article_as_soup(parser, name, source, link, content):
+    assert ParseArticle(source, link, content, parser=parser) == ParseArticle(source, link, content, parser='soup')
+
+## Multi-Token class_ Matches The Whole Class Attribute Only (Extra Classes Skipped)
+def test_headline_exact_class():
+    pages = { x[0]: x for x in PAGES }
+    name, source, link, content = pages['thestar-02']
+    assert ParseArticle(source, link, content, parser='lxml')['Headline'] == 'Real headline after decoy'
+    name, source, link, content = pages['thestar-03']
+    assert ParseArticle(source, link, content, parser='lxml')['Headline'] is None
@@ -0,0 +1,101 @@
+#######################################################################################
+### Module: test_concurrent_fetcher
+### Date: 18 Oct 2026
+### Features:  - Local HTTP stand-in (http.server) serving the HTML fixtures on two hosts
+###              (127.0.0.1 and localhost), slow enough for requests to overlap
+###            - FetchNewsFromLinks with workers: same articles as parsing the fixtures,
+###              requests in flight per host within host_limit
+###            - Host at its limit does not hold workers: other hosts start at once
+#######################################################################################
+
+import os
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import pandas as pd
+import pytest
+from xxhash import xxh64 as hasher
+from Modules.ArticleParsers import ParseArticle
+from Modules.ConcurrentFetcher import ConcurrentFetcher
+from Modules.NewsDatabase import NewsDatabase, links_db, news_db
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'html')
+DELAY    = 0.05   ## seconds each response is held
+
+## Fixture Pages: (Name, Source, Content)
+def _Pages():
+    with open(os.path.join(FIXTURES, 'index.json')) as f:
+        index = json.load(f)
+    pages = []
+    for x in index:
+        with open(os.path.join(FIXTURES, x['Name'] + '.html'), 'rb') as f:
+            pages = pages + [(x['Name'], x['Source'], f.read())]
+    return pages
+
+PAGES = _Pages()
+
+## Server Of The Fixture Folder, Records Requests In Flight Per Host
+####################################################################
+class _Handler(SimpleHTTPRequestHandler):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=FIXTURES, **kwargs)
+
+    def do_GET(self):
+        stats, host = self.server.STATS, self.headers['Host'].split(':')[0]
+        with stats['lock']:
+            stats['inflight'][host] = stats['inflight'].get(host, 0) + 1
+            stats['peak'][host]     = max(stats['peak'].get(host, 0), stats['inflight'][host])
+            stats['order'].append(host)
+        time.sleep(DELAY)
+        super().do_GET()
+        with stats['lock']:
+            stats['inflight'][host] = stats['inflight'][host] - 1
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.STATS = {'lock': threading.Lock(), 'inflight': {}, 'peak': {}, 'order': []}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+## Fetched Articles Equal The Parsed Fixtures, Per Host Limit Kept
+def test_fetch_news_from_server(server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    port  = server.server_address[1]
+    links = [ ('http://{}:{}/{}.html'.format(host, port, name), source, content)
+              for host in ['127.0.0.1', 'localhost'] for name, source, content in PAGES ]
+    os.makedirs(os.path.dirname(links_db), exist_ok=True)
+    pd.DataFrame({'Id': [ hasher(x[0]).hexdigest() for x in links ],
+                  'Link': [ x[0] for x in links ], 'Source': [ x[1] for x in links ]}).to_csv(links_db, index=False)
+    pd.DataFrame(columns=['Id'] + NewsDatabase._NEWS_COLUMNS).to_csv(news_db, index=False)
+    expected = pd.DataFrame([ x for x in [ ParseArticle(s, link, c) for link, s, c in links ] if x ]).set_index('Id').dropna(axis=0)
+
+    db = NewsDatabase(cache_html=False)
+    db.FetchNewsFromLinks(output=False, workers=6, host_limit=2, batch_size=5)
+
+    assert sorted(db.NEWS_DF.index) == sorted(expected.index)
+    got = db.NEWS_DF.loc[expected.index]
+    for col in ['Link', 'Source', 'Headline', 'Detail', 'Category']:
+        assert got[col].tolist() == expected[col].tolist()
+    assert (pd.to_datetime(got.CreatedDate) == pd.to_datetime(expected.CreatedDate)).all()
+    assert server.STATS['peak'] == {'127.0.0.1': 2, 'localhost': 2}
+
+## Items Of A Host At Its Limit Queue Per Host: The Other Host Starts With The First Requests
+def test_busy_host_holds_no_worker(server):
+    port  = server.server_address[1]
+    urls  = [ 'http://127.0.0.1:{}/{}.html'.format(port, x[0]) for x in PAGES[:8] ] + \
+            [ 'http://localhost:{}/{}.html'.format(port, x[0]) for x in PAGES[:2] ]
+    fetcher = ConcurrentFetcher(workers=4, host_limit=2)
+    results = dict(fetcher.Map(lambda x: NewsDatabase._REQUEST.get(x, timeout=5).status_code, urls))
+    assert results == { x: 200 for x in urls }
+    assert sorted(server.STATS['order'][:4]) == ['127.0.0.1', '127.0.0.1', 'localhost', 'localhost']
+    assert server.STATS['peak'] == {'127.0.0.1': 2, 'localhost': 2}
+    assert fetcher.COUNT == len(urls)
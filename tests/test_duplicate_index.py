@@ -0,0 +1,73 @@
+#######################################################################################
+### Module: test_duplicate_index
+### Date: 18 Oct 2026
+### Features:  - Exact duplicates (case, punctuation, break codes) and near-duplicates (few
+###              words edited) share the cluster of the first article of the story, other
+###              stories and articles without text are their own cluster
+###            - Same clusters built at once, added in batches, merged and reloaded; a changed
+###              Detail re-clustered, clusters of stored articles kept
+#######################################################################################
+
+import numpy as np
+from Modules.DuplicateIndex import DuplicateIndex
+from Modules.SeenIndex import FromUint64
+
+## Stories Of Random Words, Each Published Several Times
+##   returns (ids, details, story of each article), earlier articles first
+def _Articles(stories=12, seed=0):
+    rng   = np.random.default_rng(seed)
+    vocab = np.array([ 'w{}'.format(i) for i in range(3000) ])
+    ids, details, story = [], [], []
+    for s in range(stories):
+        words = list(rng.choice(vocab, 120))
+        variants = [' '.join(words),                                       ## original
+                    '<br>'.join([ x.upper() + ',' for x in words ]),       ## exact: case, punctuation, breaks
+                    ' '.join(words[:40] + ['edited'] + words[41:80] + ['edited', 'again'] + words[81:])]   ## near: 2 words changed, 1 added
+        for v in variants[: 1 + s % 3]:
+            ids, details, story = ids + ['{:016x}'.format(rng.integers(1, 2**62))], details + [v], story + [s]
+    ids     = ids + [ '{:016x}'.format(x) for x in rng.integers(1, 2**62, 3) ]
+    details = details + ['', None, '<br> , .']
+    story   = story + [-1, -2, -3]
+    order   = rng.permutation(len(ids))
+    return [ ids[i] for i in order ], [ details[i] for i in order ], [ story[i] for i in order ]
+
+## Expected: Cluster Of Each Article Is The Id Of The First Article Of Its Story
+def _Expected(ids, story):
+    first = {}
+    for idx, s in zip(ids, story):
+        first.setdefault(s, idx)
+    return [ first[s] if s >= 0 else idx for idx, s in zip(ids, story) ]
+
+def test_clusters_same_as_stories(tmp_path):
+    ids, details, story = _Articles()
+    index = DuplicateIndex(str(tmp_path / 'built'))
+    index.Build(ids, details)
+    assert list(FromUint64(index.Clusters(ids))) == _Expected(ids, story)
+    assert len(set(_Expected(ids, story))) < len(ids)
+    assert list(FromUint64(DuplicateIndex(str(tmp_path / 'built')).Clusters(ids))) == _Expected(ids, story)
+    assert list(FromUint64(index.Clusters(['00000000000000ff']))) == ['00000000000000ff']
+
+## Added In Batches, Merged, Reloaded, One Detail Changed
+def test_incremental_same_as_build(tmp_path, monkeypatch):
+    monkeypatch.setattr(DuplicateIndex, '_MERGE_SEGMENTS', 3)
+    ids, details, story = _Articles()
+    index = DuplicateIndex(str(tmp_path / 'added'))
+    for s in range(0, len(ids), 10):
+        clusters = index.Add(ids[s : s+10], details[s : s+10])
+        assert list(FromUint64(clusters)) == _Expected(ids, story)[s : s+10]
+    assert len(index._Segments()) < 3
+    assert list(FromUint64(index.Clusters(ids))) == _Expected(ids, story)
+    assert index.Add(ids[:5], details[:5]).tolist() == index.Clusters(ids[:5]).tolist()     ## unchanged: nothing added
+    assert len(index) == len(ids)
+
+    ## Article Rewritten As Another Story: Joins It, Other Clusters Kept
+    moved   = next(i for i, s in enumerate(story) if s >= 0 and _Expected(ids, story)[i] != ids[i])
+    target  = next(i for i, s in enumerate(story) if s >= 0 and s != story[moved] and _Expected(ids, story)[i] == ids[i])
+    details = list(details)
+    details[moved] = details[target]
+    index.Add([ids[moved]], [details[moved]])
+    expected = _Expected(ids, story)
+    expected[moved] = ids[target]
+    for reloaded in [index, DuplicateIndex(str(tmp_path / 'added'))]:
+        assert list(FromUint64(reloaded.Clusters(ids))) == expected
+        assert len(reloaded) == len(ids)
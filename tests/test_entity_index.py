@@ -0,0 +1,65 @@
+#######################################################################################
+### Module: test_entity_index
+### Date: 18 Oct 2026
+### Features:  - Incremental EntityIndex.Update() gives the same tags as tagging every article
+###              again (new articles, changed text, changed keywords, missing text)
+###            - Matcher cache: compiled once per content of the source files and key, the
+###              cached matcher tags as the compiled one (pyahocorasick and pure Python)
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+import pytest
+import Modules.EntityMatcher as EntityMatcherModule
+from Modules.EntityIndex import EntityIndex
+from Modules.EntityMatcher import EntityMatcher
+
+## Tags Of Every Article From Scratch
+def _Full(texts, matcher):
+    return matcher.TagMatrix(texts.fillna(''), workers=1).ToFrame()
+
+def test_update_same_as_full(tmp_path):
+    index   = EntityIndex(str(tmp_path))
+    matcher = EntityMatcher({'MBBM.KL': ['Maybank'], 'CIMB.KL': ['CIMB'], 'TLMM.KL': ['Telekom']})
+    texts   = pd.Series(['Maybank profit rose', 'CIMB and Maybank', np.nan, None, 'no symbol'],
+                        index=[ '{:016x}'.format(i) for i in range(1, 6) ])
+    pd.testing.assert_frame_equal(index.Update(texts, matcher, workers=1).ToFrame(), _Full(texts, matcher))
+
+    ## New Article And Changed Text
+    texts = pd.concat([texts, pd.Series(['Telekom deal'], index=['{:016x}'.format(6)])])
+    texts.iloc[0] = 'Telekom results'
+    texts.iloc[2] = 'CIMB now'
+    pd.testing.assert_frame_equal(index.Update(texts, matcher, workers=1).ToFrame(), _Full(texts, matcher))
+
+    ## Changed Keywords Of One Symbol, Stored Tags Of The Others Reused
+    matcher = EntityMatcher({'MBBM.KL': ['Maybank', 'profit'], 'CIMB.KL': ['CIMB'], 'TLMM.KL': ['Telekom']})
+    pd.testing.assert_frame_equal(index.Update(texts, matcher, workers=1).ToFrame(), _Full(texts, matcher))
+    pd.testing.assert_frame_equal(EntityIndex(str(tmp_path)).Load()[0].ToFrame(), _Full(texts, matcher))
+
+@pytest.mark.parametrize('automaton', ['pyahocorasick', 'python'])
+def test_matcher_cache(tmp_path, monkeypatch, automaton):
+    if automaton == 'pyahocorasick':
+        pytest.importorskip('ahocorasick')
+    else:
+        monkeypatch.setattr(EntityMatcherModule, 'ahocorasick', None)
+    source = tmp_path / 'instruments.txt'
+    source.write_text('MBBM.KL: Maybank, Malayan Banking\nCIMB.KL: CIMB')
+    builds = []
+    def build():
+        builds.append(1)
+        return { x.split(': ')[0]: x.split(': ')[1].split(', ') for x in source.read_text().splitlines() }
+    texts = pd.Series(['Maybank and CIMB', 'Malayan Banking', 'CIMB CIMB', 'Telekom'], index=[ '{:016x}'.format(i) for i in range(1, 5) ])
+
+    index    = EntityIndex(str(tmp_path / 'index'))
+    compiled = index.Matcher([str(source)], build)
+    cached   = EntityIndex(str(tmp_path / 'index')).Matcher([str(source)], build)
+    assert len(builds) == 1
+    assert cached.KEYWORDS == compiled.KEYWORDS
+    assert (cached.TagMatrix(texts, workers=1).MATRIX != compiled.TagMatrix(texts, workers=1).MATRIX).nnz == 0
+
+    ## Other Key Or Changed File Content: Compiled Again
+    index.Matcher([str(source)], build, key='fsi')
+    source.write_text('MBBM.KL: Maybank\nTLMM.KL: Telekom')
+    changed = index.Matcher([str(source)], build)
+    assert len(builds) == 3
+    assert changed.TagMatrix(texts, workers=1).ToFrame().values.tolist() == [[True, False], [False, False], [False, False], [False, True]]
@@ -0,0 +1,71 @@
+#######################################################################################
+### Module: test_entity_matcher
+### Date: 18 Oct 2026
+### Features:  - EntityMatcher tags the same articles as the original str.contains loop of
+###              phase2, with pyahocorasick and with the pure Python automaton, in one
+###              process and on a process pool
+###            - Keywords of instruments.xlsx rows: empty cells give no keyword
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+import pytest
+import Modules.EntityMatcher as EntityMatcherModule
+from Modules.EntityMatcher import EntityMatcher, InstrumentKeywords, ListingKeywords
+
+KEYWORDS = {'MBBM.KL': ['Maybank', 'Malayan Banking', 'MBBM.KL', '1155'],
+            'CIMB.KL': ['CIMB', 'CIMB Group', 'CIMB.KL'],
+            'PUBM.KL': ['Public Bank', 'Bank'],                ## 'Bank' also inside 'Public Bank'
+            'TLMM.KL': ['Telekom', 'TM', 'Telekom'],           ## repeated keyword
+            'ALL':     ['']}                                   ## empty keyword: every text
+
+TEXTS = pd.Series(['Maybank and CIMB Group report profit', 'Public Bank rises, Bank Negara holds rate',
+                   'TM and Telekom Malaysia', 'maybank in lower case', '', 'CIMBCIMB overlapping CIMB',
+                   'Malayan Banking (1155) ex-date', 'nothing here'] * 3,
+                  index=pd.Index([ '{:016x}'.format(i) for i in range(1, 25) ], name='Id'))
+
+## Original phase2 Loop: One str.contains Per Keyword
+def _Baseline(texts, keywords):
+    tags = pd.DataFrame(index=texts.index)
+    for symbol, words in keywords.items():
+        mask = pd.Series(data = [False] * len(texts), index=texts.index)
+        for kw in words:
+            mask = mask | texts.str.contains(kw, regex=False)
+        tags[symbol] = mask
+    return tags
+
+@pytest.fixture(params=['pyahocorasick', 'python'])
+def automaton(request, monkeypatch):
+    if request.param == 'pyahocorasick':
+        pytest.importorskip('ahocorasick')
+    else:
+        monkeypatch.setattr(EntityMatcherModule, 'ahocorasick', None)
+    return request.param
+
+def test_tag_same_as_contains(automaton):
+    matcher = EntityMatcher(KEYWORDS)
+    pd.testing.assert_frame_equal(matcher.Tag(TEXTS, workers=1), _Baseline(TEXTS, KEYWORDS))
+    pd.testing.assert_frame_equal(matcher.TagMatrix(TEXTS, workers=1).ToFrame(), _Baseline(TEXTS, KEYWORDS))
+
+## Chunks Tagged On A Process Pool, Merged In Input Order
+def test_tag_workers_same_as_one_process(automaton):
+    matcher = EntityMatcher(KEYWORDS)
+    one     = matcher.TagMatrix(TEXTS, workers=1)
+    pool    = matcher.TagMatrix(TEXTS, workers=2, chunk_size=5)
+    assert list(pool.IDS) == list(one.IDS)
+    assert (pool.MATRIX != one.MATRIX).nnz == 0
+
+## Match Counts: Keyword Occurrences Per Symbol, Overlapping Included
+def test_tag_counts():
+    matrix = EntityMatcher({'CIMB.KL': ['CIMB'], 'PUBM.KL': ['Public Bank', 'Bank']}).TagMatrix(pd.Series(['CIMBCIMB overlapping CIMB', 'Public Bank']), workers=1)
+    assert matrix.MATRIX.toarray().tolist() == [[3, 0], [0, 2]]
+
+## Empty Cells Give No Keyword (Not 'nan'), Other Cells As Text
+def test_instrument_keywords_skip_na():
+    instruments = pd.DataFrame({'RIC': ['MBBM.KL', 'CIMB.KL'], 'KEYWORDS': ['Maybank, Malayan Banking', np.nan],
+                                'YAHOO': ['1155.KL', np.nan], 'CODE': ['1155', '1023'], 'SYMBOL': [np.nan, 'CIMB'], 'NAME': ['MALAYAN BANKING BHD', None]})
+    assert InstrumentKeywords(instruments) == {'MBBM.KL': ['Maybank', 'Malayan Banking', 'MBBM.KL', '1155.KL', '1155', 'MALAYAN BANKING BHD'],
+                                               'CIMB.KL': ['CIMB.KL', '1023', 'CIMB']}
+    assert 'nan' not in [ x for v in InstrumentKeywords(instruments).values() for x in v ]
+    listing = pd.DataFrame({'COMMONNAME': ['Maybank ', np.nan], 'EXCHANGETICKER': ['MAYBANK', 'CIMB']}, index=['MBBM.KL', 'CIMB.KL'])
+    assert ListingKeywords(listing) == {'MBBM.KL': ['MBBM.KL', 'Maybank', 'MAYBANK'], 'CIMB.KL': ['CIMB.KL', 'CIMB']}
@@ -0,0 +1,67 @@
+#######################################################################################
+### Module: test_entity_matrix
+### Date: 18 Oct 2026
+### Features:  - Save / Load round trip: same Ids, symbols and counts
+###            - Column, Any, AddGroup, Rows, Columns, Append, Join and ToFrame same as the
+###              operations on the dense count frame (boolean frame of phase2 for ToFrame)
+#######################################################################################
+
+import io
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from Modules.EntityMatrix import EntityMatrix
+
+SYMBOLS = ['MBBM.KL', 'CIMB.KL', 'PUBM.KL', 'TLMM.KL', 'MXSC.KL']
+
+## Sparse Counts And The Same Counts As A Dense Frame
+def _Matrix(n=40, seed=0, symbols=SYMBOLS):
+    rng    = np.random.default_rng(seed)
+    counts = rng.integers(1, 4, (n, len(symbols))) * (rng.random((n, len(symbols))) < 0.3)
+    ids    = [ '{:016x}'.format(x) for x in rng.integers(1, 2**62, n) ]
+    dense  = pd.DataFrame(counts, index=pd.Index(ids, name='Id'), columns=symbols)
+    return EntityMatrix(ids, symbols, sp.csr_matrix(counts)), dense
+
+## Matrix Holds The Dense Counts
+def _Same(matrix, dense):
+    assert list(matrix.Ids()) == list(dense.index)
+    assert matrix.SYMBOLS == list(dense.columns)
+    assert matrix.MATRIX.toarray().tolist() == dense.values.tolist()
+
+def test_save_load(tmp_path):
+    matrix, dense = _Matrix()
+    matrix.Save(str(tmp_path / 'entities.npz'))
+    _Same(EntityMatrix().Load(str(tmp_path / 'entities.npz')), dense)
+    buffer = io.BytesIO()
+    EntityMatrix().Save(buffer)
+    buffer.seek(0)
+    empty = EntityMatrix().Load(buffer)
+    assert len(empty) == 0 and empty.SYMBOLS == []
+
+def test_operations_same_as_dense():
+    matrix, dense = _Matrix()
+    for symbol in SYMBOLS:
+        column = dense[symbol][dense[symbol] > 0]
+        assert matrix.Column(symbol).to_dict() == column.to_dict()
+    assert matrix.Any().tolist() == (dense > 0).any(axis=1).tolist()
+    assert matrix.Any(['CIMB.KL', 'TLMM.KL']).tolist() == (dense[['CIMB.KL', 'TLMM.KL']] > 0).any(axis=1).tolist()
+    pd.testing.assert_frame_equal(matrix.ToFrame(), dense > 0)
+    pd.testing.assert_frame_equal(matrix.ToFrame(['TLMM.KL', 'MBBM.KL']), dense[['TLMM.KL', 'MBBM.KL']] > 0)
+
+    ## Rows (Repeated, Renamed), Columns Reordered
+    rows = [5, 0, 5, 39]
+    _Same(matrix.Rows(rows), dense.iloc[rows])
+    _Same(matrix.Rows(rows, ids=['{:016x}'.format(i) for i in range(4)]), dense.iloc[rows].set_axis(pd.Index(['{:016x}'.format(i) for i in range(4)], name='Id')))
+    _Same(matrix.Columns(['PUBM.KL', 'MBBM.KL']), dense[['PUBM.KL', 'MBBM.KL']])
+
+    ## Append Of Other Symbol Order, Join Of Other Symbols
+    other, other_dense = _Matrix(10, 1, SYMBOLS[::-1])
+    _Same(matrix.Append(other), pd.concat([dense, other_dense[SYMBOLS]]))
+    extra, extra_dense = _Matrix(40, 2, ['FSI_INDEX', 'TELCO_INDEX'])
+    _Same(matrix.Join(extra.Rows(range(40), ids=matrix.IDS)), pd.concat([dense, extra_dense.set_axis(dense.index)], axis=1))
+
+    ## Group Column: Summed Counts Of Its Members
+    matrix.AddGroup('FSI_INDEX', ['MBBM.KL', 'CIMB.KL', 'PUBM.KL'])
+    dense['FSI_INDEX'] = dense[['MBBM.KL', 'CIMB.KL', 'PUBM.KL']].sum(axis=1)
+    _Same(matrix, dense)
+    assert matrix.Column('FSI_INDEX').to_dict() == dense.FSI_INDEX[dense.FSI_INDEX > 0].to_dict()
@@ -0,0 +1,84 @@
+#######################################################################################
+### Module: test_feature_store
+### Date: 18 Oct 2026
+### Features:  - Round trip: latest row per Id, version and column filters, same before and
+###              after compaction; Stale() as not stored, other version or text changed
+###            - Detail features shared by exact duplicates (DetailSources, ShareDetailFeatures)
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+from xxhash import xxh64 as hasher
+from Modules.FeatureStore import FeatureStore, TextHash, DetailSources, ShareDetailFeatures
+
+COLUMNS = ['Headline_WN_PosScore', 'Detail_WN_PosScore', 'Detail_WN_Sentiment']
+
+## News Frame Indexed By Id
+def _News(rows):
+    return pd.DataFrame(rows, columns=['Id', 'Headline', 'Detail']).set_index('Id')
+
+## Fake Features: Headline From Headline Text, Detail From Detail Text ('' Not Scored)
+def _Features(news):
+    score = lambda x: float(hasher(x).intdigest() % 1000) if x != '' else 0.0
+    return pd.DataFrame({'Headline_WN_PosScore': [ score(x) for x in news.Headline ],
+                         'Detail_WN_PosScore':   [ score(x) for x in news.Detail ],
+                         'Detail_WN_Sentiment':  [ score(x) / 1000 for x in news.Detail ]}, index=news.index)
+
+## One phase1 Run: Stale Articles Scored, Detail Features Shared
+def _Run(store, news, version='v1'):
+    stale = store.Stale(news, version)
+    detail_hash = pd.Series([ hasher(x).intdigest() for x in news.Detail ], index=news.index, dtype=np.uint64)
+    reuse, source = DetailSources(stale.index, detail_hash)
+    score = stale.copy()
+    score.loc[reuse, 'Detail'] = ''
+    df = ShareDetailFeatures(_Features(score), store.Load(version=version, columns=COLUMNS[1:]), reuse, source)
+    store.Append(df, TextHash(stale), version)
+    return reuse
+
+## Random Features Of Articles, Some NaN
+def _Random(ids, seed):
+    rng = np.random.default_rng(seed)
+    df  = pd.DataFrame(rng.random((len(ids), len(COLUMNS))), columns=COLUMNS, index=pd.Index(ids, name='Id'))
+    return df.mask(rng.random(df.shape) < 0.1)
+
+def test_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(FeatureStore, '_COMPACT_SEGMENTS', 3)
+    store = FeatureStore(str(tmp_path))
+    news  = _News([ ('{:016x}'.format(i), 'h{}'.format(i), 'd{}'.format(i % 7)) for i in range(30) ])
+    assert len(store.Stale(news, 'v1')) == 30 and len(store.Load()) == 0
+
+    ## Appended In Segments, Some Articles Rescored With Another Version
+    v1 = _Random(news.index[:20], 0)
+    store.Append(v1.iloc[:10], TextHash(news.iloc[:10]), 'v1')
+    store.Append(v1.iloc[10:], TextHash(news.iloc[10:20]), 'v1')
+    v2 = _Random(news.index[15:30], 1)
+    store.Append(v2, TextHash(news.iloc[15:30]), 'v2')
+    latest = pd.concat([v1.iloc[:15], v2])
+    pd.testing.assert_frame_equal(store.Load().loc[latest.index], latest)
+    pd.testing.assert_frame_equal(store.Load(version='v1').sort_index(), v1.iloc[:15])
+    pd.testing.assert_frame_equal(store.Load(version='v2', columns=COLUMNS[1:2]).sort_index(), v2[COLUMNS[1:2]])
+    assert list(store.Stale(news, 'v2').index) == list(news.index[:15])
+
+    ## Changed Text Stale Again
+    changed = news.copy()
+    changed.loc[changed.index[[3, 20]], 'Headline'] = 'changed'
+    assert list(store.Stale(changed, 'v1').index) == list(news.index[[3]]) + list(news.index[15:30])
+
+    ## Fourth File (Above 3) Compacts Into The Base File, Same Content
+    store.Append(v2.iloc[:2], TextHash(news.iloc[15:17]), 'v2')
+    assert len(store._Files()) == 1
+    pd.testing.assert_frame_equal(store.Load().loc[latest.index], latest)
+    assert list(store.Stale(news, 'v2').index) == list(news.index[:15])
+    assert store.Compact() == 0
+
+## Exact Duplicates Whose Text Changed: Stored Rows Of The Lead Are Outdated, Never Used
+def test_changed_exact_duplicates(tmp_path):
+    store = FeatureStore(str(tmp_path))
+    news  = _News([('a', 'h1', 'd1'), ('b', 'h2', 'd1'), ('c', 'h3', 'd2'), ('d', 'h4', 'd4')])
+    assert list(_Run(store, news)) == [False, True, False, False]
+
+    ## a and b rewritten with the same new Detail, e reuses the stored d
+    news = _News([('a', 'h1', 'd3'), ('b', 'h2', 'd3'), ('c', 'h3', 'd2'), ('d', 'h4', 'd4'), ('e', 'h5', 'd4')])
+    assert list(_Run(store, news)) == [False, True, True]
+    got = store.Load(version='v1').loc[news.index, COLUMNS]
+    pd.testing.assert_frame_equal(got, _Features(news)[COLUMNS], check_dtype=False)
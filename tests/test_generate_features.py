@@ -0,0 +1,105 @@
+#######################################################################################
+### Module: test_generate_features
+### Date: 18 Oct 2026
+### Features:  - GenerateFeatures sharded on a process pool: same rows, order and columns as
+###              the original row by row apply of phase1, and as one process; lexicon entries
+###              computed by the workers saved. Feature function stood in by a text
+###              statistic (workers forked with it), runs without NLTK data
+###            - Real features across processes same as the original apply (skipped when
+###              NLTK data is missing)
+#######################################################################################
+
+import os
+import json
+import multiprocessing
+import numpy as np
+import pandas as pd
+import pytest
+import Modules.NewsFeatures as NewsFeatures
+from Modules.NewsFeatures import GenerateFeatures, FEATURE_COLUMNS
+from Modules.SentiLexicon import SentiLexicon
+from Modules.ArticleParsers import ParseArticle
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'html')
+FORKED   = multiprocessing.get_start_method() == 'fork'
+
+## News Of Random Words, Ids Unsorted
+def _News(n=45, seed=0):
+    rng   = np.random.default_rng(seed)
+    words = ['shares', 'up', 'down', 'bank', 'profit.', 'loss.', 'Bursa', 'flat']
+    return pd.DataFrame({'Headline': [ ' '.join(rng.choice(words, rng.integers(0, 6))) for i in range(n) ],
+                         'Detail':   [ '<br>'.join(rng.choice(words, rng.integers(0, 30))) for i in range(n) ]},
+                        index=pd.Index([ '{:016x}'.format(x) for x in rng.integers(1, 2**62, n) ], name='Id'))
+
+## Stand-In Features Of A Text: Counts In The Place Of The SentiWordNet Features
+def _TextFeatures(text):
+    words = text.split()
+    return (text.count('.'), len(words), len(text), 0.1 * text.count('up'), 0.1 * text.count('down'), 0.01 * len(text),
+            text.count('up'), text.count('down'), text.count('flat'))
+
+## Stand-In Batch: Features Per Article, Words Entered In The Lexicon Of The Process
+def _StandInBatch(headlines, details):
+    lexicon = NewsFeatures._Lexicon()
+    features = []
+    for headline, detail in zip(headlines, details):
+        detail = detail.replace('<br>', ' ')
+        lexicon.Update({ lexicon._Key(x, None): (len(x) / 10, 0.0, 1.0) for x in (headline + ' ' + detail).split() })
+        features.append(_TextFeatures(headline) + _TextFeatures(detail) + (len(headline) / 100, 0.5, len(detail) / 1000, 0.25))
+    return features
+
+## Original phase1: apply Row By Row, Columns Named, WN Sentiment Derived
+def _Baseline(news, generate):
+    df = news.apply(lambda row: generate(row['Headline'], row['Detail']), axis=1, result_type='expand')
+    df.columns = FEATURE_COLUMNS
+    df['Headline_WN_Sentiment'] = (df.Headline_WN_PosWordCount / (df.Headline_WN_PosWordCount + df.Headline_WN_NegWordCount)).fillna(0.5)
+    df['Detail_WN_Sentiment']   = (df.Detail_WN_PosWordCount / (df.Detail_WN_PosWordCount + df.Detail_WN_NegWordCount)).fillna(0.5)
+    return df
+
+@pytest.fixture
+def lexicon(tmp_path, monkeypatch):
+    lexicon = SentiLexicon(str(tmp_path / 'senti_lexicon'))
+    lexicon.Update({ lexicon._Key('built', None): (0.0, 0.0, 1.0) })
+    lexicon.Save()
+    monkeypatch.setattr(NewsFeatures, 'LEXICON', lexicon)
+    return lexicon
+
+@pytest.mark.skipif(not FORKED, reason='stand-in reaches workers by fork only')
+def test_shards_same_as_apply(lexicon, monkeypatch):
+    monkeypatch.setattr(NewsFeatures, '_InitWorker', lambda: None)
+    monkeypatch.setattr(NewsFeatures, 'news_generate_features_batch', _StandInBatch)
+    news     = _News()
+    expected = _Baseline(news, lambda h, d: _StandInBatch([h], [d])[0])
+    NewsFeatures.LEXICON = SentiLexicon(lexicon.PATH)    ## entries of the baseline run not kept
+    pool     = GenerateFeatures(news, workers=3, shard_size=4, output=False)
+    pd.testing.assert_frame_equal(pool, expected, check_dtype=False)
+
+    ## Entries Computed In Every Worker Saved
+    words   = sorted(set(' '.join(news.Headline + ' ' + news.Detail.str.replace('<br>', ' ')).split()))
+    compute = SentiLexicon._Compute
+    monkeypatch.setattr(SentiLexicon, '_Compute', lambda self, word, pos: pytest.fail('not stored: {}'.format(word)))
+    assert SentiLexicon(lexicon.PATH).Lookup(words, [None] * len(words)).tolist() == [ [len(x) / 10, 0.0, 1.0] for x in words ]
+    monkeypatch.setattr(SentiLexicon, '_Compute', compute)
+
+    pd.testing.assert_frame_equal(GenerateFeatures(news, workers=1, shard_size=7, output=False), expected, check_dtype=False)
+
+## Real Features Of The Fixture Articles
+def _HasData():
+    try:
+        NewsFeatures.swn.ensure_loaded()
+        NewsFeatures.tag_documents(['Tagger data installed.'])
+        return True
+    except LookupError:
+        return False
+
+@pytest.mark.skipif(not _HasData(), reason='NLTK data not installed')
+def test_features_same_as_apply(lexicon):
+    with open(os.path.join(FIXTURES, 'index.json')) as f:
+        index = json.load(f)
+    articles = []
+    for x in index:
+        with open(os.path.join(FIXTURES, x['Name'] + '.html'), 'rb') as f:
+            articles = articles + [ParseArticle(x['Source'], x['Link'], f.read())]
+    news = pd.DataFrame([ x for x in articles if x ]).set_index('Id').fillna('')
+    expected = _Baseline(news, NewsFeatures.news_generate_features)
+    got      = GenerateFeatures(news, workers=2, shard_size=3, output=False)
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
@@ -0,0 +1,90 @@
+#######################################################################################
+### Module: test_grid_search
+### Date: 18 Oct 2026
+### Features:  - GridSearch gives the rows and metrics of the original phase5 loop (labels per
+###              parameter pair, sklearn confusion_matrix per symbol and horizon, dropna)
+###            - Scores and returns with missing values, dates of both only partly shared
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+import pytest
+from Modules.GridSearch import GridSearch, DirectionLabels
+
+confusion_matrix = pytest.importorskip('sklearn.metrics').confusion_matrix
+
+SECTORS     = {'MBBM.KL': 'FS', 'CIMB.KL': 'FS', 'TLMM.KL': 'TELCO', 'FSI_INDEX': 'FS_INDEX'}
+RETURN_COLS = ['RD00', 'RD01', 'RD02']
+
+## Daily Sentiment (0 - 1) And Returns (%), Some Missing, Dates Partly Shared
+def _Data(seed=0):
+    rng       = np.random.default_rng(seed)
+    symbols   = list(SECTORS)
+    sentiment = pd.DataFrame(rng.integers(0, 100, (150, len(symbols))) / 100, columns=symbols,
+                             index=pd.date_range('2020-01-01', periods=150, freq='D').strftime('%Y-%m-%d'))
+    sentiment = sentiment.mask(rng.random(sentiment.shape) < 0.2)
+    columns   = pd.MultiIndex.from_product([symbols, RETURN_COLS], names=['RIC', 'COLUMN'])
+    returns   = pd.DataFrame(rng.normal(0, 1.5, (160, len(columns))).round(2), columns=columns,
+                             index=pd.date_range('2020-01-11', periods=160, freq='D').strftime('%Y-%m-%d'))
+    returns   = returns.mask(rng.random(returns.shape) < 0.1)
+    return sentiment, returns
+
+## Original phase5 Loop (Labels As Strings, sklearn Confusion Matrix)
+def _Baseline(sentiment_df, returns_df, centers, thresholds):
+    def ReturnDirection(num, th=0.5):
+        if pd.isna(num):   return num
+        elif num > th:     return 'UP'
+        elif num < -1*th:  return 'DOWN'
+        else:              return 'STAY'
+    def SentiDirection(senti_score, th, center):
+        upper_boundary = center + th
+        lower_boundary = center - th
+        if pd.isna(senti_score): return senti_score
+        elif senti_score > upper_boundary: return 'UP'
+        elif senti_score < lower_boundary: return 'DOWN'
+        else:                              return 'STAY'
+    def cm_eval(actual, predict):
+        result = confusion_matrix(actual, predict)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ACCURACY       = (result[0,0] + result[1,1] + result[2,2])/ result.sum()
+            DOWN_PRECISION =  result[0,0] / (result[0,0] + result[1,0] + result[2,0])
+            DOWN_RECALL    =  result[0,0] / (result[0,0] + result[0,1] + result[0,2])
+            STAY_PRECISION =  result[1,1] / (result[0,1] + result[1,1] + result[2,1])
+            STAY_RECALL    =  result[1,1] / (result[1,0] + result[1,1] + result[1,2])
+            UP_PRECISION   =  result[2,2] / (result[0,2] + result[1,2] + result[2,2])
+            UP_RECALL      =  result[2,2] / (result[2,0] + result[2,1] + result[2,2])
+            DOWN_F1        =  2* (DOWN_PRECISION*DOWN_RECALL) / (DOWN_PRECISION+DOWN_RECALL)
+            STAY_F1        =  2* (STAY_PRECISION*STAY_RECALL) / (STAY_PRECISION+STAY_RECALL)
+            UP_F1          =  2* (UP_PRECISION*UP_RECALL) / (UP_PRECISION+UP_RECALL)
+        return [ x.round(3) for x in [ACCURACY, DOWN_PRECISION, DOWN_RECALL, STAY_PRECISION, STAY_RECALL, UP_PRECISION, UP_RECALL, DOWN_F1, STAY_F1, UP_F1] ]
+
+    names       = ['ACCURACY', 'DOWN_PRECISION', 'DOWN_RECALL', 'STAY_PRECISION', 'STAY_RECALL', 'UP_PRECISION', 'UP_RECALL', 'DOWN_F1', 'STAY_F1', 'UP_F1']
+    returns_dir = returns_df.map(ReturnDirection)
+    result = []
+    for c in centers:
+        for t in thresholds:
+            sentiment_dir = sentiment_df.map(lambda x: SentiDirection(senti_score=x, th=t, center=c))
+            for sym in SECTORS:
+                for col in RETURN_COLS:
+                    model = pd.concat([returns_dir[sym][col], sentiment_dir[sym]], axis=1).dropna()
+                    result.append({'PARAM': 'C%.2f'%c + '-T%.2f'%t, 'CENTER': c, 'THRESHOLD': t, 'SYMBOL': sym, 'SECTOR': SECTORS[sym], 'MODEL': col,
+                                   **dict(zip(names, cm_eval(model.iloc[:,0], model.iloc[:,1]))) })
+    return pd.DataFrame(result).dropna()
+
+def test_grid_search_same_as_loop():
+    sentiment, returns = _Data()
+    centers    = np.arange(0.3, 0.8, 0.2)       ## 0.3, 0.5, 0.7
+    thresholds = np.arange(0.05, 0.45, 0.1)     ## wide thresholds leave labels never predicted (rows dropped)
+    got      = GridSearch(sentiment, returns, SECTORS, RETURN_COLS, centers.tolist(), thresholds.tolist())
+    expected = _Baseline(sentiment, returns, centers.tolist(), thresholds.tolist())
+    assert len(expected) > 0 and len(expected) < len(centers) * len(thresholds) * len(SECTORS) * len(RETURN_COLS)
+    keys = ['PARAM', 'SYMBOL', 'MODEL']
+    got, expected = got.sort_values(keys).reset_index(drop=True), expected.sort_values(keys).reset_index(drop=True)
+    pd.testing.assert_frame_equal(got, expected[got.columns], check_dtype=False)
+
+## Labels: UP Above center + th, DOWN Below center - th, STAY Between, NaN Kept
+def test_direction_labels():
+    df = pd.DataFrame({'A': [0.9, 0.2, 0.5, np.nan, 0.65]})
+    assert DirectionLabels(df, th=0.15, center=0.5).A.tolist()[:3] == ['UP', 'DOWN', 'STAY']
+    assert pd.isna(DirectionLabels(df, th=0.15, center=0.5).A[3])
+    assert DirectionLabels(df, th=0.15, center=0.5).A[4] == 'STAY'
@@ -0,0 +1,83 @@
+#######################################################################################
+### Module: test_html_cache
+### Date: 18 Oct 2026
+### Features:  - HtmlCache round trip: link, source and content of every page, keyed by Id
+###            - Fetched pages cached, ReparseFromCache on a process pool gives the articles
+###              of the fetch (CSV and journal mode), articles not cached kept
+#######################################################################################
+
+import os
+import json
+from types import SimpleNamespace
+import pandas as pd
+import pytest
+from xxhash import xxh64 as hasher
+from Modules.ArticleParsers import ParseArticle
+from Modules.HtmlCache import HtmlCache
+from Modules.NewsStore import NewsStore
+from Modules.NewsDatabase import NewsDatabase, links_db, news_db
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'html')
+
+## Fixture Pages: Link -> (Source, Content)
+def _Pages():
+    with open(os.path.join(FIXTURES, 'index.json')) as f:
+        index = json.load(f)
+    pages = {}
+    for x in index:
+        with open(os.path.join(FIXTURES, x['Name'] + '.html'), 'rb') as f:
+            pages[x['Link']] = (x['Source'], f.read())
+    return pages
+
+def test_round_trip(tmp_path):
+    pages = _Pages()
+    cache = HtmlCache(str(tmp_path / 'cache'))
+    assert cache.Ids() == []
+    ids   = [ cache.Put(link, source, content) for link, (source, content) in pages.items() ]
+    assert ids == [ hasher(x).hexdigest() for x in pages ]
+    assert cache.Ids() == sorted(ids)
+    for idx, (link, (source, content)) in zip(ids, pages.items()):
+        assert cache.Has(idx)
+        assert cache.Get(idx) == (link, source, content)
+    assert cache.Get('0' * 16) is None and not cache.Has('0' * 16)
+    ## Empty Page Kept As Empty Content, Page Put Again Replaced
+    idx = cache.Put('https://www.thestar.com.my/empty', 'TheStar', None)
+    assert cache.Get(idx) == ('https://www.thestar.com.my/empty', 'TheStar', b'')
+    cache.Put('https://www.thestar.com.my/empty', 'TheStar', b'<html>\n</html>')
+    assert cache.Get(idx)[2] == b'<html>\n</html>'
+
+## Fetch Through A Stand-In Session (Pages Cached), Then Reparse Stale News From The Cache
+@pytest.mark.parametrize('journal', [False, True])
+def test_reparse_same_as_fetch(tmp_path, monkeypatch, journal):
+    monkeypatch.chdir(tmp_path)
+    pages = _Pages()
+    monkeypatch.setattr(NewsDatabase, '_REQUEST', SimpleNamespace(get=lambda link, **kwargs: SimpleNamespace(content=pages[link][1])))
+    os.makedirs(os.path.dirname(links_db), exist_ok=True)
+    pd.DataFrame({'Id': [ hasher(x).hexdigest() for x in pages ], 'Link': list(pages), 'Source': [ x[0] for x in pages.values() ]}).to_csv(links_db, index=False)
+    other = pd.DataFrame({'Link': ['https://www.thestar.com.my/not-cached'], 'Source': ['TheStar'], 'CreatedDate': [pd.Timestamp('2019-11-01 07:00')],
+                          'Headline': ['Not Cached'], 'Detail': ['Kept'], 'Category': ['Business']},
+                         index=pd.Index([hasher('https://www.thestar.com.my/not-cached').hexdigest()], name='Id'))
+    if journal:
+        NewsStore().Write(other)
+    else:
+        other.to_csv(news_db)
+
+    db = NewsDatabase()
+    db.FetchNewsFromLinks(output=False)
+    fetched = db.NEWS_DF.sort_index()
+    assert len(HtmlCache().Ids()) == len(pages)
+
+    ## Articles Saved Stale, Reparsed From Cache Only (No Session)
+    monkeypatch.setattr(NewsDatabase, '_REQUEST', None)
+    stale = NewsDatabase()
+    stale.NEWS_DF.loc[stale.NEWS_DF.index != other.index[0], 'Headline'] = 'Stale'
+    if journal:
+        stale.STORE.Replace(stale.NEWS_DF)
+    else:
+        stale.SaveToLocalStorage()
+    NewsDatabase().ReparseFromCache(workers=2, parser='lxml', chunk_size=4)
+    reparsed = NewsDatabase().NEWS_DF.sort_index()
+    assert list(reparsed.index) == list(fetched.index)
+    assert reparsed.Headline.tolist() == fetched.Headline.tolist()
+    assert reparsed.Detail.tolist() == fetched.Detail.tolist()
+    assert reparsed.loc[other.index[0], 'Headline'] == 'Not Cached'
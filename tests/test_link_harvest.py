@@ -0,0 +1,98 @@
+#######################################################################################
+### Module: test_link_harvest
+### Date: 18 Oct 2026
+### Features:  - Search result pages served by stand-in page functions (no network)
+###            - Concurrent harvest of one keyword: same links as the original page by page
+###              loop, stops at the first empty or failed page, or at a page of known links
+###            - Batch harvest of several keywords: same links as one loop per keyword,
+###              each link once across keywords, saved once
+#######################################################################################
+
+import os
+import threading
+import pandas as pd
+from xxhash import xxh64 as hasher
+from Modules.NewsDatabase import NewsDatabase, links_db, news_db
+
+## Result Pages Per Keyword (Keyword As Url Encoded), Every Page Shares A Link Across Keywords
+LAST_PAGE = {'maybank': 7, 'cimb': 3, 'public+bank': 0, 'public%20bank': 0, 'telekom': 12}
+
+def _Links(source, keyword, page_no):
+    first = 1 if source == 'TheStar' else 0
+    if page_no < first or page_no - first >= LAST_PAGE.get(keyword, 0):
+        return []
+    return [ 'https://{}/news/{}/{}-{}'.format(source, keyword, page_no, i) for i in range(10) ] + \
+           [ 'https://{}/news/shared/{}'.format(source, page_no) ]
+
+## Stand-In Search Pages, Requests Recorded As (Source, Keyword, Page)
+def _SearchPages(monkeypatch, fail=None):
+    requests = []
+    lock     = threading.Lock()
+    def page(source):
+        def search_page(self, keyword, page_no, date_from, date_to):
+            with lock: requests.append((source, keyword, page_no))
+            if (source, keyword, page_no) == fail: raise ConnectionError('stand-in failure')
+            return _Links(source, keyword, page_no)
+        return search_page
+    monkeypatch.setattr(NewsDatabase, '_TheStarSearchPage', page('TheStar'))
+    monkeypatch.setattr(NewsDatabase, '_TheEdgeSearchPage', page('TheEdge'))
+    return requests
+
+## Original Loop: Every Page Until The First Empty One, Links Deduplicated
+def _Baseline(source, keywords):
+    first = 1 if source == 'TheStar' else 0
+    links = []
+    for keyword in keywords:
+        keyword = keyword.replace(' ', '+' if source == 'TheStar' else '%20')
+        for page_no in range(first, 400):
+            page_links = _Links(source, keyword, page_no)
+            if len(page_links) == 0: break
+            links = links + page_links
+    return set([ hasher(x).hexdigest() for x in links ])
+
+## CSV Storage In The Working Directory: No Links Or News Yet
+def _Database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(os.path.dirname(links_db), exist_ok=True)
+    pd.DataFrame(columns=['Id'] + NewsDatabase._LINKS_COLUMNS).to_csv(links_db, index=False)
+    pd.DataFrame(columns=['Id'] + NewsDatabase._NEWS_COLUMNS).to_csv(news_db, index=False)
+    return NewsDatabase(cache_html=False)
+
+def test_harvest_same_as_loop(tmp_path, monkeypatch):
+    requests = _SearchPages(monkeypatch)
+    db = _Database(tmp_path, monkeypatch)
+    db.TheStarFetchLinksFromKeywords('telekom', save=False, workers=4)
+    assert set(db.LINKS_DF.index) == _Baseline('TheStar', ['telekom'])
+    assert not db.LINKS_DF.index.duplicated().any()
+    assert (db.LINKS_DF.Source == 'TheStar').all()
+    ## pages past the first empty one: only those already in flight (window)
+    pages = [ x[2] for x in requests ]
+    assert set(range(1, 14)) <= set(pages) and max(pages) <= 13 + 4
+    db.TheEdgeFetchLinksFromKeywords('cimb', save=False, workers=2)
+    assert set(db.LINKS_DF.index) == _Baseline('TheStar', ['telekom']) | _Baseline('TheEdge', ['cimb'])
+
+## Pages Of Links Known Before The Harvest End The Stream, A Failed Page Is The Last
+def test_harvest_early_termination(tmp_path, monkeypatch):
+    requests = _SearchPages(monkeypatch, fail=('TheEdge', 'maybank', 4))
+    db = _Database(tmp_path, monkeypatch)
+    db.SEEN_LINKS.Add([ hasher(x).hexdigest() for x in _Links('TheStar', 'telekom', 3) ])
+    db.TheStarFetchLinksFromKeywords('telekom', save=False, workers=1)
+    assert set(db.LINKS_DF.index) == set([ hasher(x).hexdigest() for p in [1, 2] for x in _Links('TheStar', 'telekom', p) ])
+    assert max([ x[2] for x in requests ]) == 3
+    db.TheEdgeFetchLinksFromKeywords('maybank', save=False, workers=1)
+    assert set(db.LINKS_DF[db.LINKS_DF.Source == 'TheEdge'].index) == set([ hasher(x).hexdigest() for p in range(4) for x in _Links('TheEdge', 'maybank', p) ])
+
+def test_batch_same_as_loop_per_keyword(tmp_path, monkeypatch):
+    _SearchPages(monkeypatch)
+    db    = _Database(tmp_path, monkeypatch)
+    saves = []
+    save  = NewsDatabase.SaveToLocalStorage
+    monkeypatch.setattr(NewsDatabase, 'SaveToLocalStorage', lambda self: saves.append(1) or save(self))
+    keywords = ['maybank', 'cimb', 'public bank', ' maybank ', 'telekom', '']
+    db.FetchLinksFromKeywordsBatch(keywords, workers=3, window=2)
+    expected = _Baseline('TheStar', keywords[:3] + ['telekom']) | _Baseline('TheEdge', keywords[:3] + ['telekom'])
+    assert set(db.LINKS_DF.index) == expected
+    assert not db.LINKS_DF.index.duplicated().any()
+    assert len(saves) == 1
+    saved = pd.read_csv(links_db, index_col='Id')
+    assert set(saved.index) == expected and len(saved) == len(expected)
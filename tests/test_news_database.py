@@ -0,0 +1,84 @@
+#######################################################################################
+### Module: test_news_database
+### Date: 18 Oct 2026
+### Features:  - FetchNewsFromLinks in batches (CSV mode): NEWS_DF and news_db.csv hold every
+###              valid article once, news segments merged, checkpoint removed
+###            - Journal mode (NewsStore): fetched news and harvested links appended as
+###              segments, same news and links on reload before and after compaction
+#######################################################################################
+
+import os
+import json
+import pandas as pd
+from xxhash import xxh64 as hasher
+from Modules.ArticleParsers import ParseArticle
+from Modules.NewsStore import NewsStore
+from Modules.NewsDatabase import NewsDatabase, links_db, news_db, links_segments, news_segments, fetch_checkpoint
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'html')
+
+## Fixture Pages: Link -> (Source, Content)
+def _Pages():
+    with open(os.path.join(FIXTURES, 'index.json')) as f:
+        index = json.load(f)
+    pages = {}
+    for x in index:
+        with open(os.path.join(FIXTURES, x['Name'] + '.html'), 'rb') as f:
+            pages[x['Link']] = (x['Source'], f.read())
+    return pages
+
+## CSV Storage In The Working Directory: Links To Fetch, No News Yet
+def _CsvStorage(links):
+    os.makedirs(os.path.dirname(links_db), exist_ok=True)
+    pd.DataFrame({'Id': [ hasher(x[0]).hexdigest() for x in links ],
+                  'Link': [ x[0] for x in links ], 'Source': [ x[1] for x in links ]}).to_csv(links_db, index=False)
+    pd.DataFrame(columns=['Id'] + NewsDatabase._NEWS_COLUMNS).to_csv(news_db, index=False)
+
+## Every Valid Article Committed Once, Over Several Batches
+def test_fetch_batches(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pages = _Pages()
+    _CsvStorage([ (link, pages[link][0]) for link in pages ])
+    monkeypatch.setattr(NewsDatabase, '_FetchArticle', lambda self, row, output=True: ParseArticle(pages[row.Link][0], row.Link, pages[row.Link][1]))
+    expected = pd.DataFrame([ x for x in [ ParseArticle(s, link, c) for link, (s, c) in pages.items() ] if x ]).set_index('Id').dropna(axis=0)
+
+    db = NewsDatabase(cache_html=False)
+    db.FetchNewsFromLinks(output=False, batch_size=3)
+
+    assert sorted(db.NEWS_DF.index) == sorted(expected.index)
+    assert db.NEWS_DF.loc[expected.index, 'Headline'].tolist() == expected.Headline.tolist()
+    saved = pd.read_csv(news_db, index_col='Id')
+    assert sorted(saved.index) == sorted(expected.index)
+    assert os.listdir(news_segments) == []
+    assert not os.path.isfile(fetch_checkpoint)
+
+## Journal Saves: Segments Only, Reload And Compaction Give The Same News And Links
+def test_journal_save_and_compact(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pages    = _Pages()
+    articles = pd.DataFrame([ x for x in [ ParseArticle(s, link, c) for link, (s, c) in pages.items() ] if x ]).set_index('Id').dropna(axis=0)
+    stored   = articles.iloc[:2]
+    _CsvStorage([ (link, pages[link][0]) for link in pages if hasher(link).hexdigest() not in stored.index ])
+    NewsStore().Write(stored)
+    monkeypatch.setattr(NewsDatabase, '_FetchArticle', lambda self, row, output=True: ParseArticle(pages[row.Link][0], row.Link, pages[row.Link][1]))
+    harvested = [ 'https://www.thestar.com.my/news/harvested-{}'.format(i) for i in range(5) ]
+    monkeypatch.setattr(NewsDatabase, '_TheStarSearchPage', lambda self, keyword, page_no, date_from, date_to: harvested if page_no == 1 else [])
+
+    db = NewsDatabase(cache_html=False)
+    assert db._JOURNAL
+    db.FetchNewsFromLinks(output=False, batch_size=3)
+    db.FetchLinksFromKeywordsBatch(['maybank'], sources=['TheStar'])
+    assert len(NewsStore().Segments()) > 0 and len(db._LinksSegments()) == 1
+    ## links without a valid article stay to fetch, as in CSV mode
+    expected_links = sorted([ hasher(x).hexdigest() for x in harvested + list(pages) if hasher(x).hexdigest() not in articles.index ])
+
+    def check():
+        reloaded = NewsDatabase(cache_html=False)
+        assert sorted(reloaded.NEWS_DF.index) == sorted(articles.index)
+        assert reloaded.NEWS_DF.loc[articles.index, 'Headline'].tolist() == articles.Headline.tolist()
+        assert sorted(reloaded.LINKS_DF.index) == expected_links
+        return reloaded
+    check().CompactStorage()
+    assert NewsStore().Segments() == [] and os.listdir(links_segments) == []
+    assert sorted(pd.read_csv(links_db, index_col='Id').index) == expected_links
+    check()
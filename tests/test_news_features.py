@@ -0,0 +1,116 @@
+#######################################################################################
+### Module: test_news_features
+### Date: 18 Oct 2026
+### Features:  - SentiLexicon round trip: saved entries looked up again after reload
+###            - features_from_tagged equals the original per-token swn.senti_synsets loop
+###              (skipped when WordNet / SentiWordNet data is missing)
+###            - tag_documents gives the token stream and tags of the original per-sentence
+###              word_tokenize and pos_tag (skipped when Punkt / tagger data is missing)
+#######################################################################################
+
+import os
+import json
+import numpy as np
+import nltk
+import pytest
+from nltk.tokenize import sent_tokenize
+from nltk.corpus   import sentiwordnet as swn
+from nltk.corpus   import wordnet      as wn
+import Modules.NewsFeatures as NewsFeatures
+from Modules.NewsFeatures import penn_to_wn, features_from_tagged, tag_documents
+from Modules.SentiLexicon import SentiLexicon
+from Modules.ArticleParsers import ParseArticle
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'html')
+
+## NLTK Data Installed
+def _HasData(load):
+    try:
+        load()
+        return True
+    except LookupError:
+        return False
+
+HAS_WORDNET = _HasData(lambda: (wn.ensure_loaded(), swn.ensure_loaded()))
+HAS_TAGGER  = _HasData(lambda: nltk.pos_tag(nltk.word_tokenize(sent_tokenize('Tagger data installed.')[0])))
+
+## Texts: Fixture Details Plus Abbreviations, Decimals, Quotes And Contractions
+def _Texts():
+    with open(os.path.join(FIXTURES, 'index.json')) as f:
+        index = json.load(f)
+    texts = ['Mr. Tan said U.S. shares rose 5.5% on Jan. 3. Dr. Lim agreed... "It wasn\'t bad," he said.',
+             'Bursa ends higher!! Banks gain :) while oil stocks fall (again).', '']
+    for x in index:
+        with open(os.path.join(FIXTURES, x['Name'] + '.html'), 'rb') as f:
+            article = ParseArticle(x['Source'], x['Link'], f.read())
+        if article and article['Detail']:
+            texts = texts + [article['Headline'], article['Detail']]
+    return [ x.replace('<br>', '') for x in texts ]
+
+## Original Per-Token Loop (phase1 features_from_text), From POS Tagged Sentences
+def _BaselineFromTagged(tagged_sentences):
+    word_count = wn_tokens = pos_words = neg_words = neu_words = 0
+    neg_score  = pos_score = obj_score = 0.00
+    for penn_tagged in tagged_sentences:
+        wn_tagged   = [ (x, penn_to_wn(y)) for (x,y) in penn_tagged ]
+        word_count  += len(penn_tagged)
+        for word, postag in wn_tagged:
+            synsets = list(swn.senti_synsets(word, pos=postag))
+            if synsets:
+                synset = synsets[0]
+                pos_score  += synset.pos_score()
+                neg_score  += synset.neg_score()
+                obj_score  += synset.obj_score()
+                wn_tokens += 1
+                if synset.pos_score() > synset.neg_score():
+                    pos_words += 1
+                elif synset.pos_score() < synset.neg_score():
+                    neg_words += 1
+                else:
+                    neu_words += 1
+    return len(tagged_sentences), word_count, wn_tokens, pos_score, neg_score, obj_score, pos_words, neg_words, neu_words
+
+@pytest.fixture
+def lexicon(tmp_path, monkeypatch):
+    monkeypatch.setattr(NewsFeatures, 'LEXICON', SentiLexicon(str(tmp_path / 'senti_lexicon')))
+    return NewsFeatures.LEXICON
+
+## Saved Entries Found Again, Case Insensitive, Missing Words NaN
+def test_lexicon_round_trip(tmp_path, monkeypatch):
+    lexicon = SentiLexicon(str(tmp_path / 'senti_lexicon'))
+    lexicon.Update({ lexicon._Key('good', 'a'): (0.75, 0.0, 0.25), lexicon._Key('loss', 'n'): (0.0, 0.5, 0.5),
+                     lexicon._Key('xyzzy', None): (np.nan, np.nan, np.nan) })
+    lexicon.Save()
+    monkeypatch.setattr(SentiLexicon, '_Compute', lambda self, word, pos: pytest.fail('not stored: {} {}'.format(word, pos)))
+    scores = SentiLexicon(str(tmp_path / 'senti_lexicon')).Lookup(['Good', 'loss', 'xyzzy'], ['a', 'n', None])
+    assert scores[:2].tolist() == [[0.75, 0.0, 0.25], [0.0, 0.5, 0.5]]
+    assert np.isnan(scores[2]).all()
+
+## Same Features As The Per-Token Loop, Computed And Then From The Saved Lexicon
+@pytest.mark.skipif(not HAS_WORDNET, reason='WordNet / SentiWordNet data not installed')
+def test_features_same_as_swn_loop(lexicon):
+    sentences = [[('Shares', 'NNS'), ('rose', 'VBD'), ('sharply', 'RB'), ('on', 'IN'), ('strong', 'JJ'), ('earnings', 'NNS'), ('.', '.')],
+                 [('The', 'DT'), ('bank', 'NN'), ('reported', 'VBD'), ('a', 'DT'), ('heavy', 'JJ'), ('loss', 'NN'), (',', ','), ('investors', 'NNS'),
+                  ('were', 'VBD'), ("n't", 'RB'), ('happy', 'JJ'), ('!', '.')],
+                 [('Bursa', 'NNP'), ('Malaysia', 'NNP'), ('good', 'JJ'), ('Good', 'JJ'), ('bad', 'JJ'), ('xyzzy', 'NN')]]
+    tagged   = [ pair for sentence in sentences for pair in sentence ]
+    expected = _BaselineFromTagged(sentences)
+    assert features_from_tagged(len(sentences), tagged) == pytest.approx(expected)
+    lexicon.Save()
+    NewsFeatures.LEXICON = SentiLexicon(lexicon.PATH)
+    assert features_from_tagged(len(sentences), tagged) == pytest.approx(expected)
+    assert features_from_tagged(0, []) == (0, 0, 0, 0.00, 0.00, 0.00, 0, 0, 0)
+
+## Token Stream And Tags Of The Original Per-Sentence word_tokenize And pos_tag
+@pytest.mark.skipif(not HAS_TAGGER, reason='Punkt / POS tagger data not installed')
+def test_tokens_same_as_baseline():
+    texts    = _Texts()
+    expected = [ (len(sent_tokenize(x)), [ pair for s in sent_tokenize(x) for pair in nltk.pos_tag(nltk.word_tokenize(s)) ]) for x in texts ]
+    assert tag_documents(texts) == expected
+
+## Whole Text: Same SentiWordNet Features As The Original features_from_text
+@pytest.mark.skipif(not (HAS_WORDNET and HAS_TAGGER), reason='NLTK data not installed')
+def test_text_features_same_as_baseline(lexicon):
+    for text in _Texts():
+        sentences = [ nltk.pos_tag(nltk.word_tokenize(s)) for s in sent_tokenize(text) ]
+        assert features_from_tagged(*tag_documents([text])[0]) == pytest.approx(_BaselineFromTagged(sentences))
@@ -0,0 +1,69 @@
+#######################################################################################
+### Module: test_news_query
+### Date: 18 Oct 2026
+### Features:  - NewsDatabase.Query gives the rows and columns of the pandas filters on the
+###              whole NEWS_DF, sorted by CreatedDate: fully loaded CSV (time index),
+###              partially loaded CSV (chunked scan, news segments included) and NewsStore
+#######################################################################################
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from Modules.NewsStore import NewsStore
+from Modules.NewsDatabase import NewsDatabase, links_db, news_db, news_segments
+
+## News Across Months And Sources, Some Undated, Times Shared By Several Articles
+def _News(n=120, seed=0):
+    rng  = np.random.default_rng(seed)
+    ids  = [ '{:016x}'.format(x) for x in rng.integers(1, 2**62, n) ]
+    df   = pd.DataFrame({'Link':        [ 'https://news/{}'.format(x) for x in ids ],
+                         'Source':      rng.choice(['TheStar', 'TheEdge'], n),
+                         'CreatedDate': pd.Timestamp('2020-01-15') + pd.to_timedelta(rng.integers(0, 90 * 4, n) * 6, 'h'),
+                         'Headline':    [ 'Headline {}'.format(i) for i in range(n) ],
+                         'Detail':      [ 'Detail {}'.format(i) for i in range(n) ],
+                         'Category':    rng.choice(['Business', 'Markets'], n)}, index=pd.Index(ids, name='Id'))
+    df.loc[df.index[:3], 'CreatedDate'] = pd.NaT
+    return df
+
+## Pandas Filters On The Whole Frame, date_to Inclusive (Whole Day When Date Only)
+def _Baseline(news, date_from=None, date_to=None, sources=None):
+    mask = pd.Series(True, index=news.index)
+    if date_from is not None: mask = mask & (news.CreatedDate >= pd.Timestamp(date_from))
+    if date_to   is not None:
+        date_to = pd.Timestamp(date_to)
+        mask = mask & ((news.CreatedDate < date_to + pd.Timedelta(days=1)) if date_to == date_to.normalize() else (news.CreatedDate <= date_to))
+    if sources   is not None: mask = mask & news.Source.isin(sources if type(sources) == list else [sources])
+    return news[mask]
+
+QUERIES = [{}, {'date_from': '2020-02-01'}, {'date_to': '2020-02-29'}, {'date_from': '2020-02-01', 'date_to': '2020-02-29'},
+           {'date_from': '2020-03-01 06:00', 'date_to': '2020-03-10 12:00'}, {'sources': 'TheEdge'},
+           {'date_from': '2020-01-20', 'date_to': '2020-01-31', 'sources': ['TheStar', 'TheEdge']}, {'date_from': '2021-01-01'}]
+
+@pytest.mark.parametrize('mode', ['csv', 'csv-partial', 'store'])
+def test_query_same_as_filters(tmp_path, monkeypatch, mode):
+    monkeypatch.chdir(tmp_path)
+    news = _News()
+    os.makedirs(os.path.dirname(links_db), exist_ok=True)
+    pd.DataFrame(columns=['Id'] + NewsDatabase._LINKS_COLUMNS).to_csv(links_db, index=False)
+    if mode == 'store':
+        NewsStore().Write(news)
+    else:
+        ## last articles still in a news segment (interrupted fetch)
+        news.iloc[:100].to_csv(news_db)
+        os.makedirs(news_segments)
+        news.iloc[100:].to_csv(os.path.join(news_segments, 'seg-00000000000000000001-1.csv'))
+    monkeypatch.setattr(NewsStore, '_CSV_CHUNKSIZE', 30)
+    db = NewsDatabase(cache_html=False, load=(mode != 'csv-partial'))
+
+    for query in QUERIES:
+        expected = _Baseline(news, **query)
+        for columns in [None, ['Headline', 'CreatedDate'], 'Detail']:
+            got = db.Query(columns=columns, **query)
+            assert sorted(got.index) == sorted(expected.index), query
+            assert list(got.columns) == (list(news.columns) if columns is None else [columns] if type(columns) == str else columns)
+            if 'CreatedDate' in got.columns:
+                dates = pd.to_datetime(got.CreatedDate)
+                assert dates.dropna().is_monotonic_increasing and dates.isna().sum() == expected.CreatedDate.isna().sum()
+            if 'Detail' in got.columns:
+                assert got.Detail.tolist() == news.loc[got.index, 'Detail'].tolist()
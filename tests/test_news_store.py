@@ -0,0 +1,127 @@
+#######################################################################################
+### Module: test_news_store
+### Date: 18 Oct 2026
+### Features:  - NewsStore round trip: same articles as the written frame, column projection,
+###              date range and source filters as the pandas filters on the frame
+###            - Migration from news_db.csv: same articles as the CSV, interrupted migration
+###              leaves no store
+###            - Replace: new content, segments dropped; a swap interrupted at any step
+###              opens as the complete old or new store
+#######################################################################################
+
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pytest
+import Modules.NewsStore as NewsStoreModule
+from Modules.NewsStore import NewsStore
+
+COLUMNS = ['Link', 'Source', 'CreatedDate', 'Headline', 'Detail', 'Category']
+
+## News Frame Across Months And Sources, With Missing Text And Undated Articles
+def _News(n=60, seed=0):
+    rng  = np.random.default_rng(seed)
+    ids  = [ '{:016x}'.format(x) for x in rng.integers(1, 2**62, n) ]
+    df   = pd.DataFrame({'Link':        [ 'https://news/{}'.format(x) for x in ids ],
+                         'Source':      rng.choice(['TheStar', 'TheEdge'], n),
+                         'CreatedDate': pd.Timestamp('2020-01-15') + pd.to_timedelta(rng.integers(0, 90 * 24, n), 'h'),
+                         'Headline':    [ 'Headline {}'.format(i) for i in range(n) ],
+                         'Detail':      [ 'Detail {}'.format(i) if i % 7 else None for i in range(n) ],
+                         'Category':    rng.choice(['Business', 'Markets'], n)}, index=pd.Index(ids, name='Id'))
+    df.loc[df.index[:2], 'CreatedDate'] = pd.NaT
+    return df
+
+## Frames Equal Regardless Of Row Order And String Dtypes
+def _Same(got, expected):
+    got, expected = got.sort_index(), expected.sort_index()
+    assert list(got.index) == list(expected.index)
+    for col in expected.columns:
+        if col == 'CreatedDate':
+            assert (pd.to_datetime(got[col]).values.astype('datetime64[ns]') == pd.to_datetime(expected[col]).values.astype('datetime64[ns]')).sum() == expected[col].notna().sum()
+            assert got[col].isna().equals(expected[col].isna())
+        else:
+            assert got[col].astype(object).where(got[col].notna(), None).tolist() == expected[col].astype(object).where(expected[col].notna(), None).tolist()
+
+def test_round_trip(tmp_path):
+    store = NewsStore(str(tmp_path / 'store'))
+    news  = _News()
+    store.Write(news.iloc[:40])
+    store.AppendSegment(news.iloc[40:])
+    _Same(store.Load(), news)
+    _Same(store.Load(columns=['Headline']), news[['Headline']])
+    dated = news[news.CreatedDate.notna()]
+    _Same(store.Load(date_from='2020-02-01', date_to='2020-03-10'),
+          dated[(dated.CreatedDate >= '2020-02-01') & (dated.CreatedDate < '2020-03-11')])
+    _Same(store.Load(sources='TheEdge'), news[news.Source == 'TheEdge'])
+
+    ## Compacted Segments And Upserted Rows: Latest Wins
+    store.Compact()
+    assert len(store.Segments()) == 0
+    changed = news.iloc[[0, 45]].copy()
+    changed['Headline'] = 'Changed'
+    store.AppendSegment(changed)
+    news.loc[changed.index, 'Headline'] = 'Changed'
+    _Same(store.Load(), news)
+
+def test_migrate(tmp_path):
+    news = _News()
+    news.to_csv(tmp_path / 'news_db.csv')
+    store = NewsStore(str(tmp_path / 'store'))
+    assert store.MigrateFromCsv(str(tmp_path / 'news_db.csv'), chunksize=25) == len(news)
+    _Same(store.Load(), pd.read_csv(tmp_path / 'news_db.csv', index_col='Id'))
+
+## Interrupted Migration: No Partial Store Becomes The Database
+def test_migrate_interrupted(tmp_path, monkeypatch):
+    _News().to_csv(tmp_path / 'news_db.csv')
+    write = NewsStore.Write
+    calls = []
+    def failing_write(self, df, overwrite=False):
+        calls.append(len(df))
+        if len(calls) > 1: raise KeyboardInterrupt()
+        return write(self, df, overwrite)
+    monkeypatch.setattr(NewsStore, 'Write', failing_write)
+    store = NewsStore(str(tmp_path / 'store'))
+    with pytest.raises(KeyboardInterrupt):
+        store.MigrateFromCsv(str(tmp_path / 'news_db.csv'), chunksize=25)
+    assert not NewsStore(str(tmp_path / 'store')).Exists()
+    monkeypatch.setattr(NewsStore, 'Write', write)
+    assert NewsStore(str(tmp_path / 'store')).MigrateFromCsv(str(tmp_path / 'news_db.csv'), chunksize=25) == 60
+    assert len(NewsStore(str(tmp_path / 'store')).Load()) == 60
+
+def test_replace(tmp_path):
+    news  = _News()
+    store = NewsStore(str(tmp_path / 'store'))
+    store.Write(news.iloc[:40])
+    store.AppendSegment(news.iloc[40:])
+    assert store.Replace(news.iloc[10:50]) == 40
+    assert len(store.Segments()) == 0
+    _Same(store.Load(), news.iloc[10:50])
+    assert sorted(os.listdir(tmp_path)) == ['store']
+
+## Swap Interrupted: Before The Store Moved Aside (Old Kept), After (New Completed)
+@pytest.mark.parametrize('failing, kept', [(lambda src, dst: dst.endswith('.old'), 'old'),
+                                            (lambda src, dst: src.endswith('.new'), 'new')])
+def test_replace_interrupted(tmp_path, monkeypatch, failing, kept):
+    news    = _News()
+    path    = str(tmp_path / 'store')
+    NewsStore(path).Write(news.iloc[:40])
+    replace = os.replace
+    def failing_replace(src, dst):
+        if failing(str(src), str(dst)): raise KeyboardInterrupt()
+        return replace(src, dst)
+    monkeypatch.setattr(NewsStoreModule.os, 'replace', failing_replace)
+    with pytest.raises(KeyboardInterrupt):
+        NewsStore(path).Replace(news.iloc[20:])
+    monkeypatch.setattr(NewsStoreModule.os, 'replace', replace)
+    _Same(NewsStore(path).Load(), news.iloc[:40] if kept == 'old' else news.iloc[20:])
+    assert os.listdir(tmp_path) == ['store']
+
+## Only The Moved Aside Store Left: Rolled Back
+def test_replace_rolled_back(tmp_path):
+    news = _News()
+    path = str(tmp_path / 'store')
+    NewsStore(path).Write(news)
+    shutil.move(path, path + '.old')
+    _Same(NewsStore(path).Load(), news)
+    assert not os.path.isdir(path + '.old')
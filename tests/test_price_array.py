@@ -0,0 +1,98 @@
+#######################################################################################
+### Module: test_price_array
+### Date: 18 Oct 2026
+### Features:  - FromFrame / ToFrame round trip of the (symbol, field) column frame
+###            - ForwardReturns same as the original per symbol and horizon shift loop of
+###              phase4 (simple returns), and as the log of the price ratio
+###            - GroupIndex same as the original market cap weighted sums of phase4, and as
+###              the mean price (equal weighting); a day with no priced member is NaN (not 0)
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+from Modules.PriceArray import PriceArray, ForwardReturns, GroupIndex
+
+FSI     = ['MBBM.KL', 'PUBM.KL', 'CIMB.KL']
+TELCO   = ['MXSC.KL', 'TLMM.KL']
+SYMBOLS = FSI + TELCO
+FIELDS  = ['OPENPRICE', 'CLOSEPRICE', 'MARKETCAP']
+
+## Daily Prices With Missing Values, One Symbol Without Any Price In The First Week
+def _Prices(n=60, seed=0):
+    rng     = np.random.default_rng(seed)
+    close   = 10 * np.exp(np.cumsum(rng.normal(0, 0.02, (n, len(SYMBOLS))), axis=0))
+    open_   = close * np.exp(rng.normal(0, 0.01, close.shape))
+    cap     = close * rng.integers(1000, 5000, len(SYMBOLS))
+    columns = pd.MultiIndex.from_product([SYMBOLS, FIELDS])
+    df      = pd.DataFrame(np.stack([open_, close, cap], axis=2).reshape(n, -1), columns=columns,
+                           index=pd.bdate_range('2019-12-02', periods=n, name='Date'))
+    df      = df.mask(rng.random(df.shape) < 0.08)
+    df.loc[df.index[:5], 'TLMM.KL'] = np.nan
+    return df
+
+def test_frame_round_trip():
+    df     = _Prices()
+    prices = PriceArray().FromFrame(df)
+    assert prices.SYMBOLS == SYMBOLS and prices.FIELDS == FIELDS
+    pd.testing.assert_frame_equal(prices.ToFrame(), df, check_names=False)
+    pd.testing.assert_frame_equal(prices.ToFrame(columns=[('CIMB.KL', 'CLOSEPRICE')]), df.loc[:, [('CIMB.KL', 'CLOSEPRICE')]], check_names=False)
+    ## Missing Symbol And Field: All NaN
+    other = PriceArray().FromFrame(df, symbols=['CIMB.KL', 'NONE.KL'], fields=['CLOSEPRICE', 'VOLUME'])
+    assert np.isnan(other.VALUES[:, 1, :]).all() and np.isnan(other.VALUES[:, :, 1]).all()
+    np.testing.assert_array_equal(other.Field('CLOSEPRICE')[:, 0], df['CIMB.KL', 'CLOSEPRICE'].values)
+
+## Original phase4 Loop: One Shifted Column Per Symbol And Horizon
+def _BaselineReturns(returns, symbols, future_days=5):
+    returns = returns.copy()
+    for sym in symbols:
+        temp_df = returns.loc[ :, sym ]
+        for i in range (0,future_days+1):
+            returns[sym, 'RD{:02d}'.format(i)] = ((temp_df.CLOSEPRICE.shift(-1*i) - temp_df.OPENPRICE) / temp_df.OPENPRICE)*100
+    return returns
+
+def test_forward_returns_same_as_loop():
+    df       = _Prices()
+    expected = _BaselineReturns(df, SYMBOLS)
+    prices   = PriceArray().FromFrame(df, fields=['OPENPRICE', 'CLOSEPRICE'])
+    got      = ForwardReturns(prices, horizons=range(6), dtype=np.float64).ToFrame()
+    columns  = [ (s, 'RD{:02d}'.format(i)) for s in SYMBOLS for i in range(6) ]
+    np.testing.assert_allclose(got.loc[:, columns].values, expected.loc[:, columns].values, rtol=1e-12)
+    ## float32 by default: same to rounding of 2 decimals
+    np.testing.assert_allclose(ForwardReturns(prices).ToFrame().loc[:, columns].values, expected.loc[:, columns].values, atol=1e-3)
+
+    ## Log Returns, Other Horizons, Fractions
+    got = ForwardReturns(prices, horizons=[3, 0, 10], method='log', percent=False, dtype=np.float64)
+    assert got.FIELDS == ['RD03', 'RD00', 'RD10']
+    for h in [3, 0, 10]:
+        np.testing.assert_allclose(got.Field('RD{:02d}'.format(h)), np.log(df.xs('CLOSEPRICE', axis=1, level=1).shift(-h) / df.xs('OPENPRICE', axis=1, level=1)).values, rtol=1e-12)
+
+## Original phase4 Index: Market Cap Weights Of The Day, Weighted Prices Summed
+def _BaselineIndex(df, symbols, name):
+    group       = df.loc[:, symbols]
+    mcap_weight = group.xs('MARKETCAP', axis=1, level=1).div(group.xs('MARKETCAP', axis=1, level=1).sum(axis=1), axis=0)
+    index_open  = (group.xs('OPENPRICE', axis=1, level=1) * mcap_weight).sum(axis=1)
+    index_close = (group.xs('CLOSEPRICE', axis=1, level=1) * mcap_weight).sum(axis=1)
+    index       = pd.concat([index_open, index_close], axis=1)
+    index.columns = [(name,'OPENPRICE'), (name,'CLOSEPRICE')]
+    return index
+
+def test_group_index_same_as_phase4():
+    df = _Prices()
+    df.loc[df.index[2], ('MXSC.KL', 'OPENPRICE')] = np.nan     ## no TELCO open price that day
+    groups = {'FSI_INDEX': FSI, 'TELCO_INDEX': TELCO}
+    got    = GroupIndex(PriceArray().FromFrame(df), groups).ToFrame()
+    for name, symbols in groups.items():
+        expected = _BaselineIndex(df, symbols, name)
+        for field in ['OPENPRICE', 'CLOSEPRICE']:
+            ## days without a priced member: 0 in phase4, NaN now
+            weighted = df.loc[:, [ (s, field) for s in symbols ]].values * df.loc[:, [ (s, 'MARKETCAP') for s in symbols ]].values
+            unpriced = np.isnan(weighted).all(axis=1)
+            np.testing.assert_allclose(got[name, field].values[~unpriced], expected[name, field].values[~unpriced], rtol=1e-12)
+            assert np.isnan(got[name, field].values[unpriced]).all() and (expected[name, field].values[unpriced] == 0).all()
+    assert np.isnan(got.loc[df.index[2], ('TELCO_INDEX', 'OPENPRICE')])
+
+    ## Equal Weighting: Mean Price Of The Priced Members
+    got = GroupIndex(PriceArray().FromFrame(df), groups, weighting='equal').ToFrame()
+    for name, symbols in groups.items():
+        for field in ['OPENPRICE', 'CLOSEPRICE']:
+            np.testing.assert_allclose(got[name, field].values, df.loc[:, [ (s, field) for s in symbols ]].mean(axis=1).values, rtol=1e-12)
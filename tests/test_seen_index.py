@@ -0,0 +1,56 @@
+#######################################################################################
+### Module: test_seen_index
+### Date: 18 Oct 2026
+### Features:  - Hex Id <-> uint64 round trip, Ids read as int from CSV included
+###            - Membership same as the set of Ids (isin) after Build, Add, Flush, Merge,
+###              and on reload: only flushed Ids persisted
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+from Modules.SeenIndex import SeenIndex, ToUint64, FromUint64
+
+## Random Hex Ids, Some With Leading Zeros
+def _Ids(n, seed):
+    rng = np.random.default_rng(seed)
+    ids = [ '{:016x}'.format(x) for x in rng.integers(0, 2**63, n, dtype=np.uint64) ]
+    return ids + [ '{:016x}'.format(x) for x in rng.integers(0, 2**20, 5) ]
+
+def test_uint64_round_trip():
+    ids = _Ids(200, 0) + ['ffffffffffffffff', '0000000000000000']
+    assert list(FromUint64(ToUint64(ids))) == ids
+    assert ToUint64(ToUint64(ids)).tolist() == ToUint64(ids).tolist()
+    assert ToUint64([]).dtype == np.uint64 and len(FromUint64(ToUint64([]))) == 0
+    ## all digit Id read as int by read_csv: same value as its hex string
+    assert ToUint64([1234, '0000000000001234']).tolist() == [0x1234, 0x1234]
+
+## Membership As isin On The Ids Known, At Every Step And After Reload
+def test_contains_same_as_isin(tmp_path, monkeypatch):
+    monkeypatch.setattr(SeenIndex, '_MERGE_MIN', 50)
+    monkeypatch.setattr(SeenIndex, '_MERGE_RATIO', 0.0)
+    path   = str(tmp_path / 'seen')
+    built, added, later = _Ids(300, 1), _Ids(40, 2), _Ids(80, 3)
+    probe  = pd.Index(built[::3] + added[::2] + later[::2] + _Ids(100, 4))
+    def check(index, known):
+        assert index.Contains(probe).tolist() == probe.isin(known).tolist()
+        assert list(FromUint64(index.Values())) == sorted(set(known))
+        assert len(index) == len(set(known))
+
+    index = SeenIndex('links', path)
+    assert not index.Exists()
+    check(index, [])
+    index.Build(built + built[:10])
+    check(index, built)
+    index.Add(added)
+    check(index, built + added)
+    check(SeenIndex('links', path), built)           ## pending not persisted
+    index.Flush()
+    check(SeenIndex('links', path), built + added)   ## appended to delta
+    assert added[0] in index and probe[-1] not in index
+
+    ## Delta Above 50 Ids: Merged Into Base, Delta Removed
+    index.Add(later + built[:5])
+    index.Flush()
+    reloaded = SeenIndex('links', path)
+    assert len(reloaded._DELTA) == 0 and len(reloaded._BASE) == len(set(built + added + later))
+    check(reloaded, built + added + later)
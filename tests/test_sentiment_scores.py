@@ -0,0 +1,49 @@
+#######################################################################################
+### Module: test_sentiment_scores
+### Date: 18 Oct 2026
+### Features:  - One grouped pass (LongEntities, DailySums, DailyScores, WideScores) gives the
+###              daily mean, count and sum of the original per symbol groupby loop (phase3),
+###              symbols without news included as empty columns
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from Modules.EntityMatrix import EntityMatrix
+from Modules.SentimentScores import SOURCES, LongEntities, DailySums, DailyScores, WideScores
+
+SYMBOLS = ['MBBM.KL', 'CIMB.KL', 'TLMM.KL', 'MXSC.KL', 'FSI_INDEX']
+
+## Articles Over Three Weeks With Scores (Some NaN), Last Symbol Never Mentioned
+def _Articles(n=80, seed=1):
+    rng      = np.random.default_rng(seed)
+    ids      = [ '{:016x}'.format(x) for x in rng.integers(1, 2**62, n) ]
+    articles = pd.DataFrame({'CreatedDate': pd.Timestamp('2020-03-02') + pd.to_timedelta(rng.integers(0, 21, n), 'D'),
+                             'Combined_WN_Sentiment': rng.integers(0, 100, n) / 100,
+                             'Combined_TB_Polarity':  rng.integers(-100, 100, n) / 100}, index=pd.Index(ids, name='Id'))
+    articles.iloc[::7, 1] = np.nan
+    counts   = rng.integers(1, 4, (n, len(SYMBOLS))) * (rng.random((n, len(SYMBOLS))) < 0.4)
+    counts[:, -1] = 0
+    return articles, EntityMatrix(ids, SYMBOLS, sp.csr_matrix(counts))
+
+## Original phase3 Loop: One groupby Per Symbol Over The Boolean Entity Columns
+def _Baseline(articles, entities, column, agg):
+    news_entity_sentiment = pd.concat([articles, entities.ToFrame().set_axis(articles.index)], axis=1)
+    sentiment_scores = pd.DataFrame()
+    for sym in SYMBOLS:
+        temp_df = news_entity_sentiment.loc[news_entity_sentiment[sym], [column, 'CreatedDate']]
+        temp_df = temp_df.groupby('CreatedDate').agg(agg)
+        temp_df.rename(columns={column:sym}, inplace=True)
+        sentiment_scores = pd.concat([sentiment_scores, temp_df], axis=1)
+    return sentiment_scores.sort_index()
+
+def test_daily_scores_same_as_loop():
+    articles, entities = _Articles()
+    scores = DailyScores(DailySums(LongEntities(entities, articles, list(SOURCES.values()))))
+    for source, column in SOURCES.items():
+        for agg in ['mean', 'count', 'sum']:
+            got      = WideScores(scores, source=source, aggregator=agg, symbols=SYMBOLS)
+            expected = _Baseline(articles, entities, column, agg)
+            assert list(got.index) == list(expected.index)
+            assert list(got.columns) == SYMBOLS
+            np.testing.assert_allclose(got.values.astype(float), expected.values.astype(float))
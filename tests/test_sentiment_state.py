@@ -0,0 +1,67 @@
+#######################################################################################
+### Module: test_sentiment_state
+### Date: 18 Oct 2026
+### Features:  - SentimentState updated with phase2 deltas (Changes) gives the same DailyScores
+###              as DailySums of every article in scope: new articles only, then a re-scored
+###              article, then a dropped one, state read back from file at every step
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from Modules.EntityMatrix import EntityMatrix
+from Modules.SentimentScores import SOURCES, LongEntities, DailySums, DailyScores
+from Modules.SentimentState import SentimentState
+
+SYMBOLS = ['MBBM.KL', 'CIMB.KL', 'TLMM.KL', 'MXSC.KL']
+
+## Articles Over Three Weeks With Scores (Some NaN) And Entity Tags (Some Untagged)
+def _Articles(n=60, seed=0):
+    rng      = np.random.default_rng(seed)
+    ids      = [ '{:016x}'.format(x) for x in rng.integers(1, 2**62, n) ]
+    articles = pd.DataFrame({'CreatedDate': pd.Timestamp('2020-03-02') + pd.to_timedelta(rng.integers(0, 21, n), 'D'),
+                             'Combined_WN_Sentiment': rng.integers(0, 100, n) / 100,
+                             'Combined_TB_Polarity':  rng.integers(-100, 100, n) / 100}, index=pd.Index(ids, name='Id'))
+    articles.iloc[::9, 2] = np.nan
+    counts   = rng.integers(1, 4, (n, len(SYMBOLS))) * (rng.random((n, len(SYMBOLS))) < 0.35)
+    return articles, EntityMatrix(ids, SYMBOLS, sp.csr_matrix(counts))
+
+## Daily Scores Of Every Article In Scope, From Scratch
+def _Rebuild(articles, entities):
+    return DailyScores(DailySums(LongEntities(entities, articles, list(SOURCES.values()))))
+
+## Phase2 Delta Of Articles In Scope Applied To The Stored State (As phase2 / phase3 Do)
+def _Incremental(path, articles, entities):
+    changed, removed = SentimentState(path).Changes(articles, entities)
+    rows = np.flatnonzero(changed)
+    return DailyScores(SentimentState(path).Update(articles.iloc[rows], entities.Rows(rows), removed))
+
+## Same Scores Regardless Of Symbol Dtype And Summation Order
+def _Same(got, expected):
+    got, expected = got.copy(), expected.copy()
+    for df in [got, expected]:
+        df.index = pd.MultiIndex.from_arrays([df.index.get_level_values('Symbol').astype(str), pd.DatetimeIndex(df.index.get_level_values('CreatedDate')).as_unit('ns')], names=['Symbol', 'CreatedDate'])
+    pd.testing.assert_frame_equal(got.sort_index().astype(float), expected.sort_index().astype(float))
+
+def test_update_same_as_rebuild(tmp_path):
+    path = str(tmp_path)
+    articles, entities = _Articles()
+
+    ## New Articles Only: First 40, Then The Other 20
+    first = np.arange(40)
+    _Same(_Incremental(path, articles.iloc[first], entities.Rows(first)), _Rebuild(articles.iloc[first], entities.Rows(first)))
+    _Same(_Incremental(path, articles, entities), _Rebuild(articles, entities))
+
+    ## Nothing Changed: State Returned As Is
+    changed, removed = SentimentState(path).Changes(articles, entities)
+    assert not changed.any() and len(removed) == 0
+
+    ## Re-Scored Article, And One Moved To Another Day
+    articles = articles.copy()
+    articles.iloc[3, 1]  = 0.99
+    articles.iloc[17, 0] = articles.iloc[17, 0] + pd.Timedelta(days=2)
+    _Same(_Incremental(path, articles, entities), _Rebuild(articles, entities))
+
+    ## Dropped Articles (No Longer In Scope)
+    kept = np.array([ i for i in range(len(articles)) if i not in [3, 5, 40] ])
+    _Same(_Incremental(path, articles.iloc[kept], entities.Rows(kept)), _Rebuild(articles.iloc[kept], entities.Rows(kept)))
@@ -0,0 +1,67 @@
+#######################################################################################
+### Module: test_text_index
+### Date: 18 Oct 2026
+### Features:  - Term and phrase search same as a scan of the tokenized texts, with date
+###              range, missing texts and undated articles
+###            - Same results built at once, added in segments (re-added articles replace
+###              older copies), merged, and reloaded from disk
+#######################################################################################
+
+import numpy as np
+import pandas as pd
+from Modules.TextIndex import TextIndex, Tokenize
+
+WORDS = ['bank', 'maybank', 'cimb', 'profit', 'rises', 'falls', 'café', 'naïve', 'q3', '2019', 'net_profit', 'the', 'a']
+
+## Articles Of Random Words, Break Codes And Punctuation, Some Text Or Date Missing
+def _News(n, seed, ids=None):
+    rng   = np.random.default_rng(seed)
+    texts = [ ' '.join(rng.choice(WORDS, rng.integers(0, 12))) for i in range(n) ]
+    texts = [ x.replace(' the ', '<br>The ').replace(' a ', ', A ') for x in texts ]
+    texts = [ None if i % 11 == 5 else x for i, x in enumerate(texts) ]
+    ids   = ids if ids is not None else [ '{:016x}'.format(x) for x in rng.integers(1, 2**63, n, dtype=np.uint64) ]
+    dates = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 60 * 24, n), 'h')
+    return pd.DataFrame({'Headline': texts, 'CreatedDate': [ pd.NaT if i % 13 == 7 else x for i, x in enumerate(dates) ]},
+                        index=pd.Index(ids, name='Id'))
+
+## Scan: Query Tokens Found In Sequence In The Tokens Of The Text
+def _Baseline(news, query, date_from=None, date_to=None):
+    phrase = ' ' + ' '.join(Tokenize(query)) + ' '
+    mask   = news.Headline.map(lambda x: phrase.strip() != '' and phrase in ' ' + ' '.join(Tokenize(x)) + ' ')
+    if date_from is not None: mask = mask & (news.CreatedDate >= pd.Timestamp(date_from))
+    if date_to   is not None: mask = mask & (news.CreatedDate <  pd.Timestamp(date_to) + pd.Timedelta(days=1))
+    return sorted(news.index[mask])
+
+QUERIES = WORDS + ['Bank', 'absent', 'bank profit', 'maybank rises', 'the bank', 'bank bank', 'profit, the cimb', 'café naïve', 'a a a', '', ' , ']
+
+def _Check(index, news):
+    for query in QUERIES:
+        assert sorted(index.Search(query)) == _Baseline(news, query), query
+    for query in ['bank', 'profit rises']:
+        assert sorted(index.Search(query, date_from='2020-01-20', date_to='2020-02-10')) == _Baseline(news, query, '2020-01-20', '2020-02-10')
+        assert sorted(index.Search(query, date_to='2020-01-20')) == _Baseline(news, query, date_to='2020-01-20')
+
+def test_search_same_as_scan(tmp_path, monkeypatch):
+    monkeypatch.setattr(TextIndex, '_MERGE_SEGMENTS', 4)
+    news  = _News(300, 0)
+    built = TextIndex('Headline', str(tmp_path / 'built'))
+    built.Build(news)
+    assert len(built) == len(news)
+    _Check(built, news)
+
+    ## Added In Segments, Some Articles Re-Added With New Text: Latest Copy Only
+    index = TextIndex('Headline', str(tmp_path / 'added'))
+    index.Add(news.iloc[:100])
+    index.Add(news.iloc[100:200])
+    changed = _News(30, 1, ids=list(news.index[50:80]))
+    index.Add(changed)
+    news.loc[changed.index, ['Headline', 'CreatedDate']] = changed
+    assert len(index._SEGMENTS) == 3
+    _Check(index, news.iloc[:200])
+    assert len(index) == 200
+
+    ## Fourth Segment Triggers Merge Into One, Then Reloaded
+    index.Add(news.iloc[200:])
+    assert len(index._SEGMENTS) == 1 and len(index) == len(news)
+    _Check(index, news)
+    _Check(TextIndex('Headline', str(tmp_path / 'added')), news)